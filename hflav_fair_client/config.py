@@ -1,5 +1,6 @@
 from enum import Enum
 import os
+from typing import Optional
 
 
 class EnvironmentVariables(Enum):
@@ -7,6 +8,20 @@ class EnvironmentVariables(Enum):
 
     HFLAV_CACHE_NAME = "HFLAV_CACHE_NAME"
     HFLAV_CACHE_EXPIRE_AFTER = "HFLAV_CACHE_EXPIRE_AFTER"
+    HFLAV_VERBOSE = "HFLAV_VERBOSE"
+    HFLAV_VISUALIZER_MAX_DEPTH = "HFLAV_VISUALIZER_MAX_DEPTH"
+    HFLAV_VISUALIZER_MAX_ITEMS = "HFLAV_VISUALIZER_MAX_ITEMS"
+    HFLAV_PLOT_DECIMATION_THRESHOLD = "HFLAV_PLOT_DECIMATION_THRESHOLD"
+    HFLAV_FIGURE_CACHE_DIR = "HFLAV_FIGURE_CACHE_DIR"
+    HFLAV_FIGURE_CACHE_MAX_BYTES = "HFLAV_FIGURE_CACHE_MAX_BYTES"
+    HFLAV_SCHEMA_CACHE_DIR = "HFLAV_SCHEMA_CACHE_DIR"
+    HFLAV_SCHEMA_SAMPLE_SIZE = "HFLAV_SCHEMA_SAMPLE_SIZE"
+    HFLAV_VALIDATION_WORKERS = "HFLAV_VALIDATION_WORKERS"
+    HFLAV_VALIDATION_CACHE_DIR = "HFLAV_VALIDATION_CACHE_DIR"
+    HFLAV_STORE_PATH = "HFLAV_STORE_PATH"
+    HFLAV_SOURCE = "HFLAV_SOURCE"
+    HFLAV_MIRROR_DIR = "HFLAV_MIRROR_DIR"
+    HFLAV_ZENODO_URL = "HFLAV_ZENODO_URL"
 
 
 class Config:
@@ -15,3 +30,19 @@ class Config:
     @staticmethod
     def get_variable(key: EnvironmentVariables, default: str) -> str:
         return os.getenv(key.value, default)
+
+    @staticmethod
+    def get_bool_variable(key: EnvironmentVariables, default: bool) -> bool:
+        value = os.getenv(key.value)
+        if value is None:
+            return default
+        return value.strip().lower() in ("1", "true", "yes", "on")
+
+    @staticmethod
+    def get_optional_int_variable(
+        key: EnvironmentVariables, default: Optional[int] = None
+    ) -> Optional[int]:
+        value = os.getenv(key.value)
+        if value is None or not value.strip():
+            return default
+        return int(value)
@@ -1,17 +1,24 @@
 from dependency_injector import containers, providers
 
 from hflav_fair_client.cache import init_cache
+from hflav_fair_client.config import Config, EnvironmentVariables
 from hflav_fair_client.conversors.template_schema_handler import TemplateSchemaHandler
 from hflav_fair_client.conversors.dynamic_conversor import DynamicConversor
 from hflav_fair_client.conversors.gitlab_schema_handler import GitlabSchemaHandler
+from hflav_fair_client.conversors.schema_cache import SchemaCache
+from hflav_fair_client.conversors.validation_cache import optional_validation_cache
 from hflav_fair_client.conversors.zenodo_schema_handler import ZenodoSchemaHandler
 from hflav_fair_client.filters.zenodo_query import ZenodoQuery
+from hflav_fair_client.processing.data_plotter import DataPlotter
 from hflav_fair_client.processing.data_visualizer import DataVisualizer
+from hflav_fair_client.processing.dataset_store import DatasetStore
+from hflav_fair_client.processing.figure_cache import FigureCache
 from hflav_fair_client.services.command import CommandInvoker
 from hflav_fair_client.services.service import (
     Service,
 )
 from hflav_fair_client.source.source_gitlab_client import SourceGitlabClient
+from hflav_fair_client.source.source_mirror import SourceGitlabMirror, SourceMirror
 from hflav_fair_client.source.source_zenodo_requests import SourceZenodoRequest
 
 
@@ -26,10 +33,109 @@ class Container(containers.DeclarativeContainer):
 
     _cache = providers.Resource(init_cache)
 
-    source = providers.Singleton(SourceZenodoRequest)
-    gitlab_source = providers.Singleton(SourceGitlabClient)
-    visualizer = providers.Singleton(DataVisualizer)
-    conversor = providers.Singleton(DynamicConversor, visualizer=visualizer)
+    verbose = providers.Callable(
+        Config.get_bool_variable, EnvironmentVariables.HFLAV_VERBOSE, True
+    )
+
+    source_name = providers.Callable(
+        Config.get_variable, EnvironmentVariables.HFLAV_SOURCE, "zenodo"
+    )
+    mirror_dir = providers.Callable(
+        Config.get_variable, EnvironmentVariables.HFLAV_MIRROR_DIR, "hflav_mirror"
+    )
+    zenodo_source = providers.Singleton(
+        SourceZenodoRequest,
+        base_url=providers.Callable(
+            Config.get_variable,
+            EnvironmentVariables.HFLAV_ZENODO_URL,
+            SourceZenodoRequest.DEFAULT_BASE,
+        ),
+    )
+    gitlab_client = providers.Singleton(SourceGitlabClient)
+    source = providers.Selector(
+        source_name,
+        zenodo=zenodo_source,
+        mirror=providers.Singleton(SourceMirror, mirror_dir=mirror_dir),
+    )
+    gitlab_source = providers.Selector(
+        source_name,
+        zenodo=gitlab_client,
+        mirror=providers.Singleton(SourceGitlabMirror, mirror_dir=mirror_dir),
+    )
+    visualizer = providers.Singleton(
+        DataVisualizer,
+        max_depth=providers.Callable(
+            Config.get_optional_int_variable,
+            EnvironmentVariables.HFLAV_VISUALIZER_MAX_DEPTH,
+        ),
+        max_items=providers.Callable(
+            Config.get_optional_int_variable,
+            EnvironmentVariables.HFLAV_VISUALIZER_MAX_ITEMS,
+        ),
+    )
+    plotter = providers.Singleton(
+        DataPlotter,
+        decimation_threshold=providers.Callable(
+            Config.get_optional_int_variable,
+            EnvironmentVariables.HFLAV_PLOT_DECIMATION_THRESHOLD,
+            5000,
+        ),
+    )
+    figure_cache = providers.Singleton(
+        FigureCache,
+        cache_dir=providers.Callable(
+            Config.get_variable,
+            EnvironmentVariables.HFLAV_FIGURE_CACHE_DIR,
+            "hflav_figure_cache",
+        ),
+        max_bytes=providers.Callable(
+            Config.get_optional_int_variable,
+            EnvironmentVariables.HFLAV_FIGURE_CACHE_MAX_BYTES,
+            100 * 1024**2,
+        ),
+    )
+    schema_cache = providers.Singleton(
+        SchemaCache,
+        cache_dir=providers.Callable(
+            Config.get_variable,
+            EnvironmentVariables.HFLAV_SCHEMA_CACHE_DIR,
+            "hflav_schema_cache",
+        ),
+    )
+    schema_sample_size = providers.Callable(
+        Config.get_optional_int_variable,
+        EnvironmentVariables.HFLAV_SCHEMA_SAMPLE_SIZE,
+        1000,
+    )
+    validation_workers = providers.Callable(
+        Config.get_optional_int_variable,
+        EnvironmentVariables.HFLAV_VALIDATION_WORKERS,
+        1,
+    )
+    # Opt-in: only enabled when HFLAV_VALIDATION_CACHE_DIR is set
+    validation_cache = providers.Singleton(
+        optional_validation_cache,
+        cache_dir=providers.Callable(
+            Config.get_variable, EnvironmentVariables.HFLAV_VALIDATION_CACHE_DIR, ""
+        ),
+    )
+    conversor = providers.Singleton(
+        DynamicConversor,
+        visualizer=visualizer,
+        verbose=verbose,
+        schema_cache=schema_cache,
+        schema_sample_size=schema_sample_size,
+        validation_workers=validation_workers,
+        validation_cache=validation_cache,
+    )
+    store = providers.Singleton(
+        DatasetStore,
+        db_path=providers.Callable(
+            Config.get_variable,
+            EnvironmentVariables.HFLAV_STORE_PATH,
+            "hflav_store.sqlite",
+        ),
+    )
     command_invoker = providers.Singleton(CommandInvoker)
     base_query = providers.Object(ZenodoQuery)
 
@@ -65,4 +171,8 @@ class Container(containers.DeclarativeContainer):
         conversor=conversor,
         command_invoker=command_invoker,
         handler_schema_chain=handler_schema_chain,
+        verbose=verbose,
+        plotter=plotter,
+        figure_cache=figure_cache,
+        store=store,
     )
@@ -0,0 +1,186 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.context import BaseContext
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import jsonschema
+
+from hflav_fair_client.conversors.conversor_interface import ConversorInterface
+from hflav_fair_client.conversors.snapshot import decode_tree, encode_tree
+from hflav_fair_client.exceptions.conversor_exceptions import ConversorException
+from hflav_fair_client.logger import get_logger
+
+logger = get_logger(__name__)
+
+# (path, data or None, error message or None, CPU seconds spent loading it), where
+# the data is encoded with `encode_tree` when it comes from a worker process
+_LoadedFile = Tuple[str, Any, Optional[str], float]
+
+# Per worker process state, set once by the pool initializer
+_worker_conversor: Optional[ConversorInterface] = None
+_worker_schema_path: Optional[str] = None
+_worker_validate = True
+
+
+def _init_worker(
+    conversor: ConversorInterface, schema_path: Optional[str], validate: bool
+) -> None:
+    global _worker_conversor, _worker_schema_path, _worker_validate
+    _worker_conversor = conversor
+    _worker_schema_path = schema_path
+    _worker_validate = validate
+
+
+def _load_model(
+    conversor: ConversorInterface,
+    schema_path: Optional[str],
+    validate: bool,
+    path: str,
+) -> _LoadedFile:
+    start_time = time.process_time()
+    try:
+        model = conversor.generate_instance_from_local_path(
+            data_path=path, schema_path=schema_path, validate=validate
+        )
+    except (
+        OSError,
+        ValueError,
+        ConversorException,
+        jsonschema.SchemaError,
+    ) as e:
+        details = getattr(e, "details", None)
+        message = f"{type(e).__name__}: {e}" + (f"\n{details}" if details else "")
+        return path, None, message, time.process_time() - start_time
+    return path, model, None, time.process_time() - start_time
+
+
+def _load_file(path: str) -> _LoadedFile:
+    path, model, error, seconds = _load_model(
+        _worker_conversor, _worker_schema_path, _worker_validate, path
+    )
+    if model is not None:
+        model = encode_tree(model)
+    return path, model, error, seconds
+
+
+class BulkLoadResult:
+    """
+    Data loaded from many local files.
+
+    Attributes:
+        data (Dict[str, SimpleNamespace]): Loaded data by path, in the given order.
+        errors (Dict[str, str]): Error message by path of the files that failed.
+        elapsed_seconds (float): Wall time spent loading every file.
+        serial_seconds (float): Sum of the CPU time spent loading each file, i.e.
+                                about the time a serial load would have taken.
+    """
+
+    def __init__(
+        self,
+        data: Dict[str, SimpleNamespace],
+        errors: Dict[str, str],
+        elapsed_seconds: float,
+        serial_seconds: float,
+    ):
+        self.data = data
+        self.errors = errors
+        self.elapsed_seconds = elapsed_seconds
+        self.serial_seconds = serial_seconds
+
+    @property
+    def speedup(self) -> float:
+        """Speedup of the load against loading the files one after the other."""
+        if self.elapsed_seconds <= 0:
+            return 1.0
+        return self.serial_seconds / self.elapsed_seconds
+
+
+class BulkLoader:
+    """
+    Load many local HFLAV files, distributing them over a process pool.
+
+    Parsing and validating JSON is CPU-bound, so files are loaded by separate
+    processes, each one using a quiet copy of the given conversor (see
+    `ConversorInterface.quiet`), which must be picklable unless processes are
+    forked. Each worker sends its data back in the compact form of the snapshots
+    (see `encode_tree`): numeric arrays travel as raw NumPy blocks instead of
+    pickled numbers, and the pool only has to move two ``bytes`` objects.
+
+    A file that cannot be loaded does not stop the others: its error is reported in
+    the result.
+
+    Attributes:
+        conversor (ConversorInterface): Conversor used to load every file.
+        max_workers (Optional[int]): Number of worker processes (CPU count by default).
+                                     With 1, files are loaded in the calling process.
+        mp_context (Optional[BaseContext]): Multiprocessing context of the workers,
+                                            the default start method if None.
+    """
+
+    def __init__(
+        self,
+        conversor: ConversorInterface,
+        max_workers: Optional[int] = None,
+        mp_context: Optional[BaseContext] = None,
+    ):
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be a positive integer")
+        self.conversor = conversor
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.mp_context = mp_context
+
+    def load(
+        self,
+        file_paths: Sequence[str],
+        schema_path: Optional[str] = None,
+        validate: bool = True,
+    ) -> BulkLoadResult:
+        """
+        Load every file of `file_paths`, validated with the schema of `schema_path` or
+        with an inferred one, as `ConversorInterface.generate_instance_from_local_path`.
+        """
+        start_time = time.perf_counter()
+        loaded = self._load(list(file_paths), schema_path, validate)
+
+        data: Dict[str, SimpleNamespace] = {}
+        errors: Dict[str, str] = {}
+        for path, model, error, _ in loaded:
+            if error is not None:
+                errors[path] = error
+                logger.error(f"Could not load {path}: {error}")
+            else:
+                data[path] = model
+        elapsed = time.perf_counter() - start_time
+
+        result = BulkLoadResult(
+            data, errors, elapsed, sum(seconds for *_, seconds in loaded)
+        )
+        logger.info(
+            f"Loaded {len(data)} of {len(loaded)} files in {elapsed:.2f}s "
+            f"(x{result.speedup:.1f} against a serial load of "
+            f"{result.serial_seconds:.2f}s)"
+        )
+        return result
+
+    def _load(
+        self, file_paths: List[str], schema_path: Optional[str], validate: bool
+    ) -> List[_LoadedFile]:
+        workers = min(self.max_workers, len(file_paths))
+        if workers <= 1:
+            return [
+                _load_model(self.conversor, schema_path, validate, path)
+                for path in file_paths
+            ]
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=self.mp_context,
+            initializer=_init_worker,
+            initargs=(self.conversor.quiet(), schema_path, validate),
+        ) as executor:
+            return [
+                (path, None if model is None else decode_tree(*model), error, seconds)
+                for path, model, error, seconds in executor.map(_load_file, file_paths)
+            ]
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from types import SimpleNamespace
+from typing import Optional
 
 
 class ConversorInterface(ABC):
@@ -10,8 +11,16 @@ class ConversorInterface(ABC):
     """
 
     @abstractmethod
-    def generate_json_schema(self, file_path: str) -> dict:
-        """Generate a JSON schema from a data file."""
+    def generate_json_schema(
+        self, file_path: str, sample_size: Optional[int] = None
+    ) -> dict:
+        """Generate a JSON schema from a data file.
+
+        Args:
+                file_path: path to the JSON file
+                sample_size: if given, the schema is inferred from at most this number
+                        of items of every array instead of from all of them
+        """
         pass
 
     @abstractmethod
@@ -51,3 +60,10 @@ class ConversorInterface(ABC):
             StructureException: If validation is enabled and the data structure does not match the schema format.
         """
         pass
+
+    def quiet(self) -> "ConversorInterface":
+        """Return a conversor that loads data like this one without printing it.
+
+        Conversors that never print return themselves.
+        """
+        return self
@@ -1,9 +1,15 @@
+import copy
 import json
 from types import SimpleNamespace
+from typing import Any, List, Optional, Tuple
 
 from genson import SchemaBuilder
 import jsonschema
 from hflav_fair_client.conversors.conversor_interface import ConversorInterface
+from hflav_fair_client.conversors.parallel_validator import ParallelGroupsValidator
+from hflav_fair_client.conversors.schema_cache import SchemaCache
+from hflav_fair_client.conversors.schema_sampling import sample_arrays
+from hflav_fair_client.conversors.validation_cache import ValidationCache
 from hflav_fair_client.exceptions.conversor_exceptions import StructureException
 from hflav_fair_client.processing.data_visualizer import DataVisualizer
 from hflav_fair_client.logger import get_logger
@@ -16,9 +22,55 @@ logger = get_logger(__name__)
 
 
 class DynamicConversor(ConversorInterface):
+    """
+    Conversor generating namespaces from JSON data files, validated with JSON schemas.
+
+    When `verbose` is disabled the schemas and loaded data are not printed, which
+    avoids converting and pretty-printing the whole document on every load.
+
+    Generated schemas are memoized in `schema_cache` by the hash of the file they are
+    generated from, so inferring the schema of a template is only done once per version.
+
+    When a data file is loaded with validation but without a schema, its schema is
+    inferred from a sample of every array (`schema_sample_size` items, see
+    `sample_arrays`) and the data is not validated against it, since a schema inferred
+    from the data itself cannot reject it.
+
+    With `validation_workers` greater than 1, the top-level ``groups`` of the data are
+    validated in chunks by that number of processes, see `ParallelGroupsValidator`.
+
+    With a `validation_cache`, the groups that already passed validation under the
+    same schema are not validated again, so reloading a slightly modified file only
+    validates what changed, see `ValidationCache`.
+    """
+
+    # Maximum number of errors included in the details of a StructureException
+    MAX_REPORTED_ERRORS = 20
+
+    # Bump it when the schema generation changes, to discard the cached schemas
+    SCHEMA_GENERATION_VERSION = "1"
+
     @inject
-    def __init__(self, visualizer: DataVisualizer = Provide["visualizer"]):
+    def __init__(
+        self,
+        visualizer: DataVisualizer = Provide["visualizer"],
+        verbose: bool = Provide["verbose"],
+        schema_cache: Optional[SchemaCache] = Provide["schema_cache"],
+        schema_sample_size: Optional[int] = Provide["schema_sample_size"],
+        validation_workers: int = Provide["validation_workers"],
+        validation_cache: Optional[ValidationCache] = Provide["validation_cache"],
+    ):
         self._visualizer = visualizer
+        self._verbose = verbose
+        self._schema_cache = schema_cache
+        self._schema_sample_size = schema_sample_size
+        self._validation_workers = validation_workers
+        self._validation_cache = validation_cache
+
+    def quiet(self) -> "DynamicConversor":
+        quiet = copy.copy(self)
+        quiet._verbose = False
+        return quiet
 
     def _avoid_extra_fields(self, obj):
         if isinstance(obj, dict):
@@ -31,39 +83,90 @@ class DynamicConversor(ConversorInterface):
                 self._avoid_extra_fields(item)
 
     def _validate_json_with_schema(self, schema: dict, json_data: dict):
+        workers = self._validation_workers
+        if isinstance(self._validation_cache, ValidationCache):
+            max_workers = workers if isinstance(workers, int) else 1
+            self._raise_for_errors(
+                self._validation_cache.validate(schema, json_data, max_workers)
+            )
+            return
+        if isinstance(workers, int) and workers > 1:
+            validator = ParallelGroupsValidator(schema, workers)
+            if validator.can_split(json_data):
+                self._raise_for_errors(validator.validate(json_data))
+                return
         try:
             jsonschema.validate(instance=json_data, schema=schema)
         except jsonschema.ValidationError as e:
             raise StructureException(details=str(e))
 
+    def _raise_for_errors(self, errors: List[Tuple[str, str]]) -> None:
+        if not errors:
+            return
+        lines = [
+            f"{pointer or '/'}: {message}"
+            for pointer, message in errors[: self.MAX_REPORTED_ERRORS]
+        ]
+        if len(errors) > self.MAX_REPORTED_ERRORS:
+            lines.append(
+                f"... and {len(errors) - self.MAX_REPORTED_ERRORS} more errors"
+            )
+        raise StructureException(
+            details=f"{len(errors)} validation errors:\n" + "\n".join(lines),
+            errors=errors,
+        )
+
     def _load_model_from_json(self, data_dict: dict) -> SimpleNamespace:
         model = dict_to_namespace(data_dict)
+        if not self._verbose:
+            logger.info("Data loaded successfully.")
+            return model
         logger.info("Data loaded successfully. This is the content:")
         self._visualizer.print_json_data(model)
         return model
 
-    def generate_json_schema(self, file_path: str) -> dict:
+    def _schema_from_content(
+        self, content: str, sample_size: Optional[int]
+    ) -> Tuple[dict, Optional[Any]]:
+        """Return the schema of `content` and its parsed data (None if it was cached)."""
+        key = None
+        if self._schema_cache is not None:
+            key = self._schema_cache.key_for(
+                content, f"{self.SCHEMA_GENERATION_VERSION}/sample={sample_size}"
+            )
+            schema = self._schema_cache.get(key)
+            if schema is not None:
+                logger.info("Using cached schema")
+                return schema, None
+
+        data = json.loads(content)
         builder = SchemaBuilder()
-
-        with open(file_path, "r", encoding="utf-8") as file:
-            data = json.load(file)
-
-        builder.add_object(data)
+        builder.add_object(sample_arrays(data, sample_size) if sample_size else data)
         schema = builder.to_schema()
 
         schema["$schema"] = "http://json-schema.org/draft-07/schema#"
 
         self._avoid_extra_fields(schema)
 
-        return schema
+        if key is not None:
+            self._schema_cache.put(key, schema)
+        return schema, data
+
+    def generate_json_schema(
+        self, file_path: str, sample_size: Optional[int] = None
+    ) -> dict:
+        with open(file_path, "r", encoding="utf-8") as file:
+            content = file.read()
+        return self._schema_from_content(content, sample_size)[0]
 
     def generate_instance_from_schema_and_data(
         self, schema: dict, data_path: str
     ) -> SimpleNamespace:
         if not schema or not data_path:
             raise ValueError("Schema and data path must be provided.")
-        logger.info("JSON Schema:")
-        self._visualizer.print_schema(schema)
+        if self._verbose:
+            logger.info("JSON Schema:")
+            self._visualizer.print_schema(schema)
 
         with open(data_path, "r", encoding="utf-8") as file:
             data_dict = json.load(file)
@@ -85,12 +188,28 @@ class DynamicConversor(ConversorInterface):
             if schema_path:
                 with open(schema_path, "r", encoding="utf-8") as schema_file:
                     schema = json.load(schema_file)
-            else:
-                schema = self.generate_json_schema(data_path)
-
-            return self.generate_instance_from_schema_and_data(schema, data_path)
+                return self.generate_instance_from_schema_and_data(schema, data_path)
+            return self._generate_instance_inferring_schema(data_path)
 
         with open(data_path, "r", encoding="utf-8") as data_file:
             data_dict = json.load(data_file)
 
         return self._load_model_from_json(data_dict)
+
+    def _generate_instance_inferring_schema(self, data_path: str) -> SimpleNamespace:
+        with open(data_path, "r", encoding="utf-8") as data_file:
+            content = data_file.read()
+
+        data_dict = None
+        # The inferred schema is only printed, so it is not inferred when not verbose
+        if self._verbose:
+            schema, data_dict = self._schema_from_content(
+                content, self._schema_sample_size
+            )
+            logger.info("JSON Schema:")
+            self._visualizer.print_schema(schema)
+        logger.info("Skipping validation: the schema was inferred from the data itself")
+
+        if data_dict is None:
+            data_dict = json.loads(content)
+        return self._load_model_from_json(data_dict)
@@ -0,0 +1,165 @@
+import math
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+from jsonschema import validators
+
+# (JSON pointer of the invalid value, error message)
+ValidationErrorEntry = Tuple[str, str]
+
+# Keywords of the array schema that are evaluated item by item in the workers
+_ITEM_KEYWORDS = ("items", "additionalItems", "prefixItems")
+
+# Per worker process state, set once by the pool initializer
+_worker_validator = None
+_worker_items: Optional[Sequence[Any]] = None
+_worker_prefix = ""
+
+
+def json_pointer(path: Iterable[Any]) -> str:
+    """Build a RFC 6901 JSON pointer from a sequence of keys and indexes."""
+    return "".join(
+        "/" + str(part).replace("~", "~0").replace("/", "~1") for part in path
+    )
+
+
+def _init_worker(item_schema: dict, items: Sequence[Any], prefix: str) -> None:
+    global _worker_validator, _worker_items, _worker_prefix
+    _worker_validator = validators.validator_for(item_schema)(item_schema)
+    _worker_items = items
+    _worker_prefix = prefix
+
+
+def _item_errors(
+    validator, items: Sequence[Any], prefix: str, indexes: Sequence[int]
+) -> List[ValidationErrorEntry]:
+    errors = []
+    for index in indexes:
+        for error in validator.iter_errors(items[index]):
+            errors.append(
+                (
+                    f"{prefix}/{index}{json_pointer(error.absolute_path)}",
+                    error.message,
+                )
+            )
+    return errors
+
+
+def _validate_indexes(indexes: Sequence[int]) -> List[ValidationErrorEntry]:
+    return _item_errors(_worker_validator, _worker_items, _worker_prefix, indexes)
+
+
+class ParallelGroupsValidator:
+    """
+    Validate a document splitting one of its top-level arrays (``groups`` by default)
+    into chunks validated by a pool of processes.
+
+    The items of the array are independent subtrees validated against the same
+    ``items`` schema, so each worker compiles the validator once and validates ranges
+    of items. The rest of the document, including the array-level keywords such as
+    ``minItems``, is validated in the calling process. The items are handed to the
+    workers when they start (inherited without copying when processes are forked),
+    and tasks only carry item indexes.
+
+    Every error is reported, with a JSON pointer to the invalid value relative to the
+    document root, in document order.
+
+    Attributes:
+        schema (dict): Schema of the whole document.
+        max_workers (int): Number of worker processes.
+        array_name (str): Name of the top-level array to split.
+    """
+
+    def __init__(self, schema: dict, max_workers: int, array_name: str = "groups"):
+        if max_workers < 1:
+            raise ValueError("max_workers must be a positive integer")
+        self.schema = schema
+        self.max_workers = max_workers
+        self.array_name = array_name
+
+    def can_split(self, data: Any) -> bool:
+        """Return whether `data` has the array and the schema a single schema for its items."""
+        array_schema = self.schema.get("properties", {}).get(self.array_name)
+        return (
+            isinstance(data, dict)
+            and isinstance(data.get(self.array_name), list)
+            and isinstance(array_schema, dict)
+            and isinstance(array_schema.get("items"), dict)
+            and "prefixItems" not in array_schema
+        )
+
+    def _root_schema(self) -> dict:
+        array_schema = self.schema["properties"][self.array_name]
+        root_schema = dict(self.schema)
+        root_schema["properties"] = dict(self.schema["properties"])
+        root_schema["properties"][self.array_name] = {
+            key: value
+            for key, value in array_schema.items()
+            if key not in _ITEM_KEYWORDS
+        }
+        return root_schema
+
+    def _item_schema(self) -> dict:
+        # References inside the items schema are resolved against the document root,
+        # so the definitions of the root schema are carried along.
+        item_schema = {
+            key: self.schema[key]
+            for key in ("$schema", "definitions", "$defs")
+            if key in self.schema
+        }
+        item_schema.setdefault("$defs", {})
+        item_schema["$defs"] = dict(
+            item_schema["$defs"],
+            __item__=self.schema["properties"][self.array_name]["items"],
+        )
+        item_schema["$ref"] = "#/$defs/__item__"
+        return item_schema
+
+    def validate(
+        self, data: dict, indexes: Optional[Sequence[int]] = None
+    ) -> List[ValidationErrorEntry]:
+        """
+        Validate `data`, returning every error found (an empty list if it is valid).
+
+        If `indexes` is given only those items of the array are validated, together
+        with the rest of the document.
+
+        Raises:
+            ValueError: If the data cannot be split, see `can_split`.
+            jsonschema.SchemaError: If the schema itself is invalid.
+        """
+        if not self.can_split(data):
+            raise ValueError(f"The data has no '{self.array_name}' array to split")
+        validator_class = validators.validator_for(self.schema)
+        validator_class.check_schema(self.schema)
+
+        root_validator = validator_class(self._root_schema())
+        errors = [
+            (json_pointer(error.absolute_path), error.message)
+            for error in root_validator.iter_errors(data)
+        ]
+
+        items = data[self.array_name]
+        indexes = list(range(len(items))) if indexes is None else sorted(indexes)
+        prefix = json_pointer([self.array_name])
+        workers = min(self.max_workers, len(indexes))
+        if workers <= 1:
+            # Validated in place, without the worker state, which would keep the
+            # items alive after returning
+            item_schema = self._item_schema()
+            item_validator = validators.validator_for(item_schema)(item_schema)
+            return errors + _item_errors(item_validator, items, prefix, indexes)
+
+        chunk_size = math.ceil(len(indexes) / (workers * 4))
+        chunks = [
+            indexes[start : start + chunk_size]
+            for start in range(0, len(indexes), chunk_size)
+        ]
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self._item_schema(), items, prefix),
+        ) as executor:
+            for chunk_errors in executor.map(_validate_indexes, chunks):
+                errors.extend(chunk_errors)
+        return errors
@@ -0,0 +1,109 @@
+import copy
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from hflav_fair_client.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class SchemaCache:
+    """
+    Memo of generated JSON schemas, kept in memory and on disk.
+
+    Schemas are keyed by a hash of the content they were generated from (plus the
+    generation settings), so a template is only analysed once per version whatever
+    the number of data files loaded with it, also across processes.
+
+    Attributes:
+        cache_dir (Optional[str]): Directory where the schemas are stored. ``None``
+                                   keeps them only in memory.
+        max_memory_entries (int): Number of schemas kept in memory.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = "hflav_schema_cache",
+        max_memory_entries: int = 32,
+    ):
+        self.cache_dir = cache_dir
+        self.max_memory_entries = max_memory_entries
+        self._memory: "OrderedDict[str, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        # Locks cannot be pickled, e.g. to send the cache to a spawned process
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(content: str, settings: str = "") -> str:
+        """Return the cache key of a schema generated from `content` with `settings`."""
+        hasher = hashlib.sha256(settings.encode("utf-8"))
+        hasher.update(b"\0")
+        hasher.update(content.encode("utf-8"))
+        return hasher.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.schema.json")
+
+    def _remember(self, key: str, schema: dict) -> None:
+        self._memory[key] = schema
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return a copy of the cached schema, or None if it is not cached."""
+        with self._lock:
+            schema = self._memory.get(key)
+            if schema is not None:
+                self._memory.move_to_end(key)
+                return copy.deepcopy(schema)
+
+        if self.cache_dir is None or not os.path.isfile(self._path(key)):
+            return None
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as file:
+                schema = json.load(file)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cached schema {key}: {e}")
+            return None
+        with self._lock:
+            self._remember(key, schema)
+        return copy.deepcopy(schema)
+
+    def put(self, key: str, schema: dict) -> None:
+        """Store a copy of `schema` in memory and on disk."""
+        with self._lock:
+            self._remember(key, copy.deepcopy(schema))
+
+        if self.cache_dir is None:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temporary_path = f"{self._path(key)}.{os.getpid()}.tmp"
+            with open(temporary_path, "w", encoding="utf-8") as file:
+                json.dump(schema, file)
+            os.replace(temporary_path, self._path(key))
+        except OSError as e:
+            logger.warning(f"Could not store schema {key} on disk: {e}")
+
+    def clear(self) -> None:
+        """Forget every cached schema, in memory and on disk."""
+        with self._lock:
+            self._memory.clear()
+        if self.cache_dir is None or not os.path.isdir(self.cache_dir):
+            return
+        for filename in os.listdir(self.cache_dir):
+            if filename.endswith(".schema.json"):
+                os.remove(os.path.join(self.cache_dir, filename))
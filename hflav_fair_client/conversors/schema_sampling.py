@@ -0,0 +1,54 @@
+"""
+Sampling of big JSON documents before inferring their schema.
+
+Inferring a schema visits every node, but the items of a long array usually share
+the same structure. `sample_arrays` keeps, for every array longer than the sample
+size, its first items plus a reservoir sample of the remaining ones, so the schema
+is inferred from a bounded number of items per array while still seeing items from
+the whole array.
+
+The sample is deterministic for a given `seed`, so the same document always
+produces the same schema.
+"""
+
+import random
+from typing import Any, Iterable, List
+
+
+def reservoir_sample(items: Iterable[Any], size: int, rng: random.Random) -> List[Any]:
+    """Uniformly sample `size` items of an iterable in a single pass (Algorithm R)."""
+    reservoir: List[Any] = []
+    for seen, item in enumerate(items):
+        if seen < size:
+            reservoir.append(item)
+        else:
+            position = rng.randint(0, seen)
+            if position < size:
+                reservoir[position] = item
+    return reservoir
+
+
+def sample_arrays(data: Any, sample_size: int, seed: int = 0) -> Any:
+    """
+    Return a copy of `data` where every array holds at most `sample_size` items.
+
+    Longer arrays keep their first ``sample_size // 2`` items followed by a reservoir
+    sample of the rest. Objects are copied, scalars are shared.
+    """
+    if sample_size < 1:
+        raise ValueError("sample_size must be a positive integer")
+    head_size = sample_size // 2
+    rng = random.Random(seed)
+
+    def sample(node: Any) -> Any:
+        if isinstance(node, dict):
+            return {key: sample(value) for key, value in node.items()}
+        if isinstance(node, list):
+            if len(node) > sample_size:
+                node = node[:head_size] + reservoir_sample(
+                    node[head_size:], sample_size - head_size, rng
+                )
+            return [sample(item) for item in node]
+        return node
+
+    return sample(data)
@@ -0,0 +1,269 @@
+"""
+Binary snapshots of loaded HFLAV data.
+
+A snapshot stores a loaded (and validated) data object so that later loads skip
+parsing and validating its JSON source. The file holds:
+
+- The magic bytes ``HFLAVSNP`` and a JSON header with the format version, the
+  checksum of the source file and the hash of the schema it was validated with.
+- The tree of namespaces, lists and scalars, pickled.
+- Numeric arrays (lists of floats or integers, and 2D lists of them such as points
+  and correlation matrices) stored out of the pickle as raw NumPy blocks.
+
+Snapshots are memory-mapped when read: the blocks are turned back into lists
+straight from the mapped file, so the loaded object has the same API as one
+loaded from JSON. Only namespaces are accepted when unpickling, so a tampered
+snapshot cannot run arbitrary code.
+"""
+
+import hashlib
+import io
+import json
+import mmap
+import os
+import pickle
+import struct
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from hflav_fair_client.exceptions.conversor_exceptions import SnapshotException
+
+MAGIC = b"HFLAVSNP"
+FORMAT_VERSION = 1
+
+# Numeric lists with fewer items are left in the pickle
+MIN_BLOCK_ITEMS = 64
+
+_INT64_RANGE = (-(2**63), 2**63 - 1)
+_BLOCK_ALIGNMENT = 8
+
+# Errors raised when unpickling a corrupt tree
+_CORRUPT_TREE_ERRORS = (
+    pickle.UnpicklingError,
+    EOFError,
+    ValueError,
+    TypeError,
+    KeyError,
+    IndexError,
+    AttributeError,
+    OverflowError,
+)
+
+
+def file_checksum(path: str) -> str:
+    """Return the SHA-256 checksum of a file."""
+    hasher = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _dtype_of(items: List[Any]) -> Optional[str]:
+    kinds = set(map(type, items))
+    if kinds == {float}:
+        return "<f8"
+    if (
+        kinds == {int}
+        and _INT64_RANGE[0] <= min(items) <= max(items) <= _INT64_RANGE[1]
+    ):
+        return "<i8"
+    return None
+
+
+def _numeric_array(value: List[Any]) -> Optional[np.ndarray]:
+    if not value:
+        return None
+    if type(value[0]) is list:
+        width = len(value[0])
+        if width == 0 or any(
+            type(row) is not list or len(row) != width for row in value
+        ):
+            return None
+        items = [item for row in value for item in row]
+        shape: Tuple[int, ...] = (len(value), width)
+    else:
+        items, shape = value, (len(value),)
+    if len(items) < MIN_BLOCK_ITEMS:
+        return None
+    dtype = _dtype_of(items)
+    if dtype is None:
+        return None
+    return np.array(items, dtype=dtype).reshape(shape)
+
+
+class _SnapshotPickler(pickle.Pickler):
+    def __init__(self, file: io.BytesIO):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.blocks: List[bytes] = []
+        self.blocks_size = 0
+
+    def persistent_id(self, obj: Any) -> Optional[Tuple[str, Tuple[int, ...], int]]:
+        if type(obj) is not list:
+            return None
+        array = _numeric_array(obj)
+        if array is None:
+            return None
+        offset = self.blocks_size
+        content = array.tobytes()
+        padding = -len(content) % _BLOCK_ALIGNMENT
+        self.blocks.append(content + b"\0" * padding)
+        self.blocks_size += len(content) + padding
+        return array.dtype.str, array.shape, offset
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    def __init__(self, file: io.BytesIO, blocks: Union[bytes, memoryview]):
+        super().__init__(file)
+        self._blocks = blocks
+
+    def persistent_load(self, pid: Tuple[str, Tuple[int, ...], int]) -> List[Any]:
+        try:
+            dtype, shape, offset = pid
+            count = int(np.prod(shape))
+            return (
+                np.frombuffer(self._blocks, dtype=dtype, count=count, offset=offset)
+                .reshape(shape)
+                .tolist()
+            )
+        except (TypeError, ValueError) as e:
+            raise pickle.UnpicklingError(f"Invalid block reference {pid!r}: {e}")
+
+    def find_class(self, module: str, name: str) -> Any:
+        if (module, name) == ("types", "SimpleNamespace"):
+            return SimpleNamespace
+        raise pickle.UnpicklingError(f"Forbidden type in snapshot: {module}.{name}")
+
+
+def encode_tree(data: Any) -> Tuple[bytes, bytes]:
+    """
+    Encode `data` as the body of a snapshot: its pickled tree, and its numeric
+    arrays as raw NumPy blocks, concatenated.
+    """
+    body = io.BytesIO()
+    pickler = _SnapshotPickler(body)
+    pickler.dump(data)
+    return body.getvalue(), b"".join(pickler.blocks)
+
+
+def decode_tree(tree: bytes, blocks: Union[bytes, memoryview]) -> Any:
+    """
+    Decode the data encoded by `encode_tree`.
+
+    Raises:
+        pickle.UnpicklingError: If the tree holds other objects than namespaces.
+    """
+    return _SnapshotUnpickler(io.BytesIO(tree), blocks).load()
+
+
+def write_snapshot(
+    path: str, data: Any, source_checksum: str, schema_hash: str
+) -> Dict[str, Any]:
+    """
+    Write `data` to a snapshot at `path`, tagged with the checksum of its source and
+    the hash of the schema it was validated with. Returns the header.
+    """
+    tree, blocks = encode_tree(data)
+    header = {
+        "format_version": FORMAT_VERSION,
+        "source_checksum": source_checksum,
+        "schema_hash": schema_hash,
+        "tree_bytes": len(tree),
+        "blocks_bytes": len(blocks),
+    }
+    encoded_header = json.dumps(header).encode("utf-8")
+    prefix_size = len(MAGIC) + 4 + len(encoded_header)
+    padding = -(prefix_size + len(tree)) % _BLOCK_ALIGNMENT
+
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    with open(temporary_path, "wb") as file:
+        file.write(MAGIC)
+        file.write(struct.pack("<I", len(encoded_header)))
+        file.write(encoded_header)
+        file.write(tree)
+        file.write(b"\0" * padding)
+        file.write(blocks)
+    os.replace(temporary_path, path)
+    return header
+
+
+@contextmanager
+def _mapped(path: str) -> Iterator[mmap.mmap]:
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size < len(MAGIC) + 4:
+            raise SnapshotException(details=f"{path} is not a snapshot")
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def _read_header(mapped: mmap.mmap, path: str) -> Tuple[Dict[str, Any], int]:
+    if mapped[: len(MAGIC)] != MAGIC:
+        raise SnapshotException(details=f"{path} is not a snapshot")
+    (header_size,) = struct.unpack_from("<I", mapped, len(MAGIC))
+    start = len(MAGIC) + 4
+    try:
+        header = json.loads(bytes(mapped[start : start + header_size]))
+    except ValueError as e:
+        raise SnapshotException(details=f"Invalid snapshot header in {path}: {e}")
+    if not isinstance(header, dict):
+        raise SnapshotException(details=f"Invalid snapshot header in {path}")
+    if header.get("format_version") != FORMAT_VERSION:
+        raise SnapshotException(
+            details=f"Unsupported snapshot format {header.get('format_version')}"
+        )
+    for key in ("tree_bytes", "blocks_bytes"):
+        if type(header.get(key)) is not int or header[key] < 0:
+            raise SnapshotException(
+                details=f"Invalid snapshot header in {path}: bad {key}"
+            )
+    return header, start + header_size
+
+
+def read_snapshot_header(path: str) -> Dict[str, Any]:
+    """Return the header of the snapshot at `path`."""
+    with _mapped(path) as mapped:
+        return _read_header(mapped, path)[0]
+
+
+def read_snapshot(
+    path: str,
+    source_checksum: Optional[str] = None,
+    schema_hash: Optional[str] = None,
+) -> Any:
+    """
+    Read the data stored in the snapshot at `path`.
+
+    If `source_checksum` or `schema_hash` are given they must match the ones the
+    snapshot was tagged with.
+
+    Raises:
+        SnapshotException: If the file is not a valid snapshot or its tags do not match.
+        OSError: If the file cannot be read.
+    """
+    with _mapped(path) as mapped:
+        header, tree_start = _read_header(mapped, path)
+        for key, expected in (
+            ("source_checksum", source_checksum),
+            ("schema_hash", schema_hash),
+        ):
+            if expected is not None and header.get(key) != expected:
+                raise SnapshotException(
+                    details=f"The {key} of {path} does not match, it is outdated"
+                )
+
+        tree_end = tree_start + header["tree_bytes"]
+        blocks_start = tree_end + (-tree_end % _BLOCK_ALIGNMENT)
+        if blocks_start + header["blocks_bytes"] > len(mapped):
+            raise SnapshotException(details=f"{path} is truncated")
+        blocks = memoryview(mapped)[
+            blocks_start : blocks_start + header["blocks_bytes"]
+        ]
+        try:
+            return decode_tree(mapped[tree_start:tree_end], blocks)
+        except _CORRUPT_TREE_ERRORS as e:
+            raise SnapshotException(details=f"Corrupt snapshot {path}: {e}")
+        finally:
+            blocks.release()
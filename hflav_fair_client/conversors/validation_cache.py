@@ -0,0 +1,187 @@
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional, Set
+
+from jsonschema import validators
+
+from hflav_fair_client.conversors.parallel_validator import (
+    ParallelGroupsValidator,
+    ValidationErrorEntry,
+    json_pointer,
+)
+from hflav_fair_client.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _hash(kind: str, *parts: bytes) -> str:
+    hasher = hashlib.sha256(kind.encode("utf-8"))
+    for part in parts:
+        hasher.update(b"\0")
+        hasher.update(part)
+    return hasher.hexdigest()
+
+
+def _canonical(value: Any) -> bytes:
+    return json.dumps(
+        value, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+def schema_fingerprint(schema: dict) -> str:
+    """Hash a schema independently of the order of its keys."""
+    return _hash("schema", _canonical(schema))
+
+
+class ValidationCache:
+    """
+    Memo of the parts of documents that already passed validation under a schema.
+
+    Every item of the top-level ``groups`` array is hashed, and the document hash is
+    built Merkle-style from the rest of the document plus the hashes of its groups.
+    Hashes that passed are remembered per schema fingerprint, so validating a
+    document already seen is skipped altogether, and validating a slightly modified
+    one only validates the groups that changed (the rest of the document, which
+    includes array-level keywords such as ``minItems``, is always validated).
+
+    Documents without ``groups``, or whose schema does not describe their items with
+    a single schema, are memoized as a whole.
+
+    Passed hashes are appended to ``<fingerprint>.hashes`` files inside `cache_dir`,
+    so they are shared across processes.
+
+    Attributes:
+        cache_dir (Optional[str]): Directory where the hashes are stored. ``None``
+                                   keeps them only in memory.
+        array_name (str): Name of the top-level array whose items are hashed.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = "hflav_validation_cache",
+        array_name: str = "groups",
+    ):
+        self.cache_dir = cache_dir
+        self.array_name = array_name
+        self._passed: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        # Locks cannot be pickled, e.g. to send the cache to a spawned process
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _path(self, fingerprint: str) -> str:
+        return os.path.join(self.cache_dir, f"{fingerprint}.hashes")
+
+    def _passed_hashes(self, fingerprint: str) -> Set[str]:
+        with self._lock:
+            if fingerprint in self._passed:
+                return self._passed[fingerprint]
+            passed: Set[str] = set()
+            if self.cache_dir is not None and os.path.isfile(self._path(fingerprint)):
+                try:
+                    with open(self._path(fingerprint), "r", encoding="utf-8") as file:
+                        passed.update(line.strip() for line in file if line.strip())
+                except OSError as e:
+                    logger.warning(f"Ignoring unreadable validation cache: {e}")
+            self._passed[fingerprint] = passed
+            return passed
+
+    def _remember(self, fingerprint: str, hashes: List[str]) -> None:
+        passed = self._passed_hashes(fingerprint)
+        with self._lock:
+            new_hashes = [value for value in hashes if value not in passed]
+            passed.update(new_hashes)
+        if not new_hashes or self.cache_dir is None:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self._path(fingerprint), "a", encoding="utf-8") as file:
+                file.write("".join(f"{value}\n" for value in new_hashes))
+        except OSError as e:
+            logger.warning(f"Could not store validated hashes on disk: {e}")
+
+    def validate(
+        self, schema: dict, data: Any, max_workers: int = 1
+    ) -> List[ValidationErrorEntry]:
+        """
+        Validate `data` against `schema` skipping the parts that already passed.
+
+        Changed groups are validated by a `ParallelGroupsValidator` with `max_workers`
+        processes. Returns every error found, as ``(JSON pointer, message)`` pairs.
+
+        Raises:
+            jsonschema.SchemaError: If the schema itself is invalid.
+        """
+        fingerprint = schema_fingerprint(schema)
+        passed = self._passed_hashes(fingerprint)
+        validator = ParallelGroupsValidator(
+            schema, max(max_workers, 1), array_name=self.array_name
+        )
+
+        if not validator.can_split(data):
+            document_hash = _hash("document", _canonical(data))
+            if document_hash in passed:
+                return []
+            validator_class = validators.validator_for(schema)
+            validator_class.check_schema(schema)
+            errors = [
+                (json_pointer(error.absolute_path), error.message)
+                for error in validator_class(schema).iter_errors(data)
+            ]
+            if not errors:
+                self._remember(fingerprint, [document_hash])
+            return errors
+
+        items = data[self.array_name]
+        item_hashes = [_hash("item", _canonical(item)) for item in items]
+        rest = {key: value for key, value in data.items() if key != self.array_name}
+        root_hash = _hash(
+            "root", _canonical(rest), *(value.encode() for value in item_hashes)
+        )
+        if root_hash in passed:
+            return []
+
+        changed = [
+            index for index, value in enumerate(item_hashes) if value not in passed
+        ]
+        logger.debug(
+            f"Validating {len(changed)} of {len(items)} {self.array_name}, "
+            "the rest already passed"
+        )
+        errors = validator.validate(data, indexes=changed)
+
+        prefix = json_pointer([self.array_name]) + "/"
+        failed = {
+            int(pointer[len(prefix) :].split("/")[0])
+            for pointer, _ in errors
+            if pointer.startswith(prefix)
+        }
+        passed_hashes = [item_hashes[index] for index in changed if index not in failed]
+        if not errors:
+            passed_hashes.append(root_hash)
+        self._remember(fingerprint, passed_hashes)
+        return errors
+
+    def clear(self) -> None:
+        """Forget every validated hash, in memory and on disk."""
+        with self._lock:
+            self._passed.clear()
+        if self.cache_dir is None or not os.path.isdir(self.cache_dir):
+            return
+        for filename in os.listdir(self.cache_dir):
+            if filename.endswith(".hashes"):
+                os.remove(os.path.join(self.cache_dir, filename))
+
+
+def optional_validation_cache(cache_dir: Optional[str]) -> Optional[ValidationCache]:
+    """Return a ValidationCache stored in `cache_dir`, or None if it is not set."""
+    return ValidationCache(cache_dir) if cache_dir else None
@@ -5,15 +5,20 @@ class ConversorException(Exception):
 
 
 class StructureException(ConversorException):
-    """The data structure does not match the template format."""
+    """The data structure does not match the template format.
+
+    `errors` optionally holds every (JSON pointer, message) pair found.
+    """
 
     def __init__(
         self,
         message="The data structure does not match the template format.",
         details=None,
+        errors=None,
     ):
         self.message = message
         self.details = details
+        self.errors = errors or []
         super().__init__(self.message)
 
 
@@ -28,3 +33,12 @@ class NoHandlerCapableException(ConversorException):
         self.message = message
         self.details = details
         super().__init__(self.message)
+
+
+class SnapshotException(ConversorException):
+    """The snapshot cannot be read or does not match its source data."""
+
+    def __init__(self, message="The snapshot cannot be used.", details=None):
+        self.message = message
+        self.details = details
+        super().__init__(self.message)
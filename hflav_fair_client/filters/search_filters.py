@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 import datetime
 from enum import Enum
-from typing import Any, Type, Union
+from typing import Any, Optional, Type, Union
 
 from dependency_injector.wiring import inject, Provide
 
@@ -29,14 +29,18 @@ class TextFilter(Filter):
 
 
 class DateRangeFilter(Filter):
-    def __init__(self, field: str, start_date: datetime, end_date: datetime):
+    """Range of dates of a field; without `end_date` the range is open-ended."""
+
+    def __init__(
+        self, field: str, start_date: datetime, end_date: Optional[datetime] = None
+    ):
         self.field = field
         self.start_date = start_date
         self.end_date = end_date
 
     def build_query(self) -> str:
         start_str = self.start_date.isoformat()
-        end_str = self.end_date.isoformat()
+        end_str = self.end_date.isoformat() if self.end_date else "*"
         return f"{self.field}:[{start_str} TO {end_str}]"
 
 
@@ -123,7 +127,7 @@ class QueryBuilder:
         return self
 
     def with_date_range(
-        self, field: str, start_date: datetime, end_date: datetime
+        self, field: str, start_date: datetime, end_date: Optional[datetime] = None
     ) -> "QueryBuilder":
         self.filters.append(DateRangeFilter(field, start_date, end_date))
         return self
@@ -0,0 +1,85 @@
+from types import SimpleNamespace
+from typing import Any, List, Union
+
+import numpy as np
+
+from hflav_fair_client.models.hflav_query_engine import (
+    SearchOperators,
+    iter_search_candidates,
+)
+
+
+class HflavDataColumn:
+    """
+    Numeric column extracted from every `object_name` object of the HFLAV data.
+
+    The value at `field_path` (a dotted path such as ``average.value.central``, where
+    integer segments index lists, e.g. ``average.value.uncertainty.0``) is read once
+    from each object into a NumPy array, so numeric comparisons are evaluated
+    vectorized over the whole column. Objects where the path is missing or does not
+    hold a number get ``NaN``, which never matches.
+
+    Attributes:
+        object_name (str): Name of the objects the column is extracted from.
+        field_path (str): Dotted path of the field inside each object.
+        values (np.ndarray): Float array with one value per object.
+    """
+
+    NUMERIC_OPERATORS = {
+        SearchOperators.GREATER_THAN: np.greater,
+        SearchOperators.LESS_THAN: np.less,
+        SearchOperators.GREATER_THAN_OR_EQUALS: np.greater_equal,
+        SearchOperators.LESS_THAN_OR_EQUALS: np.less_equal,
+    }
+
+    def __init__(self, data: Any, object_name: str, field_path: str):
+        self.object_name = object_name
+        self.field_path = field_path
+        self._segments = field_path.split(".")
+        self._elements: List[Any] = list(iter_search_candidates(data, object_name))
+        self.values = np.fromiter(
+            (self._extract(element) for element in self._elements),
+            dtype=np.float64,
+            count=len(self._elements),
+        )
+
+    def __len__(self) -> int:
+        return len(self._elements)
+
+    def _extract(self, element: Any) -> float:
+        node = element
+        for segment in self._segments:
+            if isinstance(node, SimpleNamespace):
+                node = node.__dict__.get(segment)
+            elif isinstance(node, dict):
+                node = node.get(segment)
+            elif isinstance(node, list) and segment.isdigit():
+                index = int(segment)
+                node = node[index] if index < len(node) else None
+            else:
+                return np.nan
+        if isinstance(node, bool) or not isinstance(node, (int, float)):
+            return np.nan
+        return float(node)
+
+    def mask(self, operator: SearchOperators, value: Union[int, float]) -> np.ndarray:
+        """
+        Evaluate ``<field> operator value`` over the whole column.
+
+        Raises:
+            ValueError: If the operator is not a numeric comparison or the value is not a number.
+        """
+        if operator not in self.NUMERIC_OPERATORS:
+            raise ValueError(
+                f"Operator {operator.name} is not a numeric comparison operator"
+            )
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"Value {value!r} must be a number")
+        return self.NUMERIC_OPERATORS[operator](self.values, value)
+
+    def filter(self, operator: SearchOperators, value: Union[int, float]) -> List[Any]:
+        """Return the objects whose field satisfies ``<field> operator value``, in order."""
+        return [
+            self._elements[position]
+            for position in np.flatnonzero(self.mask(operator, value))
+        ]
@@ -0,0 +1,132 @@
+import math
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from hflav_fair_client.models.hflav_query_engine import (
+    SearchOperators,
+    collect_key_values,
+    iter_search_candidates,
+)
+
+
+class HflavDataIndex:
+    """
+    Secondary index over the objects matched by a ``$..object_name[?(@..key_name ...)]`` search.
+
+    The candidate objects are collected once in the same order the query engine visits
+    them, and every value found under ``key_name`` (at any depth) is indexed twice:
+
+    - a hash index (value -> positions) answering equality in O(1).
+    - a sorted index (value, position) answering numeric range operators in O(log n + k).
+
+    Lookups return ``None`` when the query is not an equality or numeric comparison, so the
+    caller can fall back to the query engine. Both give the same results.
+
+    Attributes:
+        object_name (str): Name of the objects being indexed.
+        key_name (str): Name of the key whose values are indexed.
+    """
+
+    RANGE_OPERATORS = (
+        SearchOperators.GREATER_THAN,
+        SearchOperators.LESS_THAN,
+        SearchOperators.GREATER_THAN_OR_EQUALS,
+        SearchOperators.LESS_THAN_OR_EQUALS,
+    )
+
+    def __init__(self, data: Any, object_name: str, key_name: str):
+        self.object_name = object_name
+        self.key_name = key_name
+        self._elements: List[Any] = []
+        self._hash: Dict[Any, List[int]] = {}
+        self._coerced_hash: Dict[int, List[int]] = {}
+        self._numeric: List[tuple] = []
+        self._coerced: List[tuple] = []
+        self._build(data)
+
+    def __len__(self) -> int:
+        return len(self._elements)
+
+    def _build(self, data: Any) -> None:
+        key_names = {self.key_name}
+        for element in iter_search_candidates(data, self.object_name):
+            position = len(self._elements)
+            self._elements.append(element)
+            for value in collect_key_values(element, key_names).get(self.key_name, ()):
+                self._add_value(value, position)
+
+        self._numeric.sort(key=lambda entry: entry[0])
+        self._coerced.sort(key=lambda entry: entry[0])
+        self._numeric_keys = [entry[0] for entry in self._numeric]
+        self._coerced_keys = [entry[0] for entry in self._coerced]
+
+    def _add_value(self, value: Any, position: int) -> None:
+        if isinstance(value, str):
+            self._append_position(self._hash, value, position)
+            try:
+                coerced = int(value)
+            except ValueError:
+                return
+            self._append_position(self._coerced_hash, coerced, position)
+            self._coerced.append((coerced, position))
+        elif isinstance(value, (int, float)):
+            if isinstance(value, float) and math.isnan(value):
+                return
+            self._append_position(self._hash, value, position)
+            self._numeric.append((value, position))
+        # Lists, objects and nulls never equal nor compare with a scalar
+
+    @staticmethod
+    def _append_position(table: Dict[Any, List[int]], key: Any, position: int) -> None:
+        positions = table.setdefault(key, [])
+        if not positions or positions[-1] != position:
+            positions.append(position)
+
+    def _elements_at(self, positions: Iterable[int]) -> List[Any]:
+        return [self._elements[position] for position in sorted(set(positions))]
+
+    def lookup_equals(self, value: Union[str, int, float]) -> Optional[List[Any]]:
+        """
+        Return the indexed objects having a ``key_name`` equal to ``value``.
+
+        Integer values also match strings holding that integer.
+        """
+        if type(value) not in (str, int, float):
+            return None
+        positions = list(self._hash.get(value, []))
+        if type(value) is int:
+            positions.extend(self._coerced_hash.get(value, []))
+        return self._elements_at(positions)
+
+    def lookup_range(
+        self, operator: SearchOperators, value: Union[int, float]
+    ) -> Optional[List[Any]]:
+        """
+        Return the indexed objects having a ``key_name`` satisfying ``<key> operator value``.
+
+        Integer values are also compared with strings holding an integer.
+        """
+        if operator not in self.RANGE_OPERATORS:
+            return None
+        if type(value) is int:
+            sources = [
+                (self._numeric_keys, self._numeric),
+                (self._coerced_keys, self._coerced),
+            ]
+        elif type(value) is float:
+            sources = [(self._numeric_keys, self._numeric)]
+        else:
+            return None
+
+        positions = []
+        for keys, entries in sources:
+            if operator == SearchOperators.GREATER_THAN:
+                selected = entries[bisect_right(keys, value) :]
+            elif operator == SearchOperators.GREATER_THAN_OR_EQUALS:
+                selected = entries[bisect_left(keys, value) :]
+            elif operator == SearchOperators.LESS_THAN:
+                selected = entries[: bisect_left(keys, value)]
+            else:
+                selected = entries[: bisect_right(keys, value)]
+            positions.extend(position for _, position in selected)
+        return self._elements_at(positions)
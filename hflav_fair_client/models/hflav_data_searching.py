@@ -1,35 +1,114 @@
-from enum import Enum
+from itertools import islice
 from types import SimpleNamespace
-from typing import List, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from dependency_injector.wiring import inject, Provide
 
 from hflav_fair_client.models.base_hflav_data_decorator import BaseHflavDataDecorator
+from hflav_fair_client.models.hflav_data_column import HflavDataColumn
+from hflav_fair_client.models.hflav_data_index import HflavDataIndex
+from hflav_fair_client.models.hflav_query_engine import (
+    KeyPredicate,
+    SearchOperators,
+    SearchPredicate,
+    find_matching_objects,
+)
 from hflav_fair_client.processing.visualizer_interface import VisualizerInterface
-from hflav_fair_client.utils.namespace_utils import dict_to_namespace, namespace_to_dict
 
-from jsonpath_ng.ext import parse
 
+class HflavDataSearching(BaseHflavDataDecorator):
+    """
+    Decorator adding search capabilities to HFLAV data.
 
-class SearchOperators(Enum):
-    EQUALS = "=="
-    NOT_EQUALS = "!="
-    GREATER_THAN = ">"
-    LESS_THAN = "<"
-    GREATER_THAN_OR_EQUALS = ">="
-    LESS_THAN_OR_EQUALS = "<="
-    CONTAINS = "=~"
-    REGEX = "=~"
+    Searches are evaluated by the native query engine (see `hflav_query_engine`) directly
+    over the namespace, and the matching objects of the data are returned (not copies).
 
+    Equality and numeric range searches are answered through secondary indexes
+    (see `HflavDataIndex`), built lazily the first time a given object/key pair is
+    queried. Numeric fields can also be extracted once into NumPy columns (see
+    `HflavDataColumn`) to filter them vectorized. Call `clear_indexes` after modifying
+    the wrapped namespace.
+
+    Results are printed through the visualizer unless `verbose` is disabled.
+    """
+
+    _INDEXED_OPERATORS = (SearchOperators.EQUALS,) + HflavDataIndex.RANGE_OPERATORS
 
-class HflavDataSearching(BaseHflavDataDecorator):
     @inject
     def __init__(
         self,
         hflav_data: SimpleNamespace,
         visualizer: VisualizerInterface = Provide["visualizer"],
+        use_indexes: bool = True,
+        verbose: bool = Provide["verbose"],
     ):
         super().__init__(hflav_data)
         self._visualizer = visualizer
+        self._use_indexes = use_indexes
+        self._verbose = verbose
+        self._indexes: Dict[Tuple[str, str], HflavDataIndex] = {}
+        self._columns: Dict[Tuple[str, str], HflavDataColumn] = {}
+
+    def build_index(self, object_name: str, key_name: str) -> HflavDataIndex:
+        """
+        Build (or return the already built) index of `object_name` objects by `key_name`.
+        """
+        index_key = (object_name, key_name)
+        if index_key not in self._indexes:
+            self._indexes[index_key] = HflavDataIndex(
+                self._hflav_data, object_name, key_name
+            )
+        return self._indexes[index_key]
+
+    def get_column(self, object_name: str, field_path: str) -> HflavDataColumn:
+        """
+        Extract (or return the already extracted) numeric column `field_path` of `object_name` objects.
+        """
+        column_key = (object_name, field_path)
+        if column_key not in self._columns:
+            self._columns[column_key] = HflavDataColumn(
+                self._hflav_data, object_name, field_path
+            )
+        return self._columns[column_key]
+
+    def clear_indexes(self) -> None:
+        """Drop every built index and column, so they are rebuilt from the current data."""
+        self._indexes = {}
+        self._columns = {}
+
+    def _find_with_index(
+        self,
+        object_name: str,
+        key_name: str,
+        operator: SearchOperators,
+        value: Union[str, int, float],
+    ) -> Optional[List[Any]]:
+        if not self._use_indexes or operator not in self._INDEXED_OPERATORS:
+            return None
+        index = self.build_index(object_name, key_name)
+        if operator == SearchOperators.EQUALS:
+            return index.lookup_equals(value)
+        return index.lookup_range(operator, value)
+
+    def _show_result(self, result: SimpleNamespace) -> SimpleNamespace:
+        if self._verbose:
+            self._visualizer.print_json_data(result)
+        return result
+
+    def _show_results(self, results: List[SimpleNamespace]) -> List[SimpleNamespace]:
+        if self._verbose:
+            for result in results:
+                self._visualizer.print_json_data(result)
+        return results
+
+    def _iter_shown_results(
+        self, results: Iterable[Any], limit: Optional[int], offset: int
+    ) -> Iterator[SimpleNamespace]:
+        if offset < 0:
+            raise ValueError("offset must be a non-negative integer")
+        if limit is not None and limit < 0:
+            raise ValueError("limit must be a non-negative integer")
+        stop = None if limit is None else offset + limit
+        return (self._show_result(result) for result in islice(results, offset, stop))
 
     def get_data_object_from_key_and_value(
         self,
@@ -41,15 +120,107 @@ class HflavDataSearching(BaseHflavDataDecorator):
         """
         Retrieve data by name searching recursively through the entire namespace.
         """
-        data_dict = namespace_to_dict(self._hflav_data)
-        if isinstance(value, str):
-            value = f'"{value}"'
-        jsonpath_expr = parse(
-            f"$..{object_name}[?(@..{key_name} {operator.value} {value})]"
-        )
-        results = [
-            dict_to_namespace(match.value) for match in jsonpath_expr.find(data_dict)
-        ]
-        for result in results:
-            self._visualizer.print_json_data(result)
-        return results
+        results = self._find_with_index(object_name, key_name, operator, value)
+        if results is None:
+            results = list(
+                find_matching_objects(
+                    self._hflav_data,
+                    object_name,
+                    KeyPredicate(key_name, operator, value),
+                )
+            )
+        return self._show_results(results)
+
+    def iter_data_object_from_key_and_value(
+        self,
+        object_name: str,
+        key_name: str,
+        operator: SearchOperators,
+        value: Union[str, int, float],
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Iterator[SimpleNamespace]:
+        """
+        Lazily yield the results of `get_data_object_from_key_and_value`.
+
+        The data is only walked as far as needed to produce the requested results, so
+        stopping the iteration early also stops the search. An index is only used if it
+        was already built, since building it requires a full scan.
+
+        Args:
+            limit: Maximum number of results to yield (all of them if None).
+            offset: Number of matching results to skip before yielding.
+
+        Raises:
+            ValueError: If limit or offset are negative.
+        """
+        index = self._indexes.get((object_name, key_name))
+        results = None
+        if index is not None and operator in self._INDEXED_OPERATORS:
+            results = self._find_with_index(object_name, key_name, operator, value)
+        if results is None:
+            results = find_matching_objects(
+                self._hflav_data,
+                object_name,
+                KeyPredicate(key_name, operator, value),
+            )
+        return self._iter_shown_results(results, limit, offset)
+
+    def iter_data_objects_matching(
+        self,
+        object_name: str,
+        predicate: SearchPredicate,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Iterator[SimpleNamespace]:
+        """
+        Lazily yield the results of `get_data_objects_matching`, see `iter_data_object_from_key_and_value`.
+
+        Raises:
+            ValueError: If limit or offset are negative.
+        """
+        results = find_matching_objects(self._hflav_data, object_name, predicate)
+        return self._iter_shown_results(results, limit, offset)
+
+    def get_data_objects_matching(
+        self, object_name: str, predicate: SearchPredicate
+    ) -> List[SimpleNamespace]:
+        """
+        Retrieve the `object_name` objects matching a combination of predicates.
+
+        The data is walked once whatever the number of combined predicates.
+
+        Examples:
+            >>> searching.get_data_objects_matching(
+            ...     "averages",
+            ...     AndPredicate(
+            ...         KeyPredicate("PDGcode", SearchOperators.EQUALS, 511),
+            ...         OrPredicate(
+            ...             KeyPredicate("name", SearchOperators.REGEX, "^B0"),
+            ...             KeyPredicate("upperlimit", SearchOperators.GREATER_THAN, 0),
+            ...         ),
+            ...     ),
+            ... )
+        """
+        results = list(find_matching_objects(self._hflav_data, object_name, predicate))
+        return self._show_results(results)
+
+    def get_data_objects_from_numeric_field(
+        self,
+        object_name: str,
+        field_path: str,
+        operator: SearchOperators,
+        value: Union[int, float],
+    ) -> List[SimpleNamespace]:
+        """
+        Retrieve the `object_name` objects whose numeric field satisfies ``<field> operator value``.
+
+        Unlike `get_data_object_from_key_and_value`, the field is given by its exact dotted
+        path inside each object (e.g. ``average.value.central``) and the comparison is
+        evaluated vectorized over a NumPy column extracted on the first call.
+
+        Raises:
+            ValueError: If the operator is not a numeric comparison or the value is not a number.
+        """
+        results = self.get_column(object_name, field_path).filter(operator, value)
+        return self._show_results(results)
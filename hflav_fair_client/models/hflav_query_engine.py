@@ -0,0 +1,184 @@
+"""
+Native query engine used to search inside HFLAV data.
+
+It evaluates `SearchOperators` directly over a namespace (or dict) tree, with the same
+semantics as the JSONPath expression ``$..object_name[?(@..key_name <op> value)]``:
+
+- Candidates are the items of every value stored under ``object_name`` at any depth,
+  visited in document pre-order.
+- A candidate matches a predicate if any value stored under ``key_name`` (at any depth
+  inside the candidate) satisfies the comparison.
+- Integer values also match strings holding that integer.
+
+Values that cannot be compared with the searched value (e.g. a list against a number)
+simply do not match.
+"""
+
+import operator
+import re
+from abc import ABC, abstractmethod
+from enum import Enum
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Union
+
+
+class SearchOperators(Enum):
+    EQUALS = "=="
+    NOT_EQUALS = "!="
+    GREATER_THAN = ">"
+    LESS_THAN = "<"
+    GREATER_THAN_OR_EQUALS = ">="
+    LESS_THAN_OR_EQUALS = "<="
+    CONTAINS = "=~"
+    REGEX = "=~"
+
+
+_OPERATOR_FUNCTIONS = {
+    SearchOperators.EQUALS: operator.eq,
+    SearchOperators.NOT_EQUALS: operator.ne,
+    SearchOperators.GREATER_THAN: operator.gt,
+    SearchOperators.LESS_THAN: operator.lt,
+    SearchOperators.GREATER_THAN_OR_EQUALS: operator.ge,
+    SearchOperators.LESS_THAN_OR_EQUALS: operator.le,
+}
+
+
+def _fields(node: Any) -> Optional[dict]:
+    if isinstance(node, SimpleNamespace):
+        return node.__dict__
+    if isinstance(node, dict):
+        return node
+    return None
+
+
+def _children(node: Any) -> Iterable[Any]:
+    fields = _fields(node)
+    if fields is not None:
+        return fields.values()
+    if isinstance(node, list):
+        return node
+    return ()
+
+
+def iter_search_candidates(data: Any, object_name: str) -> Iterator[Any]:
+    """Yield the items of every value stored under `object_name`, in document order."""
+    stack = [data]
+    while stack:
+        current = stack.pop()
+        fields = _fields(current)
+        if fields is not None and object_name in fields:
+            yield from _children(fields[object_name])
+        stack.extend(reversed(list(_children(current))))
+
+
+def collect_key_values(node: Any, key_names: Set[str]) -> Dict[str, List[Any]]:
+    """Collect, in a single walk, every value stored under any of `key_names` inside `node`."""
+    values: Dict[str, List[Any]] = {}
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        fields = _fields(current)
+        if fields is not None:
+            for key_name in key_names:
+                if key_name in fields:
+                    values.setdefault(key_name, []).append(fields[key_name])
+            stack.extend(fields.values())
+        elif isinstance(current, list):
+            stack.extend(current)
+    return values
+
+
+class SearchPredicate(ABC):
+    """Basic interface for search predicates. It follows the Interpreter design pattern."""
+
+    @abstractmethod
+    def key_names(self) -> Set[str]:
+        """Return the keys whose values are needed to evaluate this predicate."""
+        pass
+
+    @abstractmethod
+    def evaluate(self, values: Dict[str, List[Any]]) -> bool:
+        """Evaluate the predicate over the values collected for its keys."""
+        pass
+
+    def matches(self, node: Any) -> bool:
+        return self.evaluate(collect_key_values(node, self.key_names()))
+
+
+# Terminal predicates
+class KeyPredicate(SearchPredicate):
+    def __init__(
+        self,
+        key_name: str,
+        operator: SearchOperators,
+        value: Union[str, int, float],
+    ):
+        self.key_name = key_name
+        self.operator = operator
+        self.value = value
+        self._compare = self._build_comparison()
+
+    def _build_comparison(self) -> Callable[[Any], bool]:
+        if self.operator == SearchOperators.REGEX:
+            pattern = re.compile(self.value)
+            return lambda candidate: (
+                isinstance(candidate, str) and pattern.search(candidate) is not None
+            )
+
+        function = _OPERATOR_FUNCTIONS[self.operator]
+        value = self.value
+        coerce_strings = type(value) is int
+
+        def compare(candidate: Any) -> bool:
+            if coerce_strings and isinstance(candidate, str):
+                try:
+                    candidate = int(candidate)
+                except ValueError:
+                    return False
+            try:
+                return bool(function(candidate, value))
+            except TypeError:
+                return False
+
+        return compare
+
+    def key_names(self) -> Set[str]:
+        return {self.key_name}
+
+    def evaluate(self, values: Dict[str, List[Any]]) -> bool:
+        return any(self._compare(value) for value in values.get(self.key_name, ()))
+
+
+# Non-Terminal (Combinatorial) predicates
+class AndPredicate(SearchPredicate):
+    def __init__(self, *predicates: SearchPredicate):
+        self.predicates = predicates
+        self._key_names = set().union(*(p.key_names() for p in predicates))
+
+    def key_names(self) -> Set[str]:
+        return self._key_names
+
+    def evaluate(self, values: Dict[str, List[Any]]) -> bool:
+        return all(predicate.evaluate(values) for predicate in self.predicates)
+
+
+class OrPredicate(SearchPredicate):
+    def __init__(self, *predicates: SearchPredicate):
+        self.predicates = predicates
+        self._key_names = set().union(*(p.key_names() for p in predicates))
+
+    def key_names(self) -> Set[str]:
+        return self._key_names
+
+    def evaluate(self, values: Dict[str, List[Any]]) -> bool:
+        return any(predicate.evaluate(values) for predicate in self.predicates)
+
+
+def find_matching_objects(
+    data: Any, object_name: str, predicate: SearchPredicate
+) -> Iterator[Any]:
+    """Walk `data` once, yielding the `object_name` items matching `predicate`."""
+    key_names = predicate.key_names()
+    for candidate in iter_search_candidates(data, object_name):
+        if predicate.evaluate(collect_key_values(candidate, key_names)):
+            yield candidate
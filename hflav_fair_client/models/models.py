@@ -1,7 +1,9 @@
 from abc import abstractmethod
 from datetime import datetime
 from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, PrivateAttr, TypeAdapter, model_validator
+
+_DATETIME_ADAPTER = TypeAdapter(datetime)
 
 
 class ZenodoElement(BaseModel):
@@ -28,6 +30,7 @@ class ZenodoElement(BaseModel):
 class File(ZenodoElement):
     title: str
     download_url: str
+    checksum: Optional[str] = None
 
     @property
     def name(self) -> str:
@@ -39,6 +42,7 @@ class File(ZenodoElement):
             return {
                 "title": data.get("key", ""),
                 "download_url": data.get("links", {}).get("self", ""),
+                "checksum": data.get("checksum"),
             }
         return data
 
@@ -49,6 +53,57 @@ class File(ZenodoElement):
         return f"File(name='{self.name}', download_url='{self.download_url}')"
 
 
+class _ChildIndex:
+    """Lazily built name -> position lookup over a list of children.
+
+    The index is rebuilt when it is cleared, when the list it was built from is
+    replaced or changes its length, when the child found is no longer at its
+    position with that name (e.g. it was replaced in place), and before reporting
+    a name as missing. The first child with a given name wins, as in a linear
+    scan; only an in-place change putting a repeated name before an indexed child
+    goes unnoticed, so children should be changed through ``add_child`` and
+    ``remove_child``. Being only a cache, it is ignored when comparing models.
+    """
+
+    __slots__ = ("_children", "_length", "_positions")
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self) -> None:
+        self._children: Optional[List[ZenodoElement]] = None
+        self._length = 0
+        self._positions: Dict[str, int] = {}
+
+    def _build(self, children: List[ZenodoElement]) -> None:
+        self._positions = {}
+        for position, child in enumerate(children):
+            self._positions.setdefault(child.name, position)
+        self._children = children
+        self._length = len(children)
+
+    def get(
+        self, children: List[ZenodoElement], child_name: str
+    ) -> Optional[ZenodoElement]:
+        rebuilt = children is not self._children or len(children) != self._length
+        if rebuilt:
+            self._build(children)
+        position = self._positions.get(child_name)
+        if position is not None and children[position].name == child_name:
+            return children[position]
+        if rebuilt:
+            return None
+        # Stale after an in-place change of the list
+        self._build(children)
+        position = self._positions.get(child_name)
+        return None if position is None else children[position]
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _ChildIndex)
+
+    __hash__ = None
+
+
 class Record(ZenodoElement):
     id: int
     doi: str
@@ -58,6 +113,8 @@ class Record(ZenodoElement):
     links: dict
     children: List[ZenodoElement]
 
+    _child_index: _ChildIndex = PrivateAttr(default_factory=_ChildIndex)
+
     @model_validator(mode="before")
     def transform_json_data(cls, values: Dict[str, Any]) -> Dict[str, Any]:
         if isinstance(values, dict):
@@ -82,19 +139,25 @@ class Record(ZenodoElement):
         if self.children is None:
             self.children = []
         self.children.append(child)
+        self._child_index.clear()
 
     def remove_child(self, child_name: str) -> None:
         if not self.children:
             return
+        if self._child_index.get(self.children, child_name) is None:
+            return
         self.children = [c for c in self.children if c.name != child_name]
+        self._child_index.clear()
 
     def get_child(self, child_name: str) -> ZenodoElement:
         if not self.children:
             raise ValueError(f"No children in record {self.id}")
-        for c in self.children:
-            if c.name == child_name:
-                return c
-        raise ValueError(f"Child with name {child_name} not found in record {self.id}")
+        child = self._child_index.get(self.children, child_name)
+        if child is None:
+            raise ValueError(
+                f"Child with name {child_name} not found in record {self.id}"
+            )
+        return child
 
     def get_data(self) -> dict:
         return {
@@ -122,6 +185,78 @@ class Record(ZenodoElement):
         )
 
 
+class RecordSummary:
+    """Lightweight read-only view of a Zenodo search hit.
+
+    Exposes the same attributes as `Record` without validating the hit: the
+    timestamps are parsed and the `File` children built only when first accessed,
+    so listing ids and titles of many hits stays cheap. Use `to_record` to get the
+    fully validated `Record`.
+    """
+
+    __slots__ = (
+        "id",
+        "doi",
+        "title",
+        "links",
+        "_hit",
+        "_created",
+        "_updated",
+        "_children",
+        "_child_index",
+    )
+
+    def __init__(self, hit: Dict[str, Any]):
+        self._hit = hit
+        self.id = hit.get("id")
+        self.doi = hit.get("doi")
+        self.title = (hit.get("metadata") or {}).get("title")
+        self.links = hit.get("links", {})
+        self._created: Optional[datetime] = None
+        self._updated: Optional[datetime] = None
+        self._children: Optional[List[ZenodoElement]] = None
+        self._child_index = _ChildIndex()
+
+    @property
+    def name(self) -> str:
+        return self.title
+
+    @property
+    def is_leaf(self) -> bool:
+        return False
+
+    @property
+    def created(self) -> datetime:
+        if self._created is None:
+            self._created = _DATETIME_ADAPTER.validate_python(self._hit.get("created"))
+        return self._created
+
+    @property
+    def updated(self) -> datetime:
+        if self._updated is None:
+            self._updated = _DATETIME_ADAPTER.validate_python(self._hit.get("updated"))
+        return self._updated
+
+    @property
+    def children(self) -> List[ZenodoElement]:
+        if self._children is None:
+            self._children = [File(**file) for file in self._hit.get("files", [])]
+        return self._children
+
+    def get_child(self, child_name: str) -> ZenodoElement:
+        child = self._child_index.get(self.children, child_name)
+        if child is not None:
+            return child
+        raise ValueError(f"Child with name {child_name} not found in record {self.id}")
+
+    def to_record(self) -> Record:
+        """Return the fully validated `Record` of the hit."""
+        return Record(**self._hit)
+
+    get_data = Record.get_data
+    __str__ = Record.__str__
+
+
 class Template(ZenodoElement):
     rec_id: int
     title: str
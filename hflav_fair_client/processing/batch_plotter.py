@@ -0,0 +1,138 @@
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from matplotlib.figure import Figure
+
+from hflav_fair_client.logger import get_logger
+from hflav_fair_client.models.hflav_query_engine import iter_search_candidates
+from hflav_fair_client.processing.plotter_interface import PlotterInterface
+
+logger = get_logger(__name__)
+
+MANIFEST_FILENAME = "manifest.json"
+SUPPORTED_FORMATS = ("png", "svg", "pdf")
+
+# Per worker process state: matplotlib is not thread-safe, so every process owns its
+# plotter and reuses a single figure as template for all the groups it renders.
+_worker_plotter: Optional[PlotterInterface] = None
+_worker_figure: Optional[Figure] = None
+
+
+def _init_worker(plotter: PlotterInterface) -> None:
+    global _worker_plotter, _worker_figure
+    _worker_plotter = plotter
+    _worker_figure = None
+
+
+def _safe_filename(name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", name).strip("_") or "group"
+
+
+def _render_group(task: Tuple[int, str, Any, str, Sequence[str]]) -> Dict[str, Any]:
+    global _worker_figure
+    index, name, group, output_dir, formats = task
+    entry: Dict[str, Any] = {"index": index, "name": name, "files": []}
+    try:
+        _worker_figure = _worker_plotter.plot(group, figure=_worker_figure)
+    except ValueError as e:
+        entry["skipped"] = str(e)
+        return entry
+
+    basename = f"{index:04d}_{_safe_filename(name)}"
+    for extension in formats:
+        filename = f"{basename}.{extension}"
+        _worker_figure.savefig(os.path.join(output_dir, filename), format=extension)
+        entry["files"].append(filename)
+    return entry
+
+
+class BatchPlotter:
+    """
+    Render one figure per HFLAV group, fanning the work out over a process pool.
+
+    Matplotlib is not thread-safe, so figures are rendered in separate processes. Each
+    worker reuses a single figure as template for every group it draws. The files are
+    written to `output_dir` together with a ``manifest.json`` describing them.
+
+    Attributes:
+        plotter (PlotterInterface): Plotter used to draw each group.
+        max_workers (Optional[int]): Number of worker processes (CPU count by default).
+                                     With 1, groups are rendered in the calling process.
+    """
+
+    def __init__(self, plotter: PlotterInterface, max_workers: Optional[int] = None):
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be a positive integer")
+        self.plotter = plotter
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def plot_groups(
+        self,
+        data: SimpleNamespace,
+        output_dir: str,
+        formats: Sequence[str] = ("png",),
+    ) -> Dict[str, Any]:
+        """
+        Render every group of `data` into `output_dir`, in each of the given formats.
+
+        Returns:
+            Dict[str, Any]: The manifest, also written to ``output_dir/manifest.json``.
+                            Groups without anything to plot are listed as skipped.
+
+        Raises:
+            ValueError: If a format is not supported.
+        """
+        formats = [extension.lower().lstrip(".") for extension in formats]
+        unsupported = set(formats) - set(SUPPORTED_FORMATS)
+        if unsupported:
+            raise ValueError(f"Unsupported formats: {', '.join(sorted(unsupported))}")
+        os.makedirs(output_dir, exist_ok=True)
+
+        tasks = [
+            (index, self._group_name(group, index), group, output_dir, formats)
+            for index, group in enumerate(iter_search_candidates(data, "groups"))
+        ]
+        start_time = time.perf_counter()
+        entries = self._render(tasks)
+        elapsed = time.perf_counter() - start_time
+
+        num_figures = sum(1 for entry in entries if entry["files"])
+        manifest = {
+            "formats": formats,
+            "groups": entries,
+            "figures": num_figures,
+            "elapsed_seconds": elapsed,
+            "figures_per_second": num_figures / elapsed if elapsed > 0 else 0.0,
+        }
+        with open(os.path.join(output_dir, MANIFEST_FILENAME), "w") as f:
+            json.dump(manifest, f, indent=4)
+
+        logger.info(
+            f"Rendered {num_figures} figures in {elapsed:.2f}s "
+            f"({manifest['figures_per_second']:.1f} figures/s) to {output_dir}"
+        )
+        return manifest
+
+    def _render(self, tasks: List[tuple]) -> List[Dict[str, Any]]:
+        workers = min(self.max_workers, len(tasks))
+        if workers <= 1:
+            _init_worker(self.plotter)
+            return [_render_group(task) for task in tasks]
+
+        chunksize = max(1, len(tasks) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(self.plotter,)
+        ) as executor:
+            return list(executor.map(_render_group, tasks, chunksize=chunksize))
+
+    @staticmethod
+    def _group_name(group: Any, index: int) -> str:
+        name = getattr(group, "name", None)
+        if name is None and isinstance(group, dict):
+            name = group.get("name")
+        return str(name) if name is not None else f"group_{index}"
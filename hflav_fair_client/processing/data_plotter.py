@@ -0,0 +1,194 @@
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+
+from hflav_fair_client.processing.decimation import min_max_indexes, rdp_indexes
+from hflav_fair_client.processing.plot_data_extractor import (
+    AverageSeries,
+    CurveSeries,
+    PlotData,
+    extract_plot_data,
+)
+from hflav_fair_client.processing.plotter_interface import PlotterInterface
+
+
+class DataPlotter(PlotterInterface):
+    """Plotter drawing HFLAV averages, contours and likelihood scans with matplotlib.
+
+    Figures are rendered with the Agg backend without going through pyplot, so no GUI
+    nor global figure state is involved. Each kind of content gets its own axes, drawn
+    with a single vectorized artist whatever the number of points:
+
+    - Averages: one ``errorbar`` call with asymmetric horizontal uncertainties.
+    - Contours: one closed `LineCollection` holding every contour.
+    - Scans: one `LineCollection` holding every scan.
+
+    Contours and scans with more than `decimation_threshold` points are decimated at the
+    resolution of the figure: contours with Ramer-Douglas-Peucker, keeping every dropped
+    point within `decimation_tolerance` pixels of the drawn line, and scans keeping the
+    first, last, lowest and highest point of each pixel column.
+
+    Attributes:
+        decimation_threshold (Optional[int]): Number of points from which contours and
+                                              scans are decimated. ``None`` disables it.
+        decimation_tolerance (float): Maximum error, in pixels, of decimated contours.
+        max_labels (int): Averages are labelled with their names only up to this count.
+        figure_width (float): Width of the figure in inches.
+        axes_height (float): Height of each axes in inches.
+        dpi (int): Resolution of the figure.
+    """
+
+    def __init__(
+        self,
+        decimation_threshold: Optional[int] = 5000,
+        decimation_tolerance: float = 0.5,
+        max_labels: int = 40,
+        figure_width: float = 10.0,
+        axes_height: float = 6.0,
+        dpi: int = 100,
+    ):
+        if decimation_threshold is not None and decimation_threshold < 2:
+            raise ValueError("decimation_threshold must be at least 2")
+        if decimation_tolerance < 0:
+            raise ValueError("decimation_tolerance must be non-negative")
+        self.decimation_threshold = decimation_threshold
+        self.decimation_tolerance = decimation_tolerance
+        self.max_labels = max_labels
+        self.figure_width = figure_width
+        self.axes_height = axes_height
+        self.dpi = dpi
+
+    def plot(
+        self,
+        data: SimpleNamespace,
+        save_path: Optional[str] = None,
+        figure: Optional[Figure] = None,
+    ) -> Figure:
+        """
+        Plot the data, optionally saving it to `save_path`.
+
+        An existing `figure` can be passed to be cleared and reused as a template,
+        which avoids creating a new figure and canvas when plotting many objects.
+        """
+        return self.draw(extract_plot_data(data), save_path=save_path, figure=figure)
+
+    def draw(
+        self,
+        plot_data: PlotData,
+        save_path: Optional[str] = None,
+        figure: Optional[Figure] = None,
+    ) -> Figure:
+        """Plot already extracted `PlotData`, see `plot`."""
+        if plot_data.is_empty():
+            raise ValueError("The data does not contain averages, contours nor scans")
+
+        panels = [
+            (series, draw)
+            for series, draw in (
+                (plot_data.averages, self._draw_averages),
+                (plot_data.contours, self._draw_contours),
+                (plot_data.scans, self._draw_scans),
+            )
+            if len(series)
+        ]
+        size = (self.figure_width, self.axes_height * len(panels))
+        if figure is None:
+            figure = Figure(figsize=size, dpi=self.dpi)
+            FigureCanvasAgg(figure)
+        else:
+            figure.clear()
+            figure.set_size_inches(size)
+        axes = figure.subplots(len(panels), 1, squeeze=False)[:, 0]
+        for ax, (series, draw) in zip(axes, panels):
+            draw(ax, series)
+            ax.grid(True, alpha=0.3)
+        figure.tight_layout()
+
+        if save_path:
+            figure.savefig(save_path)
+        return figure
+
+    def style_parameters(self) -> Dict[str, Any]:
+        """Return the settings that change how the figures look."""
+        return {
+            "decimation_threshold": self.decimation_threshold,
+            "decimation_tolerance": self.decimation_tolerance,
+            "max_labels": self.max_labels,
+            "figure_width": self.figure_width,
+            "axes_height": self.axes_height,
+            "dpi": self.dpi,
+        }
+
+    def _needs_decimation(self, points: np.ndarray) -> bool:
+        return (
+            self.decimation_threshold is not None
+            and len(points) > self.decimation_threshold
+        )
+
+    def _decimate_contours(self, curves: List[np.ndarray]) -> List[np.ndarray]:
+        if not any(self._needs_decimation(curve) for curve in curves):
+            return curves
+        # Simplify in pixel units, assuming the axes are fitted to the contours
+        all_points = np.concatenate(curves)
+        extent = np.ptp(all_points, axis=0)
+        pixels = np.array([self.figure_width, self.axes_height]) * self.dpi
+        scale = np.divide(pixels, extent, out=np.ones(2), where=extent > 0)
+        return [
+            (
+                curve[rdp_indexes(curve * scale, self.decimation_tolerance)]
+                if self._needs_decimation(curve)
+                else curve
+            )
+            for curve in curves
+        ]
+
+    def _decimate_scans(self, curves: List[np.ndarray]) -> List[np.ndarray]:
+        num_buckets = int(self.figure_width * self.dpi)
+        return [
+            (
+                curve[min_max_indexes(curve, num_buckets)]
+                if self._needs_decimation(curve)
+                else curve
+            )
+            for curve in curves
+        ]
+
+    def _draw_averages(self, ax, averages: AverageSeries) -> None:
+        positions = np.arange(len(averages))[::-1]
+        ax.errorbar(
+            averages.central,
+            positions,
+            xerr=np.vstack((averages.minus, averages.plus)),
+            fmt="o",
+            markersize=3,
+            elinewidth=1,
+            capsize=0,
+        )
+        if len(averages) <= self.max_labels:
+            ax.set_yticks(positions)
+            ax.set_yticklabels(averages.names)
+        else:
+            ax.set_yticks([])
+        ax.set_xlabel("Value")
+        ax.set_title(f"Averages ({len(averages)})")
+
+    def _add_curves(self, ax, curves: List[np.ndarray]) -> None:
+        ax.add_collection(LineCollection(curves, linewidths=1))
+        ax.autoscale_view()
+
+    def _draw_contours(self, ax, contours: CurveSeries) -> None:
+        closed = [
+            np.vstack((points, points[:1]))
+            for points in self._decimate_contours(contours.curves)
+        ]
+        self._add_curves(ax, closed)
+        ax.set_title(f"Contours ({len(contours)})")
+
+    def _draw_scans(self, ax, scans: CurveSeries) -> None:
+        self._add_curves(ax, self._decimate_scans(scans.curves))
+        ax.set_ylabel("Δχ²")
+        ax.set_title(f"Scans ({len(scans)})")
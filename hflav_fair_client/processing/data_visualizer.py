@@ -1,17 +1,63 @@
 import json
+import sys
 from types import SimpleNamespace
+from typing import Any, Optional, TextIO
 
 from rich import print_json
+from rich.console import Console
 
+from hflav_fair_client.processing.json_stream_renderer import JsonStreamRenderer
 from hflav_fair_client.processing.visualizer_interface import VisualizerInterface
-from hflav_fair_client.utils.namespace_utils import namespace_to_dict
 
 
 class DataVisualizer(VisualizerInterface):
+    """Visualizer printing JSON data to a text stream (stdout by default).
+
+    Data is written by a `JsonStreamRenderer` straight from the object tree, honouring
+    the optional `max_depth`/`max_items` budgets. Syntax highlighting with rich is only
+    applied when the output is a terminal and the data has at most
+    `highlight_max_nodes` nodes, since it re-parses and tokenizes the whole output.
+    """
+
+    def __init__(
+        self,
+        output: Optional[TextIO] = None,
+        max_depth: Optional[int] = None,
+        max_items: Optional[int] = None,
+        highlight_max_nodes: int = 10000,
+    ):
+        self._output = output
+        self._renderer = JsonStreamRenderer(max_depth=max_depth, max_items=max_items)
+        self._highlight_max_nodes = highlight_max_nodes
+
+    def _is_terminal(self, output: TextIO) -> bool:
+        isatty = getattr(output, "isatty", None)
+        return bool(isatty and isatty())
+
+    def _has_at_most_nodes(self, data: Any, max_nodes: int) -> bool:
+        count = 0
+        stack = [data]
+        while stack:
+            count += 1
+            if count > max_nodes:
+                return False
+            current = stack.pop()
+            if isinstance(current, SimpleNamespace):
+                stack.extend(current.__dict__.values())
+            elif isinstance(current, dict):
+                stack.extend(current.values())
+            elif isinstance(current, list):
+                stack.extend(current)
+        return True
 
     def print_schema(self, schema: dict):
         print_json(json.dumps(schema))
 
     def print_json_data(self, data: SimpleNamespace):
-        dict_data = namespace_to_dict(data)
-        print_json(json.dumps(dict_data, indent=4))
+        output = self._output or sys.stdout
+        if self._is_terminal(output) and self._has_at_most_nodes(
+            data, self._highlight_max_nodes
+        ):
+            Console(file=output).print_json(self._renderer.render_to_string(data))
+        else:
+            self._renderer.render(data, output)
@@ -0,0 +1,210 @@
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+from hflav_fair_client.logger import get_logger
+from hflav_fair_client.models.models import Record
+from hflav_fair_client.processing.table_exporter import TABLE_COLUMNS, iter_group_tables
+
+logger = get_logger(__name__)
+
+_SQL_TYPES = {"int64": "INTEGER", "float64": "REAL", "string": "TEXT"}
+
+# (table, columns) of every index created on the data tables
+_INDEXES = (
+    ("groups", ("name",)),
+    ("averages", ("name",)),
+    ("averages", ("pdg_code",)),
+    ("sources", ("name",)),
+)
+
+
+class DatasetStore:
+    """
+    Local SQLite database of the data files of many records, to query across releases.
+
+    Every data file is flattened into the tables of `TABLE_COLUMNS` (groups,
+    averages, sources, scan and contour points), each row tagged with the
+    ``record_id`` and ``filename`` it comes from, plus a ``records`` table with the
+    metadata of every ingested record. Names and PDG codes are indexed.
+
+    Ingestion is incremental: a record is only ingested again when its ``updated``
+    timestamp changes, replacing all its rows in a single transaction.
+
+    The database file is only opened on first use.
+
+    Attributes:
+        db_path (str): Path of the SQLite database (``:memory:`` for a private one).
+    """
+
+    def __init__(self, db_path: str = "hflav_store.sqlite"):
+        self.db_path = db_path
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._create_tables(connection)
+            self._connection = connection
+        return self._connection
+
+    @staticmethod
+    def _create_tables(connection: sqlite3.Connection) -> None:
+        statements = [
+            "CREATE TABLE IF NOT EXISTS records ("
+            "record_id INTEGER PRIMARY KEY, title TEXT, doi TEXT, "
+            "created TEXT, updated TEXT, ingested TEXT)"
+        ]
+        for table, columns in TABLE_COLUMNS.items():
+            definitions = ", ".join(
+                f"{name} {_SQL_TYPES[type_name]}" for name, type_name in columns
+            )
+            statements.append(
+                f"CREATE TABLE IF NOT EXISTS {table} "
+                f"(record_id INTEGER NOT NULL, filename TEXT NOT NULL, {definitions})"
+            )
+            statements.append(
+                f"CREATE INDEX IF NOT EXISTS {table}_record_id ON {table} (record_id)"
+            )
+        for table, columns in _INDEXES:
+            statements.append(
+                f"CREATE INDEX IF NOT EXISTS {table}_{'_'.join(columns)} "
+                f"ON {table} ({', '.join(columns)})"
+            )
+        with connection:
+            for statement in statements:
+                connection.execute(statement)
+
+    def close(self) -> None:
+        """Close the database connection, if it is open."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def stored_updated(self, record_id: int) -> Optional[str]:
+        """Return the ``updated`` timestamp of the stored record, or None if missing."""
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT updated FROM records WHERE record_id = ?", (record_id,)
+                )
+                .fetchone()
+            )
+        return row["updated"] if row else None
+
+    def needs_update(self, record: Record) -> bool:
+        """Return whether the record is missing or changed since it was ingested."""
+        return self.stored_updated(record.id) != record.updated.isoformat()
+
+    def ingest(self, record: Record, datasets: Dict[str, Any]) -> Dict[str, int]:
+        """
+        Store the data files of a record, replacing the rows previously stored for it.
+
+        Parameters:
+            record (Record): The record the data files belong to.
+            datasets (Dict[str, Any]): Loaded data of every data file, by filename.
+        Returns:
+            Dict[str, int]: Number of rows inserted in every table.
+        """
+        counts = {table: 0 for table in TABLE_COLUMNS}
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                for table in TABLE_COLUMNS:
+                    connection.execute(
+                        f"DELETE FROM {table} WHERE record_id = ?", (record.id,)
+                    )
+                for filename, data in datasets.items():
+                    for tables in iter_group_tables(data):
+                        for table, columns in tables.items():
+                            rows = self._rows(record.id, filename, columns)
+                            if rows:
+                                connection.executemany(
+                                    self._insert_statement(table), rows
+                                )
+                                counts[table] += len(rows)
+                connection.execute(
+                    "INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        record.id,
+                        record.title,
+                        record.doi,
+                        record.created.isoformat(),
+                        record.updated.isoformat(),
+                        datetime.now().isoformat(),
+                    ),
+                )
+        logger.info(f"Stored record {record.id}: {counts['averages']} averages")
+        return counts
+
+    @staticmethod
+    def _insert_statement(table: str) -> str:
+        placeholders = ", ".join("?" * (len(TABLE_COLUMNS[table]) + 2))
+        return f"INSERT INTO {table} VALUES ({placeholders})"
+
+    @staticmethod
+    def _rows(record_id: int, filename: str, columns: Dict[str, List[Any]]) -> list:
+        values = list(columns.values())
+        return [(record_id, filename, *row) for row in zip(*values)]
+
+    def records(self) -> List[Dict[str, Any]]:
+        """Return the metadata of every stored record, newest first."""
+        return self.query("SELECT * FROM records ORDER BY updated DESC")
+
+    def query(self, sql: str, parameters: Sequence[Any] = ()) -> List[Dict[str, Any]]:
+        """Run an SQL query and return its rows as dictionaries."""
+        with self._lock:
+            cursor = self._connect().execute(sql, tuple(parameters))
+            return [dict(row) for row in cursor.fetchall()]
+
+    def query_averages(
+        self,
+        name: Optional[str] = None,
+        pdg_code: Optional[str] = None,
+        name_like: Optional[str] = None,
+        record_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Return the averages matching every given filter, across all stored records,
+        with the title and ``updated`` timestamp of their record.
+
+        Parameters:
+            name (Optional[str]): Exact name of the average.
+            pdg_code (Optional[str]): PDG code of the average.
+            name_like (Optional[str]): SQL ``LIKE`` pattern on the name.
+            record_id (Optional[int]): Record the averages belong to.
+            limit (Optional[int]): Maximum number of rows returned.
+        """
+        conditions, parameters = [], []
+        for condition, value in (
+            ("a.name = ?", name),
+            ("a.pdg_code = ?", pdg_code),
+            ("a.name LIKE ?", name_like),
+            ("a.record_id = ?", record_id),
+        ):
+            if value is not None:
+                conditions.append(condition)
+                parameters.append(value)
+        sql = (
+            "SELECT a.*, r.title AS record_title, r.updated AS record_updated "
+            "FROM averages a JOIN records r ON r.record_id = a.record_id"
+        )
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY r.updated DESC, a.filename, a.group_id, a.average_id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            parameters.append(limit)
+        return self.query(sql, parameters)
@@ -0,0 +1,106 @@
+"""
+Decimation of large point arrays before plotting them.
+
+Drawing more points than there are pixels does not change the figure, it only costs
+time. Both algorithms return the *indexes* of the points to keep, in their original
+order, and come with a bound on the error they introduce:
+
+- `rdp_indexes` (Ramer-Douglas-Peucker, for contours): every dropped point lies within
+  `epsilon` of the simplified polyline.
+- `min_max_indexes` (for scans): the points are split into `num_buckets` equally wide
+  buckets along x, keeping the first, last, lowest and highest point of each one. The
+  vertical extent of the curve inside each bucket is preserved exactly, so with one
+  bucket per pixel column the rasterized curve does not change.
+"""
+
+import numpy as np
+
+
+def _segment_distances(points: np.ndarray, start: np.ndarray, end: np.ndarray):
+    """Distances from `points` to the segment between `start` and `end`."""
+    direction = end - start
+    length_squared = float(direction @ direction)
+    if length_squared == 0.0:
+        return np.hypot(*(points - start).T)
+    projection = np.clip((points - start) @ direction / length_squared, 0.0, 1.0)
+    closest = start + projection[:, None] * direction
+    return np.hypot(*(points - closest).T)
+
+
+def rdp_indexes(points: np.ndarray, epsilon: float) -> np.ndarray:
+    """
+    Simplify a polyline with the Ramer-Douglas-Peucker algorithm.
+
+    Parameters:
+        points (np.ndarray): ``(n, 2)`` array with the polyline points.
+        epsilon (float): Maximum distance between a dropped point and the simplified
+                         polyline, in the units of `points`.
+
+    Returns:
+        np.ndarray: Sorted indexes of the points to keep. The first and last points are
+                    always kept.
+    """
+    if epsilon < 0:
+        raise ValueError("epsilon must be non-negative")
+    num_points = len(points)
+    if num_points <= 2:
+        return np.arange(num_points)
+
+    keep = np.zeros(num_points, dtype=bool)
+    keep[[0, -1]] = True
+    stack = [(0, num_points - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        distances = _segment_distances(
+            points[first + 1 : last], points[first], points[last]
+        )
+        farthest = int(np.argmax(distances))
+        if distances[farthest] > epsilon:
+            split = first + 1 + farthest
+            keep[split] = True
+            stack.append((first, split))
+            stack.append((split, last))
+    return np.flatnonzero(keep)
+
+
+def min_max_indexes(points: np.ndarray, num_buckets: int) -> np.ndarray:
+    """
+    Decimate a curve keeping the extremes of each bucket along the x axis.
+
+    Parameters:
+        points (np.ndarray): ``(n, 2)`` array with the curve points.
+        num_buckets (int): Number of equally wide x buckets, e.g. the plot width in pixels.
+
+    Returns:
+        np.ndarray: Sorted indexes of the points to keep, at most ``4 * num_buckets``.
+    """
+    if num_buckets < 1:
+        raise ValueError("num_buckets must be a positive integer")
+    num_points = len(points)
+    if num_points <= 4 * num_buckets:
+        return np.arange(num_points)
+
+    x, y = points[:, 0], points[:, 1]
+    x_min, x_range = x.min(), np.ptp(x)
+    if x_range > 0:
+        buckets = ((x - x_min) * (num_buckets / x_range)).astype(np.intp)
+        np.minimum(buckets, num_buckets - 1, out=buckets)
+    else:
+        buckets = np.zeros(num_points, dtype=np.intp)
+
+    # Sorted by bucket and then by y, the first/last point of each run is its min/max
+    order = np.lexsort((y, buckets))
+    sorted_buckets = buckets[order]
+    starts = np.flatnonzero(np.r_[True, sorted_buckets[1:] != sorted_buckets[:-1]])
+    ends = np.r_[starts[1:], num_points] - 1
+    selected = np.concatenate(
+        (
+            order[starts],
+            order[ends],
+            np.minimum.reduceat(order, starts),
+            np.maximum.reduceat(order, starts),
+        )
+    )
+    return np.unique(selected)
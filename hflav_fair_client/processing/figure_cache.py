@@ -0,0 +1,156 @@
+import hashlib
+import io
+import json
+import os
+import threading
+from collections import OrderedDict
+from types import SimpleNamespace
+from typing import Any, Dict, Optional
+
+from hflav_fair_client.logger import get_logger
+from hflav_fair_client.processing.plot_data_extractor import PlotData, extract_plot_data
+from hflav_fair_client.processing.plotter_interface import PlotterInterface
+
+logger = get_logger(__name__)
+
+
+def plot_data_hash(plot_data: PlotData, style: Dict[str, Any]) -> str:
+    """Hash the plotted values together with the parameters used to draw them."""
+    hasher = hashlib.sha256()
+    hasher.update(json.dumps(style, sort_keys=True, default=str).encode())
+    averages = plot_data.averages
+    hasher.update(json.dumps(averages.names).encode())
+    for array in (averages.central, averages.minus, averages.plus):
+        hasher.update(array.tobytes())
+    for series in (plot_data.contours, plot_data.scans):
+        hasher.update(json.dumps(series.names).encode())
+        for curve in series.curves:
+            hasher.update(len(curve).to_bytes(8, "little"))
+            hasher.update(curve.tobytes())
+    return hasher.hexdigest()
+
+
+class FigureCache:
+    """
+    Disk cache of rendered figures with size-bounded LRU eviction.
+
+    Figures are keyed by a hash of the plotted subset of the data (the extracted
+    averages, contours and scans) plus the plotter style and output format, so
+    unrelated changes in the data do not invalidate them. Rendered bytes are stored
+    as ``<key>.<format>`` files inside `cache_dir`; when their total size exceeds
+    `max_bytes` the least recently used ones are deleted.
+
+    Attributes:
+        cache_dir (str): Directory where the figures are stored.
+        max_bytes (int): Maximum total size of the stored figures.
+    """
+
+    def __init__(
+        self, cache_dir: str = "hflav_figure_cache", max_bytes: int = 100 * 1024**2
+    ):
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be non-negative")
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: Optional["OrderedDict[str, int]"] = None
+        self._total_bytes = 0
+
+    def _load_entries(self) -> "OrderedDict[str, int]":
+        if self._entries is None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            files = [
+                entry
+                for entry in os.scandir(self.cache_dir)
+                if entry.is_file() and not entry.name.endswith(".tmp")
+            ]
+            files.sort(key=lambda entry: entry.stat().st_mtime)
+            self._entries = OrderedDict(
+                (entry.name, entry.stat().st_size) for entry in files
+            )
+            self._total_bytes = sum(self._entries.values())
+        return self._entries
+
+    def _path(self, filename: str) -> str:
+        return os.path.join(self.cache_dir, filename)
+
+    def get(self, key: str, format: str) -> Optional[bytes]:
+        """Return the cached figure bytes, or None if they are not cached."""
+        filename = f"{key}.{format}"
+        with self._lock:
+            entries = self._load_entries()
+            if filename not in entries:
+                return None
+            try:
+                with open(self._path(filename), "rb") as f:
+                    content = f.read()
+            except FileNotFoundError:
+                self._total_bytes -= entries.pop(filename)
+                return None
+            entries.move_to_end(filename)
+            os.utime(self._path(filename))
+            return content
+
+    def put(self, key: str, format: str, content: bytes) -> None:
+        """Store the figure bytes, evicting the least recently used figures if needed."""
+        filename = f"{key}.{format}"
+        with self._lock:
+            entries = self._load_entries()
+            temporary_path = self._path(f"{filename}.{threading.get_ident()}.tmp")
+            with open(temporary_path, "wb") as f:
+                f.write(content)
+            os.replace(temporary_path, self._path(filename))
+
+            self._total_bytes += len(content) - entries.pop(filename, 0)
+            entries[filename] = len(content)
+            while self._total_bytes > self.max_bytes and entries:
+                evicted, size = entries.popitem(last=False)
+                self._total_bytes -= size
+                try:
+                    os.remove(self._path(evicted))
+                except FileNotFoundError:
+                    pass
+                logger.debug(f"Evicted cached figure {evicted}")
+
+    def clear(self) -> None:
+        """Delete every cached figure."""
+        with self._lock:
+            for filename in self._load_entries():
+                try:
+                    os.remove(self._path(filename))
+                except FileNotFoundError:
+                    pass
+            self._entries.clear()
+            self._total_bytes = 0
+
+    @property
+    def size_bytes(self) -> int:
+        with self._lock:
+            self._load_entries()
+            return self._total_bytes
+
+    def render(
+        self, plotter: PlotterInterface, data: SimpleNamespace, format: str = "png"
+    ) -> bytes:
+        """
+        Return the figure of `data` rendered by `plotter` in the given format.
+
+        The figure is only drawn with matplotlib when it is not already cached.
+
+        Raises:
+            ValueError: If the data does not contain anything that can be plotted.
+        """
+        format = format.lower().lstrip(".")
+        plot_data = extract_plot_data(data)
+        style = dict(plotter.style_parameters(), format=format)
+        key = plot_data_hash(plot_data, style)
+
+        content = self.get(key, format)
+        if content is not None:
+            return content
+
+        buffer = io.BytesIO()
+        plotter.draw(plot_data).savefig(buffer, format=format)
+        content = buffer.getvalue()
+        self.put(key, format, content)
+        return content
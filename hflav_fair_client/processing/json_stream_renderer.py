@@ -0,0 +1,105 @@
+import io
+import json
+from types import SimpleNamespace
+from typing import Any, Optional, TextIO
+
+
+class JsonStreamRenderer:
+    """Render namespaces, dicts and lists as indented JSON straight into a text stream.
+
+    Unlike ``json.dumps(namespace_to_dict(data))`` the object tree is written while it is
+    walked, without building an intermediate dict nor the whole string in memory.
+
+    Optional budgets keep the output of large documents readable, while the output is
+    still valid JSON:
+
+    - `max_items`: only the first items of every array/object are written, followed by
+      a ``"... N more items"`` marker (``"...": "N more keys"`` for objects).
+    - `max_depth`: arrays/objects nested deeper than this number of levels are written
+      as a ``"[...] (N items)"`` / ``"{...} (N keys)"`` summary string.
+
+    Example:
+        >>> renderer = JsonStreamRenderer(max_items=20)
+        >>> renderer.render(hflav_data, sys.stdout)  # First 20 averages of each group
+    """
+
+    def __init__(
+        self,
+        max_depth: Optional[int] = None,
+        max_items: Optional[int] = None,
+        indent: int = 4,
+    ):
+        if max_depth is not None and max_depth < 0:
+            raise ValueError("max_depth must be a non-negative integer")
+        if max_items is not None and max_items < 0:
+            raise ValueError("max_items must be a non-negative integer")
+        self.max_depth = max_depth
+        self.max_items = max_items
+        self.indent = indent
+
+    def render(self, data: Any, output: TextIO) -> None:
+        """Write `data` as JSON into `output`."""
+        self._render_value(data, output.write, 0)
+        output.write("\n")
+
+    def render_to_string(self, data: Any) -> str:
+        """Return `data` rendered as JSON."""
+        buffer = io.StringIO()
+        self._render_value(data, buffer.write, 0)
+        return buffer.getvalue()
+
+    def _render_value(self, value: Any, write, depth: int) -> None:
+        if isinstance(value, SimpleNamespace):
+            value = value.__dict__
+        if isinstance(value, dict):
+            self._render_object(value, write, depth)
+        elif isinstance(value, (list, tuple)):
+            self._render_array(value, write, depth)
+        else:
+            write(json.dumps(value, default=str))
+
+    def _collapsed(self, depth: int) -> bool:
+        return self.max_depth is not None and depth >= self.max_depth
+
+    def _render_object(self, obj: dict, write, depth: int) -> None:
+        if not obj:
+            write("{}")
+            return
+        if self._collapsed(depth):
+            write(json.dumps(f"{{...}} ({len(obj)} keys)"))
+            return
+        padding = "\n" + " " * (self.indent * (depth + 1))
+        separator = "{" + padding
+        shown = len(obj) if self.max_items is None else min(len(obj), self.max_items)
+        for i, (key, item) in enumerate(obj.items()):
+            if i == shown:
+                write(f'{separator}"...": "{len(obj) - shown} more keys"')
+                break
+            write(separator)
+            write(json.dumps(str(key)))
+            write(": ")
+            self._render_value(item, write, depth + 1)
+            separator = "," + padding
+        write("\n" + " " * (self.indent * depth) + "}")
+
+    def _render_array(self, array: list, write, depth: int) -> None:
+        if not array:
+            write("[]")
+            return
+        if self._collapsed(depth):
+            write(json.dumps(f"[...] ({len(array)} items)"))
+            return
+        padding = "\n" + " " * (self.indent * (depth + 1))
+        separator = "[" + padding
+        shown = (
+            len(array) if self.max_items is None else min(len(array), self.max_items)
+        )
+        if shown == 0:
+            write(f'{separator}"... {len(array)} more items"')
+        for i in range(shown):
+            write(separator)
+            self._render_value(array[i], write, depth + 1)
+            separator = "," + padding
+        if 0 < shown < len(array):
+            write(f'{separator}"... {len(array) - shown} more items"')
+        write("\n" + " " * (self.indent * depth) + "]")
@@ -0,0 +1,220 @@
+"""
+Extraction of the plottable parts of HFLAV data into NumPy arrays.
+
+Three kinds of objects are recognised, at any depth of the data:
+
+- Averages: items of an ``averages`` list with a central value (``value.central``,
+  ``central`` or a numeric ``value``) and an optional uncertainty (``value.uncertainty``
+  or ``uncertainty``), which can be symmetric (a number) or asymmetric (a
+  ``[minus, plus]`` pair or a ``{"minus": ..., "plus": ...}`` object).
+- Contours: items of a ``contours`` list whose ``points`` hold ``[x, y]`` pairs or an
+  ``{"x": [...], "y": [...]}`` object.
+- Scans: items of a ``scans`` list, with ``points`` in the same formats as contours.
+
+The data is walked once, without descending into the plotted objects themselves, so
+huge point arrays are never traversed node by node.
+"""
+
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+PLOT_OBJECT_NAMES = ("averages", "contours", "scans")
+
+
+class AverageSeries:
+    """Central values and (asymmetric) uncertainties of a list of averages."""
+
+    def __init__(
+        self,
+        names: List[str],
+        central: np.ndarray,
+        minus: np.ndarray,
+        plus: np.ndarray,
+    ):
+        self.names = names
+        self.central = central
+        self.minus = minus
+        self.plus = plus
+
+    def __len__(self) -> int:
+        return len(self.central)
+
+
+class CurveSeries:
+    """List of named curves, each one stored as an ``(n, 2)`` array of points."""
+
+    def __init__(self, names: List[str], curves: List[np.ndarray]):
+        self.names = names
+        self.curves = curves
+
+    def __len__(self) -> int:
+        return len(self.curves)
+
+    @property
+    def num_points(self) -> int:
+        return sum(len(curve) for curve in self.curves)
+
+
+class PlotData:
+    """Plottable content found inside a data object."""
+
+    def __init__(
+        self, averages: AverageSeries, contours: CurveSeries, scans: CurveSeries
+    ):
+        self.averages = averages
+        self.contours = contours
+        self.scans = scans
+
+    def is_empty(self) -> bool:
+        return not (len(self.averages) or len(self.contours) or len(self.scans))
+
+
+def _get(node: Any, key: str) -> Any:
+    if isinstance(node, SimpleNamespace):
+        return node.__dict__.get(key)
+    if isinstance(node, dict):
+        return node.get(key)
+    return None
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _name(node: Any, default: str) -> str:
+    name = _get(node, "name")
+    return str(name) if name is not None else default
+
+
+def _central_value(average: Any) -> Optional[float]:
+    value = _get(average, "value")
+    for candidate in (_get(value, "central"), _get(average, "central"), value):
+        if _is_number(candidate):
+            return float(candidate)
+    return None
+
+
+def _uncertainty(average: Any) -> Tuple[float, float]:
+    uncertainty = _get(_get(average, "value"), "uncertainty")
+    if uncertainty is None:
+        uncertainty = _get(average, "uncertainty")
+
+    if _is_number(uncertainty):
+        return abs(uncertainty), abs(uncertainty)
+    if isinstance(uncertainty, list) and len(uncertainty) == 2:
+        minus, plus = uncertainty
+    else:
+        minus, plus = _get(uncertainty, "minus"), _get(uncertainty, "plus")
+    if _is_number(minus) and _is_number(plus):
+        return abs(minus), abs(plus)
+    return 0.0, 0.0
+
+
+def _curve_points(curve: Any) -> Optional[np.ndarray]:
+    points = _get(curve, "points")
+    if points is None:
+        return None
+    x, y = _get(points, "x"), _get(points, "y")
+    try:
+        if x is not None and y is not None:
+            array = np.column_stack(
+                (np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64))
+            )
+        else:
+            array = np.asarray(points, dtype=np.float64)
+    except (TypeError, ValueError):
+        return None
+    if array.ndim != 2 or array.shape[1] != 2 or len(array) == 0:
+        return None
+    return array
+
+
+def _fields(node: Any) -> Optional[dict]:
+    if isinstance(node, SimpleNamespace):
+        return node.__dict__
+    if isinstance(node, dict):
+        return node
+    return None
+
+
+def _iter_plot_objects(data: Any) -> Iterator[Tuple[str, Any]]:
+    """Yield ``(object_name, item)`` for every item of a plottable list, in document order."""
+    stack = [data]
+    while stack:
+        current = stack.pop()
+        fields = _fields(current)
+        if fields is None:
+            if isinstance(current, list):
+                stack.extend(
+                    item
+                    for item in reversed(current)
+                    if isinstance(item, (list, dict, SimpleNamespace))
+                )
+            continue
+        children = []
+        for key, value in fields.items():
+            if key in PLOT_OBJECT_NAMES and isinstance(value, list):
+                for item in value:
+                    yield key, item
+            elif isinstance(value, (list, dict, SimpleNamespace)):
+                children.append(value)
+        stack.extend(reversed(children))
+
+
+def _build_averages(averages: List[Any]) -> AverageSeries:
+    names, central, minus, plus = [], [], [], []
+    for average in averages:
+        value = _central_value(average)
+        if value is None:
+            continue
+        lower, upper = _uncertainty(average)
+        names.append(_name(average, f"average_{len(names)}"))
+        central.append(value)
+        minus.append(lower)
+        plus.append(upper)
+    return AverageSeries(
+        names,
+        np.asarray(central, dtype=np.float64),
+        np.asarray(minus, dtype=np.float64),
+        np.asarray(plus, dtype=np.float64),
+    )
+
+
+def _build_curves(curves: List[Any], object_name: str) -> CurveSeries:
+    names, arrays = [], []
+    for curve in curves:
+        points = _curve_points(curve)
+        if points is None:
+            continue
+        names.append(_name(curve, f"{object_name}_{len(names)}"))
+        arrays.append(points)
+    return CurveSeries(names, arrays)
+
+
+def _collect(data: Any) -> Dict[str, List[Any]]:
+    objects: Dict[str, List[Any]] = {name: [] for name in PLOT_OBJECT_NAMES}
+    for object_name, item in _iter_plot_objects(data):
+        objects[object_name].append(item)
+    return objects
+
+
+def extract_averages(data: Any) -> AverageSeries:
+    """Collect every average holding a numeric central value."""
+    return _build_averages(_collect(data)["averages"])
+
+
+def extract_curves(data: Any, object_name: str) -> CurveSeries:
+    """Collect the points of every `object_name` item (``contours`` or ``scans``)."""
+    return _build_curves(_collect(data)[object_name], object_name)
+
+
+def extract_plot_data(data: Any) -> PlotData:
+    """Collect the averages, contours and scans stored anywhere inside `data`."""
+    objects = _collect(data)
+    return PlotData(
+        averages=_build_averages(objects["averages"]),
+        contours=_build_curves(objects["contours"], "contours"),
+        scans=_build_curves(objects["scans"], "scans"),
+    )
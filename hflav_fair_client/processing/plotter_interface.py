@@ -0,0 +1,62 @@
+from abc import ABC, abstractmethod
+from types import SimpleNamespace
+from typing import Any, Dict, Optional
+
+from matplotlib.figure import Figure
+
+from hflav_fair_client.processing.plot_data_extractor import PlotData
+
+
+class PlotterInterface(ABC):
+    """Abstract base class defining the interface for data plotters.
+
+    Implementations turn the physics content of HFLAV data (averages, contours,
+    likelihood scans...) into figures that can be shown or saved to disk.
+    """
+
+    @abstractmethod
+    def plot(
+        self,
+        data: SimpleNamespace,
+        save_path: Optional[str] = None,
+        figure: Optional[Figure] = None,
+    ) -> Figure:
+        """Plot the data and optionally save the figure.
+
+        Args:
+            data (SimpleNamespace): Data object (or any part of it) to plot.
+            save_path (Optional[str]): Path where the figure is saved. The format is
+                                       taken from its extension (png, svg, pdf...).
+            figure (Optional[Figure]): Existing figure, cleared and reused instead of
+                                       creating a new one.
+
+        Returns:
+            Figure: The generated matplotlib figure.
+
+        Raises:
+            ValueError: If the data does not contain anything that can be plotted.
+        """
+        pass
+
+    @abstractmethod
+    def draw(
+        self,
+        plot_data: PlotData,
+        save_path: Optional[str] = None,
+        figure: Optional[Figure] = None,
+    ) -> Figure:
+        """Plot already extracted `PlotData`, see `plot`.
+
+        Raises:
+            ValueError: If the plot data is empty.
+        """
+        pass
+
+    @abstractmethod
+    def style_parameters(self) -> Dict[str, Any]:
+        """Return the settings that change how the figures look.
+
+        Figures are cached by their data and these parameters, so two plotters with
+        the same parameters must draw the same figures.
+        """
+        pass
@@ -0,0 +1,334 @@
+"""
+Export of HFLAV data to normalized Arrow tables and Parquet files.
+
+The data is flattened into five tables, related by stable integer keys that are
+the positions of the objects in the document:
+
+- ``groups``: one row per group (``group_id``) with its fit.
+- ``averages``: one row per item of ``groups[*].averages`` (``group_id``,
+  ``average_id``).
+- ``sources``: one row per item of ``groups[*].inputs[*].sources`` (``group_id``,
+  ``input_id``, ``source_id``).
+- ``scan_points`` and ``contour_points``: one row per point of
+  ``groups[*].scans`` and ``groups[*].contours`` (``group_id``, ``scan_id`` or
+  ``contour_id``, ``point_id``).
+
+Uncertainties may be symmetric or asymmetric, so they are always split into
+``*_minus`` and ``*_plus`` columns.
+
+Groups are flattened and written one at a time, so the memory used by the export
+is bounded by the size of the largest group. pyarrow is an optional dependency,
+only imported when writing (``pip install hflav-fair-client[parquet]``).
+"""
+
+import os
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from hflav_fair_client.logger import get_logger
+from hflav_fair_client.models.hflav_query_engine import iter_search_candidates
+
+logger = get_logger(__name__)
+
+# Columns of every table as (name, Arrow type name)
+TABLE_COLUMNS: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "groups": (
+        ("group_id", "int64"),
+        ("name", "string"),
+        ("chi2", "float64"),
+        ("ndf", "int64"),
+        ("p", "float64"),
+    ),
+    "averages": (
+        ("group_id", "int64"),
+        ("average_id", "int64"),
+        ("name", "string"),
+        ("comment", "string"),
+        ("pdg_code", "string"),
+        ("central", "float64"),
+        ("uncertainty_minus", "float64"),
+        ("uncertainty_plus", "float64"),
+        ("statistical_minus", "float64"),
+        ("statistical_plus", "float64"),
+        ("systematic_minus", "float64"),
+        ("systematic_plus", "float64"),
+        ("upper_limit", "float64"),
+        ("unit", "string"),
+    ),
+    "sources": (
+        ("group_id", "int64"),
+        ("input_id", "int64"),
+        ("source_id", "int64"),
+        ("input_name", "string"),
+        ("name", "string"),
+        ("comment", "string"),
+        ("central", "float64"),
+        ("uncertainty_minus", "float64"),
+        ("uncertainty_plus", "float64"),
+        ("statistical_minus", "float64"),
+        ("statistical_plus", "float64"),
+        ("systematic_minus", "float64"),
+        ("systematic_plus", "float64"),
+        ("unit", "string"),
+        ("doi", "string"),
+        ("arxiv", "string"),
+    ),
+    "scan_points": (
+        ("group_id", "int64"),
+        ("scan_id", "int64"),
+        ("point_id", "int64"),
+        ("name", "string"),
+        ("x", "float64"),
+        ("y", "float64"),
+    ),
+    "contour_points": (
+        ("group_id", "int64"),
+        ("contour_id", "int64"),
+        ("point_id", "int64"),
+        ("name", "string"),
+        ("cl", "float64"),
+        ("x", "float64"),
+        ("y", "float64"),
+    ),
+}
+
+Columns = Dict[str, List[Any]]
+
+
+def _import_pyarrow() -> Tuple[Any, Any]:
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            "Exporting to Arrow or Parquet requires pyarrow, install it with "
+            "'pip install hflav-fair-client[parquet]'"
+        ) from e
+    return pyarrow, pyarrow.parquet
+
+
+def _get(node: Any, key: str) -> Any:
+    if isinstance(node, SimpleNamespace):
+        return node.__dict__.get(key)
+    if isinstance(node, dict):
+        return node.get(key)
+    return None
+
+
+def _items(node: Any, key: str) -> List[Any]:
+    value = _get(node, key)
+    return value if isinstance(value, list) else []
+
+
+def _number(value: Any) -> Optional[float]:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, list) and value:
+        return _number(value[0])
+    return None
+
+
+def _integer(value: Any) -> Optional[int]:
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    return None
+
+
+def _text(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def _minus_plus(value: Any) -> Tuple[Optional[float], Optional[float]]:
+    """Split a symmetric (number) or asymmetric (``[minus, plus]``) uncertainty."""
+    if isinstance(value, list) and len(value) == 2:
+        return _number(value[0]), _number(value[1])
+    if isinstance(value, list) and len(value) == 1:
+        value = value[0]
+    if isinstance(value, (SimpleNamespace, dict)):
+        return _number(_get(value, "minus")), _number(_get(value, "plus"))
+    number = _number(value)
+    return number, number
+
+
+def _value_columns(value: Any) -> Dict[str, Any]:
+    central = (
+        _get(value, "central") if isinstance(value, (SimpleNamespace, dict)) else value
+    )
+    row = {"central": _number(central), "unit": _text(_get(value, "unit"))}
+    for name in ("uncertainty", "statistical", "systematic"):
+        row[f"{name}_minus"], row[f"{name}_plus"] = _minus_plus(_get(value, name))
+    return row
+
+
+def _xy_points(curve: Any) -> Iterator[Tuple[Optional[float], Optional[float]]]:
+    points = _get(curve, "points")
+    x, y = _get(points, "x"), _get(points, "y")
+    if isinstance(x, list) and isinstance(y, list):
+        yield from ((_number(a), _number(b)) for a, b in zip(x, y))
+        return
+    x_values = _items(_get(curve, "x"), "values")
+    for index, point in enumerate(points if isinstance(points, list) else []):
+        if isinstance(point, list) and len(point) >= 2:
+            yield _number(point[0]), _number(point[1])
+        else:
+            x = x_values[index] if index < len(x_values) else None
+            yield _number(x), _number(point)
+
+
+def _empty_tables() -> Dict[str, Columns]:
+    return {
+        table: {name: [] for name, _ in columns}
+        for table, columns in TABLE_COLUMNS.items()
+    }
+
+
+def _append(columns: Columns, row: Dict[str, Any]) -> None:
+    for name, values in columns.items():
+        values.append(row.get(name))
+
+
+def flatten_group(group: Any, group_id: int) -> Dict[str, Columns]:
+    """Flatten a group into the columns of every table, see `TABLE_COLUMNS`."""
+    tables = _empty_tables()
+    fit = _get(group, "fit")
+    _append(
+        tables["groups"],
+        {
+            "group_id": group_id,
+            "name": _text(_get(group, "name")),
+            "chi2": _number(_get(fit, "chi2")),
+            "ndf": _integer(_get(fit, "ndf")),
+            "p": _number(_get(fit, "p")),
+        },
+    )
+
+    for average_id, average in enumerate(_items(group, "averages")):
+        value = _get(_get(average, "average"), "value") or _get(average, "value")
+        row = _value_columns(value)
+        row.update(
+            group_id=group_id,
+            average_id=average_id,
+            name=_text(_get(average, "name")),
+            comment=_text(_get(average, "comment")),
+            pdg_code=_text(_get(average, "PDGcode")),
+            upper_limit=_number(_get(value, "upperlimit")),
+        )
+        _append(tables["averages"], row)
+
+    for input_id, group_input in enumerate(_items(group, "inputs")):
+        for source_id, source in enumerate(_items(group_input, "sources")):
+            references = _get(source, "references")
+            row = _value_columns(_get(source, "value"))
+            row.update(
+                group_id=group_id,
+                input_id=input_id,
+                source_id=source_id,
+                input_name=_text(_get(group_input, "name")),
+                name=_text(_get(source, "name")),
+                comment=_text(_get(source, "comment")),
+                doi=_text(_get(references, "doi")),
+                arxiv=_text(_get(references, "arxiv")),
+            )
+            _append(tables["sources"], row)
+
+    for table, object_name, key in (
+        ("scan_points", "scans", "scan_id"),
+        ("contour_points", "contours", "contour_id"),
+    ):
+        for curve_id, curve in enumerate(_items(group, object_name)):
+            common = {
+                "group_id": group_id,
+                key: curve_id,
+                "name": _text(_get(curve, "name")),
+                "cl": _number(_get(curve, "CL")),
+            }
+            for point_id, (x, y) in enumerate(_xy_points(curve)):
+                _append(tables[table], dict(common, point_id=point_id, x=x, y=y))
+    return tables
+
+
+def iter_group_tables(data: Any) -> Iterator[Dict[str, Columns]]:
+    """Yield the flattened tables of every group of `data`, one group at a time."""
+    for group_id, group in enumerate(iter_search_candidates(data, "groups")):
+        yield flatten_group(group, group_id)
+
+
+class TableExporter:
+    """
+    Write the groups of HFLAV data as normalized Arrow tables or Parquet files.
+
+    Attributes:
+        compression (str): Parquet compression codec.
+    """
+
+    def __init__(self, compression: str = "zstd"):
+        self.compression = compression
+
+    @staticmethod
+    def arrow_schemas() -> Dict[str, Any]:
+        """Return the Arrow schema of every table."""
+        pyarrow, _ = _import_pyarrow()
+        return {
+            table: pyarrow.schema(
+                [(name, getattr(pyarrow, type_name)()) for name, type_name in columns]
+            )
+            for table, columns in TABLE_COLUMNS.items()
+        }
+
+    def to_arrow(self, data: Any) -> Dict[str, Any]:
+        """Return every table of `data` as an in-memory ``pyarrow.Table``."""
+        pyarrow, _ = _import_pyarrow()
+        schemas = self.arrow_schemas()
+        batches: Dict[str, list] = {table: [] for table in TABLE_COLUMNS}
+        for tables in iter_group_tables(data):
+            for table, columns in tables.items():
+                batches[table].append(
+                    pyarrow.RecordBatch.from_pydict(columns, schema=schemas[table])
+                )
+        return {
+            table: pyarrow.Table.from_batches(batches[table], schema=schemas[table])
+            for table in TABLE_COLUMNS
+        }
+
+    def write_parquet(self, data: Any, output_dir: str) -> Dict[str, str]:
+        """
+        Write every table of `data` to ``output_dir/<table>.parquet``, streaming
+        one row group per group of the data. String columns are dictionary encoded.
+
+        Returns:
+            Dict[str, str]: The path of the file of every table.
+        """
+        pyarrow, parquet = _import_pyarrow()
+        os.makedirs(output_dir, exist_ok=True)
+        schemas = self.arrow_schemas()
+        paths = {
+            table: os.path.join(output_dir, f"{table}.parquet")
+            for table in TABLE_COLUMNS
+        }
+        writers = {
+            table: parquet.ParquetWriter(
+                paths[table],
+                schemas[table],
+                compression=self.compression,
+                use_dictionary=[
+                    name for name, type_name in columns if type_name == "string"
+                ],
+            )
+            for table, columns in TABLE_COLUMNS.items()
+        }
+        num_groups = 0
+        try:
+            for tables in iter_group_tables(data):
+                num_groups += 1
+                for table, columns in tables.items():
+                    if columns["group_id"]:
+                        writers[table].write_batch(
+                            pyarrow.RecordBatch.from_pydict(
+                                columns, schema=schemas[table]
+                            )
+                        )
+        finally:
+            for writer in writers.values():
+                writer.close()
+        logger.info(f"Exported {num_groups} groups to Parquet files in {output_dir}")
+        return paths
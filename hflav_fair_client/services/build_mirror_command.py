@@ -0,0 +1,128 @@
+import json
+import os
+from typing import Dict, List, Optional, Sequence
+
+from dependency_injector.wiring import inject, Provide
+from gitlab.exceptions import GitlabError
+from requests import RequestException
+
+from hflav_fair_client.exceptions.source_exceptions import (
+    DataAccessException,
+    SourceException,
+)
+from hflav_fair_client.filters.search_filters import Filter
+from hflav_fair_client.logger import get_logger
+from hflav_fair_client.services.command import Command
+from hflav_fair_client.services.sync_records_command import (
+    SyncRecords,
+    SyncState,
+    mirror_record,
+)
+from hflav_fair_client.source.source_mirror import (
+    read_index,
+    schema_path,
+    write_index,
+)
+from hflav_fair_client.source.source_zenodo_requests import SourceZenodoRequest
+
+logger = get_logger(__name__)
+
+
+class BuildMirror(Command):
+    """
+    Build or update a local mirror of the HFLAV community, to be served offline by
+    `SourceMirror` and `SourceGitlabMirror`.
+
+    The records are synchronized with `SyncRecords`, then every version of the data
+    file template is mirrored with its files and the schema of every GitLab tag of
+    `schema_versions` is stored in ``schemas/``. Templates and schemas that cannot
+    be fetched keep their previously mirrored copy.
+    """
+
+    @inject
+    def __init__(
+        self,
+        mirror_dir: str,
+        filter: Optional[Filter] = None,
+        schema_versions: Sequence[str] = ("main",),
+        source: SourceZenodoRequest = Provide["zenodo_source"],
+        gitlab_client_provider=Provide["gitlab_client.provider"],
+    ):
+        self._mirror_dir = mirror_dir
+        self._filter = filter
+        self._schema_versions = schema_versions
+        self._source = source
+        self._gitlab_client_provider = gitlab_client_provider
+
+    def _mirror_templates(self) -> Optional[List[int]]:
+        try:
+            templates = self._source.get_template_versions()
+        except DataAccessException as e:
+            logger.error(f"Could not list the template versions: {e}")
+            return None
+
+        state = SyncState(self._mirror_dir)
+        for template in templates:
+            stored = state.records.get(str(template.rec_id), {})
+            updated = template.updated.isoformat()
+            if stored.get("updated") == updated:
+                continue
+            try:
+                entry, _ = mirror_record(
+                    self._source, self._mirror_dir, template.rec_id, stored
+                )
+            except (DataAccessException, OSError) as e:
+                logger.error(f"Could not mirror template {template.rec_id}: {e}")
+                continue
+            entry["updated"] = updated
+            state.records[str(template.rec_id)] = entry
+            state.save()
+        return [
+            template.rec_id
+            for template in templates
+            if str(template.rec_id) in state.records
+        ]
+
+    def _mirror_schemas(self) -> List[str]:
+        try:
+            gitlab_client = self._gitlab_client_provider()
+        except (GitlabError, RequestException) as e:
+            logger.error(f"Could not connect to the GitLab repository: {e}")
+            return []
+
+        mirrored = []
+        for tag in self._schema_versions:
+            try:
+                schema = gitlab_client.get_schema_inside_repository(tag)
+            except (SourceException, GitlabError, RequestException, ValueError) as e:
+                logger.error(f"Could not mirror the schema of tag {tag}: {e}")
+                continue
+            path = schema_path(self._mirror_dir, tag)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump(schema, file)
+            mirrored.append(tag)
+        return mirrored
+
+    def execute(self) -> Dict[str, List]:
+        summary = SyncRecords(
+            mirror_dir=self._mirror_dir, filter=self._filter, source=self._source
+        ).execute()
+        templates = self._mirror_templates()
+        schemas = self._mirror_schemas()
+        previous_schemas = read_index(self._mirror_dir)["schemas"]
+        index = write_index(
+            self._mirror_dir,
+            templates=templates,
+            schemas=list(dict.fromkeys([*previous_schemas, *schemas])),
+        )
+        summary["templates"] = [int(template) for template in index["templates"]]
+        summary["schemas"] = list(index["schemas"])
+        logger.info(
+            f"Mirror {self._mirror_dir} built: {len(index['records'])} records, "
+            f"{len(summary['templates'])} templates, {len(summary['schemas'])} schemas"
+        )
+        return summary
+
+    def undo(self):
+        logger.info("Undo operation is not supported for building a mirror.")
@@ -1,16 +1,40 @@
+import os
+import tempfile
 from types import SimpleNamespace
-from typing import Optional, List
+from typing import Any, Dict, Iterator, Optional, List, Sequence, Union
 
 from dependency_injector.wiring import inject, Provide
+from matplotlib.figure import Figure
 
+from hflav_fair_client.conversors.bulk_loader import BulkLoader, BulkLoadResult
 from hflav_fair_client.conversors.conversor_interface import ConversorInterface
-from hflav_fair_client.exceptions.source_exceptions import DataAccessException
+from hflav_fair_client.conversors.snapshot import (
+    file_checksum,
+    read_snapshot,
+    write_snapshot,
+)
+from hflav_fair_client.exceptions.conversor_exceptions import (
+    ConversorException,
+    SnapshotException,
+)
+from hflav_fair_client.exceptions.source_exceptions import (
+    DataAccessException,
+    SourceException,
+)
 from hflav_fair_client.filters.base_query import BaseQuery
-from hflav_fair_client.models.models import Record
+from hflav_fair_client.filters.search_filters import Filter
+from hflav_fair_client.models.models import Record, RecordSummary
+from hflav_fair_client.processing.batch_plotter import BatchPlotter
+from hflav_fair_client.processing.dataset_store import DatasetStore
+from hflav_fair_client.processing.figure_cache import FigureCache
+from hflav_fair_client.processing.plotter_interface import PlotterInterface
+from hflav_fair_client.processing.table_exporter import TableExporter
 from hflav_fair_client.services.command import CommandInvoker
 from hflav_fair_client.services.search_and_load_data_file_command import (
     SearchAndLoadDataFile,
 )
+from hflav_fair_client.services.build_mirror_command import BuildMirror
+from hflav_fair_client.services.sync_records_command import SyncRecords
 from hflav_fair_client.source.source_interface import SourceInterface
 from hflav_fair_client.logger import get_logger
 from hflav_fair_client.services.service_interface import ServiceInterface
@@ -26,23 +50,46 @@ class Service(ServiceInterface):
         conversor: ConversorInterface = Provide["conversor"],
         command_invoker: CommandInvoker = Provide["command_invoker"],
         handler_schema_chain=Provide["handler_schema_chain"],
+        verbose: bool = Provide["verbose"],
+        plotter: PlotterInterface = Provide["plotter"],
+        figure_cache: FigureCache = Provide["figure_cache"],
+        store: DatasetStore = Provide["store"],
     ) -> None:
         self._source = source
         self._conversor = conversor
         self._command_invoker = command_invoker
         self._handler_schema_chain = handler_schema_chain
+        self._verbose = verbose
+        self._plotter = plotter
+        self._figure_cache = figure_cache
+        self._store = store
 
-    def search_records_by_name(self, query: BaseQuery) -> List[Record]:
+    def search_records_by_name(
+        self, query: BaseQuery, lean: bool = False
+    ) -> List[Union[Record, RecordSummary]]:
         try:
-            records = self._source.get_records_by_name(query=query)
+            records = self._source.get_records_by_name(query=query, lean=lean)
         except DataAccessException as e:
             logger.error(f"Error while searching records: {e}")
             return []
         logger.info(f"Found {len(records)} records matching query '{str(query)}':")
-        for i, record in enumerate(records):
-            logger.info(f"{i+1}: {record}")
+        if self._verbose:
+            for i, record in enumerate(records):
+                logger.info(f"{i+1}: {record}")
         return records
 
+    def iter_records(
+        self, query: BaseQuery, lean: bool = False
+    ) -> Iterator[Union[Record, RecordSummary]]:
+        count = 0
+        try:
+            for record in self._source.iter_records(query=query, lean=lean):
+                count += 1
+                yield record
+        except DataAccessException as e:
+            logger.error(f"Error while searching records: {e}")
+        logger.info(f"Iterated over {count} records matching query '{str(query)}'")
+
     def search_and_load_data_file(self, query: BaseQuery) -> SimpleNamespace:
         self._command_invoker.set_command(
             SearchAndLoadDataFile(service=self, query=query)
@@ -89,7 +136,148 @@ class Service(ServiceInterface):
             validate=validate,
         )
 
+    def load_local_data_file_with_snapshot(
+        self,
+        file_path: str,
+        schema_path: Optional[str] = None,
+        validate: bool = True,
+        snapshot_path: Optional[str] = None,
+    ) -> SimpleNamespace:
+        snapshot_path = snapshot_path or f"{file_path}.snapshot"
+        source_checksum = file_checksum(file_path)
+        if not validate:
+            schema_hash = "unvalidated"
+        elif schema_path:
+            schema_hash = file_checksum(schema_path)
+        else:
+            schema_hash = "inferred"
+
+        if os.path.isfile(snapshot_path):
+            try:
+                data = read_snapshot(snapshot_path, source_checksum, schema_hash)
+                logger.info(f"Data loaded from snapshot {snapshot_path}")
+                return data
+            except SnapshotException as e:
+                logger.info(f"Ignoring snapshot {snapshot_path}: {e.details}")
+
+        data = self.load_local_data_file_from_path(
+            file_path=file_path, schema_path=schema_path, validate=validate
+        )
+        try:
+            write_snapshot(snapshot_path, data, source_checksum, schema_hash)
+            logger.info(f"Snapshot written to {snapshot_path}")
+        except OSError as e:
+            logger.warning(f"Could not write snapshot {snapshot_path}: {e}")
+        return data
+
+    def load_local_data_files_from_paths(
+        self,
+        file_paths: Sequence[str],
+        schema_path: Optional[str] = None,
+        validate: bool = True,
+        max_workers: Optional[int] = None,
+    ) -> BulkLoadResult:
+        return BulkLoader(self._conversor, max_workers=max_workers).load(
+            file_paths, schema_path=schema_path, validate=validate
+        )
+
+    def sync_records(
+        self, mirror_dir: str, filter: Optional[Filter] = None
+    ) -> Dict[str, List[int]]:
+        self._command_invoker.set_command(
+            SyncRecords(mirror_dir=mirror_dir, filter=filter)
+        )
+        return self._command_invoker.execute_command()
+
+    def build_mirror(
+        self,
+        mirror_dir: str,
+        filter: Optional[Filter] = None,
+        schema_versions: Sequence[str] = ("main",),
+    ) -> Dict[str, List]:
+        self._command_invoker.set_command(
+            BuildMirror(
+                mirror_dir=mirror_dir, filter=filter, schema_versions=schema_versions
+            )
+        )
+        return self._command_invoker.execute_command()
+
+    def ingest_records(
+        self, query: BaseQuery, dest_path: Optional[str] = None
+    ) -> Dict[str, List[int]]:
+        summary: Dict[str, List[int]] = {"ingested": [], "skipped": [], "failed": []}
+        try:
+            for record in self._source.iter_records(query=query):
+                if not self._store.needs_update(record):
+                    logger.info(f"Record {record.id} is up to date, skipping it")
+                    summary["skipped"].append(record.id)
+                    continue
+                with tempfile.TemporaryDirectory() as download_dir:
+                    try:
+                        datasets = {
+                            child.name: self.load_data_file(
+                                record.id,
+                                child.name,
+                                dest_path=dest_path or download_dir,
+                            )
+                            for child in record.children or []
+                            if child.name.endswith(".json")
+                        }
+                    except (SourceException, ConversorException) as e:
+                        logger.error(f"Could not ingest record {record.id}: {e}")
+                        summary["failed"].append(record.id)
+                        continue
+                self._store.ingest(record, datasets)
+                summary["ingested"].append(record.id)
+        except DataAccessException as e:
+            logger.error(f"Error while searching records: {e}")
+        logger.info(
+            f"Ingested {len(summary['ingested'])} records, "
+            f"{len(summary['skipped'])} up to date, {len(summary['failed'])} failed"
+        )
+        return summary
+
+    def query_averages(
+        self,
+        name: Optional[str] = None,
+        pdg_code: Optional[str] = None,
+        name_like: Optional[str] = None,
+        record_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        return self._store.query_averages(
+            name=name,
+            pdg_code=pdg_code,
+            name_like=name_like,
+            record_id=record_id,
+            limit=limit,
+        )
+
     def plot_data(
         self, data_object: SimpleNamespace, save_path: Optional[str] = None
-    ) -> None:
-        return None
+    ) -> Figure:
+        figure = self._plotter.plot(data_object, save_path=save_path)
+        if save_path:
+            logger.info(f"Plot saved to {save_path}")
+        return figure
+
+    def render_plot(self, data_object: SimpleNamespace, format: str = "png") -> bytes:
+        return self._figure_cache.render(self._plotter, data_object, format=format)
+
+    def export_tables(
+        self, data_object: SimpleNamespace, output_dir: str
+    ) -> Dict[str, str]:
+        logger.info(f"Exporting tables to {output_dir}...")
+        return TableExporter().write_parquet(data_object, output_dir)
+
+    def plot_groups(
+        self,
+        data_object: SimpleNamespace,
+        output_dir: str,
+        formats: Sequence[str] = ("png",),
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        logger.info(f"Plotting groups to {output_dir}...")
+        return BatchPlotter(self._plotter, max_workers=max_workers).plot_groups(
+            data_object, output_dir, formats=formats
+        )
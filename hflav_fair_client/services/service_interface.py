@@ -7,10 +7,14 @@ implementations (remote service, cached service, etc.).
 
 from abc import ABC, abstractmethod
 from types import SimpleNamespace
-from typing import Optional, List
+from typing import Any, Dict, Iterator, Optional, List, Sequence, Union
 
+from matplotlib.figure import Figure
+
+from hflav_fair_client.conversors.bulk_loader import BulkLoadResult
 from hflav_fair_client.filters.base_query import BaseQuery
-from hflav_fair_client.models.models import Record
+from hflav_fair_client.filters.search_filters import Filter
+from hflav_fair_client.models.models import Record, RecordSummary
 
 
 class ServiceInterface(ABC):
@@ -21,11 +25,27 @@ class ServiceInterface(ABC):
     """
 
     @abstractmethod
-    def search_records_by_name(self, query: BaseQuery) -> List[Record]:
+    def search_records_by_name(
+        self, query: BaseQuery, lean: bool = False
+    ) -> List[Union[Record, RecordSummary]]:
         """Search records by textual query.
 
-        Returns a list of `Record` objects; should never raise on data access
-        errors but instead return an empty list or handle logging internally.
+        Returns a list of `Record` objects, or of lightweight `RecordSummary`
+        objects when `lean` is set; should never raise on data access errors but
+        instead return an empty list or handle logging internally.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_records(
+        self, query: BaseQuery, lean: bool = False
+    ) -> Iterator[Union[Record, RecordSummary]]:
+        """Iterate over every record matching the query, following the pagination.
+
+        Pages are requested lazily while iterating, at most one page ahead, so
+        stopping the iteration stops the requests (a page already being requested
+        completes in the background and is discarded). Data access errors end the
+        iteration and are logged.
         """
         raise NotImplementedError
 
@@ -63,16 +83,188 @@ class ServiceInterface(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def load_local_data_file_with_snapshot(
+        self,
+        file_path: str,
+        schema_path: Optional[str] = None,
+        validate: bool = True,
+        snapshot_path: Optional[str] = None,
+    ) -> SimpleNamespace:
+        """
+        Load a local file through a binary snapshot of its loaded data.
+
+        If the snapshot matches the checksum of the file and the schema, it is read
+        without parsing nor validating the file. Otherwise the file is loaded as in
+        `load_local_data_file_from_path` and the snapshot is (re)written.
+
+        Parameters:
+            file_path (str): The path to the data file.
+            schema_path (Optional[str]): The path to the schema file for validation.
+            validate (bool): Whether to validate the data against the schema.
+            snapshot_path (Optional[str]): The path to the snapshot, by default the
+                                           data file path with a ``.snapshot`` suffix.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def load_local_data_files_from_paths(
+        self,
+        file_paths: Sequence[str],
+        schema_path: Optional[str] = None,
+        validate: bool = True,
+        max_workers: Optional[int] = None,
+    ) -> BulkLoadResult:
+        """
+        Load many local files, distributing them over a pool of processes.
+
+        Parameters:
+            file_paths (Sequence[str]): The paths to the data files.
+            schema_path (Optional[str]): The path to the schema file for validation.
+            validate (bool): Whether to validate the data against the schema.
+            max_workers (Optional[int]): Number of processes loading the files.
+        Returns:
+            BulkLoadResult: The loaded data and errors by path, and the timings.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def sync_records(
+        self, mirror_dir: str, filter: Optional[Filter] = None
+    ) -> Dict[str, List[int]]:
+        """
+        Update a local mirror of the HFLAV community with the records changed since
+        the last sync, downloading only the files whose checksum changed.
+        Parameters:
+            mirror_dir (str): Directory of the mirror, created if needed.
+            filter (Optional[Filter]): Restricts the synchronized records.
+        Returns:
+            Dict[str, List[int]]: Ids of the ``synced``, ``unchanged`` and ``failed``
+                                  records.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def build_mirror(
+        self,
+        mirror_dir: str,
+        filter: Optional[Filter] = None,
+        schema_versions: Sequence[str] = ("main",),
+    ) -> Dict[str, List]:
+        """
+        Build or update a local mirror of the HFLAV community with its records, the
+        versions of the data file template and the schemas of the GitLab
+        repository, so it can be used offline with ``HFLAV_SOURCE=mirror``.
+        Parameters:
+            mirror_dir (str): Directory of the mirror, created if needed.
+            filter (Optional[Filter]): Restricts the mirrored records.
+            schema_versions (Sequence[str]): GitLab tags whose schema is mirrored.
+        Returns:
+            Dict[str, List]: Ids of the ``synced``, ``unchanged`` and ``failed``
+                             records, ids of the mirrored ``templates`` and tags of
+                             the mirrored ``schemas``.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def ingest_records(
+        self, query: BaseQuery, dest_path: Optional[str] = None
+    ) -> Dict[str, List[int]]:
+        """
+        Load the JSON data files of every record matching the query, page after
+        page, into the local dataset store. Records whose ``updated`` timestamp did
+        not change since they were stored are skipped. If a page of the search
+        fails, the records of the previous pages are kept.
+        Parameters:
+            query (BaseQuery): The query selecting the records.
+            dest_path (Optional[str]): Directory where the files are downloaded, a
+                                       temporary one by default.
+        Returns:
+            Dict[str, List[int]]: Ids of the ``ingested``, ``skipped`` and ``failed``
+                                  records.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def query_averages(
+        self,
+        name: Optional[str] = None,
+        pdg_code: Optional[str] = None,
+        name_like: Optional[str] = None,
+        record_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Query the averages of every record stored with `ingest_records`.
+        Parameters:
+            name (Optional[str]): Exact name of the average.
+            pdg_code (Optional[str]): PDG code of the average.
+            name_like (Optional[str]): SQL ``LIKE`` pattern on the name.
+            record_id (Optional[int]): Record the averages belong to.
+            limit (Optional[int]): Maximum number of rows returned.
+        Returns:
+            List[Dict[str, Any]]: The matching averages, newest records first.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def plot_data(
         self, data_object: SimpleNamespace, save_path: Optional[str] = None
-    ) -> None:
+    ) -> Figure:
         """
         Plot data from the given data object.
         Parameters:
             data_object (SimpleNamespace): The data object to plot.
             save_path (Optional[str]): The path to save the plot.
         Returns:
-            None
+            Figure: The generated figure.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def render_plot(self, data_object: SimpleNamespace, format: str = "png") -> bytes:
+        """
+        Render the plot of the given data object, reusing a cached rendering when the
+        plotted data and style did not change.
+        Parameters:
+            data_object (SimpleNamespace): The data object to plot.
+            format (str): Output format (png, svg, pdf).
+        Returns:
+            bytes: The rendered figure.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def export_tables(
+        self, data_object: SimpleNamespace, output_dir: str
+    ) -> Dict[str, str]:
+        """
+        Export the groups, averages, sources, scans and contours of the data object
+        as normalized Parquet tables. Requires the optional pyarrow dependency.
+        Parameters:
+            data_object (SimpleNamespace): The data object to export.
+            output_dir (str): Directory where the Parquet files are written.
+        Returns:
+            Dict[str, str]: The path of the file of every table.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def plot_groups(
+        self,
+        data_object: SimpleNamespace,
+        output_dir: str,
+        formats: Sequence[str] = ("png",),
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Plot every group of the data object into its own figure file.
+        Parameters:
+            data_object (SimpleNamespace): The data object whose groups are plotted.
+            output_dir (str): Directory where the figures and the manifest are written.
+            formats (Sequence[str]): Formats to save each figure in (png, svg, pdf).
+            max_workers (Optional[int]): Number of processes rendering the figures.
+        Returns:
+            Dict[str, Any]: The manifest describing the generated files.
         """
         raise NotImplementedError
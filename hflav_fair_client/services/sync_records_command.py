@@ -0,0 +1,220 @@
+import json
+import os
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from dependency_injector.wiring import inject, Provide
+
+from hflav_fair_client.exceptions.source_exceptions import DataAccessException
+from hflav_fair_client.filters.search_filters import (
+    AndFilter,
+    DateRangeFilter,
+    Filter,
+    SortOptions,
+)
+from hflav_fair_client.logger import get_logger
+from hflav_fair_client.services.command import Command
+from hflav_fair_client.source.source_mirror import (
+    record_file_path,
+    record_files_dir,
+    record_path,
+    write_index,
+)
+from hflav_fair_client.source.source_zenodo_requests import SourceZenodoRequest
+
+logger = get_logger(__name__)
+
+
+class SyncState:
+    """
+    Progress of the synchronization of a mirror directory, stored as
+    ``sync_state.json`` inside it.
+
+    Attributes:
+        path (str): Path of the state file.
+        watermark (Optional[str]): UTC start time of the last complete sync.
+        records (Dict[str, Dict[str, Any]]): ``updated`` timestamp, ETag and file
+                                             checksums of every mirrored record.
+    """
+
+    FILENAME = "sync_state.json"
+
+    def __init__(self, mirror_dir: str):
+        self.path = os.path.join(mirror_dir, self.FILENAME)
+        self.watermark: Optional[str] = None
+        self.records: Dict[str, Dict[str, Any]] = {}
+        if os.path.isfile(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as file:
+                    state = json.load(file)
+                self.watermark = state.get("watermark")
+                self.records = state.get("records", {})
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable sync state {self.path}: {e}")
+
+    def save(self) -> None:
+        """Write the state atomically, so an interrupted sync keeps the last one."""
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump({"watermark": self.watermark, "records": self.records}, file)
+        os.replace(temp_path, self.path)
+
+
+def mirror_record(
+    source: SourceZenodoRequest,
+    mirror_dir: str,
+    record_id: int,
+    stored: Dict[str, Any],
+) -> Tuple[Dict[str, Any], int]:
+    """
+    Update a record of a mirror and download its changed files.
+
+    Requests skip the HTTP cache, and every file is checked against its checksum
+    and only replaces the mirrored copy once complete, so the stored checksums
+    always describe the files on disk.
+
+    Parameters:
+        source (SourceZenodoRequest): Source the record is fetched from.
+        mirror_dir (str): Directory of the mirror.
+        record_id (int): Id of the record.
+        stored (Dict[str, Any]): Sync state entry of the record (ETag and file
+                                 checksums), empty if it is not mirrored yet.
+    Returns:
+        Tuple[Dict[str, Any], int]: The new state entry of the record (`stored`
+        itself when it is unchanged) and the number of downloaded files.
+    """
+    data, etag = source.get_record_if_modified(record_id, stored.get("etag"))
+    if data is None:
+        return stored, 0
+
+    os.makedirs(record_files_dir(mirror_dir, record_id), exist_ok=True)
+    old_checksums = stored.get("files", {})
+    checksums = {}
+    downloaded = 0
+    for file in data.get("files", []):
+        name = file.get("key", "")
+        if not name or os.path.basename(name) != name:
+            logger.warning(f"Skipping file {name!r} of record {record_id}")
+            continue
+        checksum = file.get("checksum")
+        path = record_file_path(mirror_dir, record_id, name)
+        if (
+            checksum is None
+            or old_checksums.get(name) != checksum
+            or not os.path.isfile(path)
+        ):
+            source.download_file(
+                file.get("links", {}).get("self", ""),
+                path,
+                checksum=checksum,
+                bypass_cache=True,
+            )
+            downloaded += 1
+        checksums[name] = checksum
+    for name in set(old_checksums) - set(checksums):
+        path = record_file_path(mirror_dir, record_id, name)
+        if os.path.isfile(path):
+            os.remove(path)
+
+    path = record_path(mirror_dir, record_id)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as file:
+        json.dump(data, file)
+    os.replace(temp_path, path)
+    return {"etag": etag, "files": checksums}, downloaded
+
+
+class SyncRecords(Command):
+    """
+    Bring a local mirror of the HFLAV community up to date.
+
+    Only the records updated since the last complete sync are searched
+    (``updated:[<watermark> TO *]``). Each of them is fetched with its stored ETag,
+    so unchanged records cost a 304 response, and only the files whose checksum
+    changed are downloaded. The mirror directory holds:
+
+    - ``records/<id>.json``: the JSON of every record.
+    - ``files/<id>/<filename>``: its files.
+    - ``sync_state.json``: see `SyncState`.
+    - ``index.json``: the index read by `SourceMirror`, rewritten after every sync.
+
+    The watermark only moves forward when every record was synchronized, so
+    failed records are retried by the next sync.
+    """
+
+    @inject
+    def __init__(
+        self,
+        mirror_dir: str,
+        filter: Optional[Filter] = None,
+        page_size: int = 100,
+        source: SourceZenodoRequest = Provide["zenodo_source"],
+        query_class=Provide["base_query"],
+    ):
+        self._mirror_dir = mirror_dir
+        self._filter = filter
+        self._page_size = page_size
+        self._source = source
+        self._query_class = query_class
+
+    def _build_query(self, watermark: Optional[str]):
+        filters = [self._filter] if self._filter else []
+        if watermark:
+            filters.append(
+                DateRangeFilter("updated", datetime.fromisoformat(watermark))
+            )
+        final_filter = filters[0] if len(filters) == 1 else None
+        if len(filters) > 1:
+            final_filter = AndFilter(*filters)
+        return self._query_class(
+            final_filter, SortOptions.MOSTRECENT.value, self._page_size, 1
+        )
+
+    def execute(self) -> Dict[str, List[int]]:
+        os.makedirs(self._mirror_dir, exist_ok=True)
+        state = SyncState(self._mirror_dir)
+        started = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+        summary: Dict[str, List[int]] = {"synced": [], "unchanged": [], "failed": []}
+        downloaded = 0
+        searched = True
+        try:
+            for record in self._source.iter_records(
+                self._build_query(state.watermark), lean=True, bypass_cache=True
+            ):
+                stored = state.records.get(str(record.id), {})
+                updated = record.updated.isoformat()
+                if stored.get("updated") == updated:
+                    summary["unchanged"].append(record.id)
+                    continue
+                try:
+                    entry, files = mirror_record(
+                        self._source, self._mirror_dir, record.id, stored
+                    )
+                except (DataAccessException, OSError) as e:
+                    logger.error(f"Could not sync record {record.id}: {e}")
+                    summary["failed"].append(record.id)
+                    continue
+                entry["updated"] = updated
+                state.records[str(record.id)] = entry
+                state.save()
+                downloaded += files
+                summary["synced" if entry is not stored else "unchanged"].append(
+                    record.id
+                )
+        except DataAccessException as e:
+            logger.error(f"Error while searching updated records: {e}")
+            searched = False
+
+        if searched and not summary["failed"]:
+            state.watermark = started.isoformat()
+            state.save()
+        write_index(self._mirror_dir)
+        logger.info(
+            f"Synced {len(summary['synced'])} records ({downloaded} files), "
+            f"{len(summary['unchanged'])} unchanged, {len(summary['failed'])} failed"
+        )
+        return summary
+
+    def undo(self):
+        logger.info("Undo operation is not supported for synchronizing records.")
@@ -2,10 +2,29 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterator, List, Optional, Union
 
+from hflav_fair_client.exceptions.source_exceptions import DataNotFoundException
 from hflav_fair_client.filters.base_query import BaseQuery
-from hflav_fair_client.models.models import Record, Template
+from hflav_fair_client.models.models import Record, RecordSummary, Template
+
+
+def select_template_by_date(
+    templates: List[Template], date: Optional[datetime] = None
+) -> Template:
+    """Return the latest template created on or before `date`, or the latest one.
+
+    Raises:
+            DataNotFoundException: If no template was created before the date.
+    """
+    if date is None:
+        return max(templates, key=lambda t: t.created)
+    valid_templates = [
+        t for t in templates if t.created.timestamp() <= date.timestamp()
+    ]
+    if not valid_templates:
+        raise DataNotFoundException(f"No template versions found before date {date}")
+    return max(valid_templates, key=lambda t: t.created)
 
 
 class SourceInterface(ABC):
@@ -16,11 +35,15 @@ class SourceInterface(ABC):
     """
 
     @abstractmethod
-    def get_records_by_name(self, query: BaseQuery) -> List[Record]:
+    def get_records_by_name(
+        self, query: BaseQuery, lean: bool = False
+    ) -> List[Union[Record, RecordSummary]]:
         """Search records and return the records.
 
         Args:
                 query: BaseQuery instance representing the search query.
+                lean: Return lightweight `RecordSummary` objects, which skip the
+                        validation of the hits, instead of `Record` models.
 
         Returns:
                 A list of records.
@@ -29,6 +52,28 @@ class SourceInterface(ABC):
                 DataAccessException: If the request to download the file fails.
         """
 
+    def iter_records(
+        self, query: BaseQuery, lean: bool = False
+    ) -> Iterator[Union[Record, RecordSummary]]:
+        """Iterate over every record matching the query, page after page.
+
+        Pages are only requested as the iteration goes. Sources without pagination
+        yield the records of `get_records_by_name`.
+
+        Args:
+                query: BaseQuery instance representing the search query, whose
+                        pagination sets the first page and the page size.
+                lean: Yield lightweight `RecordSummary` objects instead of `Record`
+                        models.
+
+        Returns:
+                An iterator of records.
+
+        Raises:
+                DataAccessException: If the request of a page fails.
+        """
+        yield from self.get_records_by_name(query, lean=lean)
+
     @abstractmethod
     def get_correct_template_by_date(self, date: Optional[datetime] = None) -> Template:
         """Search the correct template version to the date given.
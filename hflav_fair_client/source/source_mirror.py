@@ -0,0 +1,283 @@
+"""
+Offline sources backed by a local mirror of the HFLAV community.
+
+A mirror directory, built and updated with the ``BuildMirror`` and ``SyncRecords``
+commands, holds:
+
+- ``records/<id>.json``: the Zenodo JSON of every record, data file templates
+  included.
+- ``files/<id>/<filename>``: the files of every record.
+- ``schemas/<tag>.schema``: JSON schemas of the GitLab repository, by tag.
+- ``index.json``: title and timestamps of every record, the ids of the template
+  versions and the schema file of every tag, so lookups never scan the mirror.
+- ``sync_state.json``: see ``SyncState``.
+
+No network access is made by the sources of this module.
+"""
+
+import json
+import os
+import re
+import shutil
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from hflav_fair_client.exceptions.source_exceptions import (
+    DataNotFoundException,
+    NoVersionTagFound,
+)
+from hflav_fair_client.filters.base_query import BaseQuery
+from hflav_fair_client.logger import get_logger
+from hflav_fair_client.models.models import File, Record, RecordSummary, Template
+from hflav_fair_client.source.source_gitlab_interface import SourceGitlabInterface
+from hflav_fair_client.source.source_interface import (
+    SourceInterface,
+    select_template_by_date,
+)
+
+logger = get_logger(__name__)
+
+INDEX_FILENAME = "index.json"
+INDEX_VERSION = 1
+
+
+def record_path(mirror_dir: str, record_id: Union[int, str]) -> str:
+    """Return the path of the JSON of a record inside the mirror."""
+    return os.path.join(mirror_dir, "records", f"{record_id}.json")
+
+
+def record_files_dir(mirror_dir: str, record_id: Union[int, str]) -> str:
+    """Return the directory of the files of a record inside the mirror."""
+    return os.path.join(mirror_dir, "files", str(record_id))
+
+
+def record_file_path(mirror_dir: str, record_id: Union[int, str], name: str) -> str:
+    """Return the path of a file of a record inside the mirror."""
+    return os.path.join(record_files_dir(mirror_dir, record_id), name)
+
+
+def schema_path(mirror_dir: str, tag: str) -> str:
+    """Return the path of the schema of a GitLab tag inside the mirror."""
+    return os.path.join(
+        mirror_dir, "schemas", re.sub(r"[^A-Za-z0-9._-]", "_", tag) + ".schema"
+    )
+
+
+def read_index(mirror_dir: str) -> Dict[str, Any]:
+    """Read the index of a mirror, raising DataNotFoundException if it is missing."""
+    path = os.path.join(mirror_dir, INDEX_FILENAME)
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            index = json.load(file)
+    except (OSError, ValueError) as e:
+        raise DataNotFoundException(
+            f"No valid mirror index found in {mirror_dir}", details=str(e)
+        )
+    if index.get("version") != INDEX_VERSION:
+        raise DataNotFoundException(
+            f"Unsupported mirror index version {index.get('version')} in {mirror_dir}"
+        )
+    return index
+
+
+def write_index(
+    mirror_dir: str,
+    templates: Optional[List[int]] = None,
+    schemas: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Write the index of a mirror from the records found in it.
+
+    Parameters:
+        mirror_dir (str): Directory of the mirror.
+        templates (Optional[List[int]]): Ids of the template version records; the
+                                         ones of the current index by default.
+        schemas (Optional[List[str]]): GitLab tags with a mirrored schema; the ones
+                                       of the current index by default.
+    Returns:
+        Dict[str, Any]: The written index.
+    """
+    try:
+        previous = read_index(mirror_dir)
+    except DataNotFoundException:
+        previous = {}
+
+    records = {}
+    records_dir = os.path.join(mirror_dir, "records")
+    for filename in (
+        sorted(os.listdir(records_dir)) if os.path.isdir(records_dir) else []
+    ):
+        if not filename.endswith(".json"):
+            continue
+        with open(os.path.join(records_dir, filename), "r", encoding="utf-8") as file:
+            data = json.load(file)
+        records[str(data.get("id"))] = {
+            "title": (data.get("metadata") or {}).get("title"),
+            "created": data.get("created"),
+            "updated": data.get("updated"),
+        }
+
+    if templates is None:
+        templates = previous.get("templates", [])
+    if schemas is None:
+        schemas = list(previous.get("schemas", {}))
+    index = {
+        "version": INDEX_VERSION,
+        "records": records,
+        "templates": [str(template) for template in templates],
+        "schemas": {
+            tag: os.path.relpath(schema_path(mirror_dir, tag), mirror_dir)
+            for tag in schemas
+        },
+    }
+    temp_path = os.path.join(mirror_dir, f"{INDEX_FILENAME}.tmp")
+    with open(temp_path, "w", encoding="utf-8") as file:
+        json.dump(index, file)
+    os.replace(temp_path, os.path.join(mirror_dir, INDEX_FILENAME))
+    logger.info(f"Mirror index of {mirror_dir} written: {len(records)} records")
+    return index
+
+
+class SourceMirror(SourceInterface):
+    """
+    Source serving records, template versions and files from a local mirror,
+    without any network access.
+
+    Searches only match the quoted phrases of the query (e.g. ``title:"HFLAV"``)
+    against the record titles, newest records first, with the pagination of the
+    query. Files are served from the mirror: without `dest_path` the path inside
+    the mirror is returned and nothing is copied.
+
+    Attributes:
+        mirror_dir (str): Directory of the mirror.
+    """
+
+    def __init__(self, mirror_dir: str = "hflav_mirror"):
+        super().__init__()
+        self.mirror_dir = mirror_dir
+        self._index: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def index(self) -> Dict[str, Any]:
+        """The index of the mirror, read on first use."""
+        with self._lock:
+            if self._index is None:
+                self._index = read_index(self.mirror_dir)
+            return self._index
+
+    def _record_data(self, recid: Union[int, str]) -> Dict[str, Any]:
+        if str(recid) not in self.index["records"]:
+            raise DataNotFoundException(
+                f"Record {recid} is not in the mirror {self.mirror_dir}"
+            )
+        with open(record_path(self.mirror_dir, recid), "r", encoding="utf-8") as file:
+            return json.load(file)
+
+    def _matching_ids(self, query: BaseQuery) -> List[str]:
+        params = query.build_params()
+        phrases = [p.lower() for p in re.findall(r'"([^"]*)"', params.get("q") or "")]
+        templates = set(self.index["templates"])
+        matches = [
+            (recid, entry)
+            for recid, entry in self.index["records"].items()
+            if recid not in templates
+            and all(phrase in (entry.get("title") or "").lower() for phrase in phrases)
+        ]
+        matches.sort(key=lambda item: item[1].get("updated") or "", reverse=True)
+        return [recid for recid, _ in matches]
+
+    def _build_record(self, recid: str, lean: bool) -> Union[Record, RecordSummary]:
+        data = self._record_data(recid)
+        return RecordSummary(data) if lean else Record(**data)
+
+    def get_records_by_name(
+        self, query: BaseQuery, lean: bool = False
+    ) -> List[Union[Record, RecordSummary]]:
+        params = query.build_params()
+        size = int(params.get("size") or 10)
+        start = (int(params.get("page") or 1) - 1) * size
+        return [
+            self._build_record(recid, lean)
+            for recid in self._matching_ids(query)[start : start + size]
+        ]
+
+    def iter_records(
+        self, query: BaseQuery, lean: bool = False
+    ) -> Iterator[Union[Record, RecordSummary]]:
+        params = query.build_params()
+        start = (int(params.get("page") or 1) - 1) * int(params.get("size") or 10)
+        for recid in self._matching_ids(query)[start:]:
+            yield self._build_record(recid, lean)
+
+    def get_correct_template_by_date(self, date: Optional[datetime] = None) -> Template:
+        templates = [
+            Template(**self._record_data(recid)) for recid in self.index["templates"]
+        ]
+        if not templates:
+            raise DataNotFoundException(
+                f"No template versions found in the mirror {self.mirror_dir}"
+            )
+        return select_template_by_date(templates, date)
+
+    def get_record(self, recid: int) -> Record:
+        if not recid:
+            raise ValueError("id must be an integer")
+        return Record(**self._record_data(recid))
+
+    def download_file_by_id_and_filename(
+        self,
+        id: int,
+        filename: str,
+        dest_path: Optional[str] = None,
+    ) -> str:
+        if not id:
+            raise ValueError("id must be an integer")
+        record = self.get_record(id)
+        if not filename:
+            raise ValueError("filename must be a string")
+        chosen: File = record.get_child(filename)
+        mirrored_path = record_file_path(self.mirror_dir, record.id, chosen.name)
+        if not os.path.isfile(mirrored_path):
+            raise DataNotFoundException(
+                f"File {filename} of record {id} is not in the mirror {self.mirror_dir}"
+            )
+        if dest_path is None:
+            return mirrored_path
+
+        if os.path.isdir(dest_path):
+            out_path = os.path.join(dest_path, chosen.name)
+        else:
+            out_path = dest_path
+        shutil.copyfile(mirrored_path, out_path)
+        return out_path
+
+
+class SourceGitlabMirror(SourceGitlabInterface):
+    """
+    GitLab source serving the schemas stored in a local mirror, by tag.
+
+    Attributes:
+        mirror_dir (str): Directory of the mirror.
+    """
+
+    def __init__(self, mirror_dir: str = "hflav_mirror"):
+        self.mirror_dir = mirror_dir
+
+    def get_schema_inside_repository(self, tag_version="main") -> dict:
+        try:
+            path = read_index(self.mirror_dir)["schemas"].get(tag_version)
+        except DataNotFoundException as e:
+            raise NoVersionTagFound(message=e.message, details=e.details)
+        if path is None:
+            raise NoVersionTagFound(
+                message=f"Tag '{tag_version}' not found in the mirror {self.mirror_dir}"
+            )
+        try:
+            with open(
+                os.path.join(self.mirror_dir, path), "r", encoding="utf-8"
+            ) as file:
+                return json.load(file)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in schema file: {e}")
@@ -1,13 +1,13 @@
 from datetime import datetime
 import json
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from hypothesis import given, settings, Phase, HealthCheck
 import hypothesis
 from hypothesis_jsonschema import from_schema
 
 from hflav_fair_client.filters.base_query import BaseQuery
-from hflav_fair_client.models.models import File, Record, Template
+from hflav_fair_client.models.models import File, Record, RecordSummary, Template
 from hflav_fair_client.source.source_interface import SourceInterface
 
 
@@ -30,7 +30,9 @@ class SourceZenodoRandomData(SourceInterface):
     # Cache the strategy to avoid recreating it on every call
     _cached_strategy = None
 
-    def get_records_by_name(self, query: BaseQuery) -> List[Record]:
+    def get_records_by_name(
+        self, query: BaseQuery, lean: bool = False
+    ) -> List[Union[Record, RecordSummary]]:
         record_data = {
             "id": 1,
             "doi": "10.1234/random.doi",
@@ -47,6 +49,8 @@ class SourceZenodoRandomData(SourceInterface):
                 },
             ],
         }
+        if lean:
+            return [RecordSummary(record_data)]
         return [
             Record(
                 **record_data,
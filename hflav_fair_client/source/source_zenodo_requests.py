@@ -1,4 +1,8 @@
-from typing import Optional, Dict, Any, List
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional, Dict, Any, Iterator, List, Tuple, Union
 import requests
 import os
 from datetime import datetime
@@ -8,8 +12,89 @@ from hflav_fair_client.exceptions.source_exceptions import (
     DataNotFoundException,
 )
 from hflav_fair_client.filters.base_query import BaseQuery
-from hflav_fair_client.models.models import File, Record, Template
-from hflav_fair_client.source.source_interface import SourceInterface
+from hflav_fair_client.models.models import File, Record, RecordSummary, Template
+from hflav_fair_client.source.source_interface import (
+    SourceInterface,
+    select_template_by_date,
+)
+
+
+class ParsedResponses:
+    """
+    Parsed bodies of JSON responses, kept by URL with their validators (``ETag``
+    and ``Last-Modified`` headers).
+
+    The validators are sent back as ``If-None-Match``/``If-Modified-Since`` headers,
+    and a 304 response, or a response with the same validators (as returned by
+    ``requests_cache`` after revalidating an expired entry), reuses the parsed body
+    instead of decoding and validating it again.
+
+    Attributes:
+        max_entries (int): Number of responses kept, least recently used first out.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Dict[str, str], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def validators(response: requests.Response) -> Dict[str, str]:
+        """Return the validators of a response."""
+        validators = {}
+        for name in ("ETag", "Last-Modified"):
+            value = response.headers.get(name)
+            if isinstance(value, str) and value:
+                validators[name] = value
+        return validators
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Return the headers revalidating the stored response of `url`, if any."""
+        with self._lock:
+            entry = self._entries.get(url)
+        if entry is None:
+            return {}
+        headers = {}
+        if "ETag" in entry[0]:
+            headers["If-None-Match"] = entry[0]["ETag"]
+        if "Last-Modified" in entry[0]:
+            headers["If-Modified-Since"] = entry[0]["Last-Modified"]
+        return headers
+
+    def parse(
+        self, url: str, response: requests.Response, parse: Callable[[Any], Any]
+    ) -> Tuple[bool, Any]:
+        """
+        Return the parsed body of a successful or 304 response of `url`, reusing the
+        stored one when the response is not modified.
+
+        Returns:
+            Tuple[bool, Any]: Whether a parsed body was available, and the body.
+        """
+        validators = self.validators(response)
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None and (
+                response.status_code == 304 or (validators and validators == entry[0])
+            ):
+                self._entries.move_to_end(url)
+                return True, entry[1]
+        if response.status_code == 304:
+            return False, None
+
+        value = parse(response.json())
+        if validators:
+            with self._lock:
+                self._entries[url] = (validators, value)
+                self._entries.move_to_end(url)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return True, value
+
+    def clear(self) -> None:
+        """Forget every stored response."""
+        with self._lock:
+            self._entries.clear()
 
 
 class SourceZenodoRequest(SourceInterface):
@@ -17,79 +102,223 @@ class SourceZenodoRequest(SourceInterface):
     DEFAULT_BASE = "https://zenodo.org/api"
     CONCEPT_ID_TEMPLATE = 12087575  # Template record for HFLAV data files
 
-    def get_records_by_name(self, query: BaseQuery) -> Dict[str, Any]:
-        search_url = f"{self.DEFAULT_BASE}/records"
-        params = query.build_params()
+    # Sent by requests that must reach Zenodo, neither answered from nor stored in
+    # the HTTP cache
+    BYPASS_CACHE_HEADERS = {"Cache-Control": "no-store"}
+
+    def __init__(self, max_parsed_responses: int = 256, base_url: Optional[str] = None):
+        super().__init__()
+        self.base_url = (base_url or self.DEFAULT_BASE).rstrip("/")
+        self._parsed_responses = ParsedResponses(max_parsed_responses)
+
+    def _get_parsed(
+        self,
+        url: str,
+        parse: Callable[[Any], Any],
+        error_message: str,
+        conditional: bool = True,
+    ) -> Any:
+        """GET a JSON resource with a conditional request when it was already fetched,
+        returning its parsed body."""
+        headers = self._parsed_responses.conditional_headers(url) if conditional else {}
+        if headers:
+            resp = requests.get(url, headers=headers, timeout=30)
+        else:
+            resp = requests.get(url, timeout=30)
+        if resp.status_code != 304:
+            try:
+                resp.raise_for_status()
+            except requests.HTTPError as e:
+                raise DataAccessException(error_message, details=str(e))
+        found, value = self._parsed_responses.parse(url, resp, parse)
+        if not found:
+            # The stored response was evicted meanwhile
+            return self._get_parsed(url, parse, error_message, conditional=False)
+        return value
 
-        response = requests.get(search_url, params=params, timeout=30)
+    def _get_search_page(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        bypass_cache: bool = False,
+    ) -> Dict[str, Any]:
+        if bypass_cache:
+            response = requests.get(
+                url, params=params, headers=self.BYPASS_CACHE_HEADERS, timeout=30
+            )
+        else:
+            response = requests.get(url, params=params, timeout=30)
         try:
             response.raise_for_status()
         except requests.HTTPError as e:
             raise DataAccessException("Failed to get records by name", details=str(e))
-        data = response.json()
+        return response.json()
 
-        results = []
-        for hit in data.get("hits", {}).get("hits", []):
-            results.append(Record(**hit))
+    def get_records_by_name(
+        self, query: BaseQuery, lean: bool = False
+    ) -> List[Union[Record, RecordSummary]]:
+        search_url = f"{self.base_url}/records"
+        data = self._get_search_page(search_url, params=query.build_params())
 
-        return results
+        hits = data.get("hits", {}).get("hits", [])
+        if lean:
+            return [RecordSummary(hit) for hit in hits]
+        return [Record(**hit) for hit in hits]
 
-    def _get_all_template_versions(self) -> List[Template]:
-        record_url = f"{self.DEFAULT_BASE}/records/{self.CONCEPT_ID_TEMPLATE}"
-        response = requests.get(record_url, timeout=30)
+    def iter_records(
+        self, query: BaseQuery, lean: bool = False, bypass_cache: bool = False
+    ) -> Iterator[Union[Record, RecordSummary]]:
+        # The next page is requested in the background while the records of the
+        # current one are consumed. Closing the iterator cancels that request if
+        # it has not started yet; a request already in flight cannot be
+        # interrupted, so it is abandoned: it completes (or times out) in the
+        # background thread and its page is discarded.
+        # With `bypass_cache` the pages skip the HTTP cache, so changes are seen
+        # even when the same search was sent before.
+        executor = ThreadPoolExecutor(max_workers=1)
+        pending: Optional[Future] = executor.submit(
+            self._get_search_page,
+            f"{self.base_url}/records",
+            query.build_params(),
+            bypass_cache,
+        )
         try:
-            response.raise_for_status()
-        except requests.HTTPError as e:
-            raise DataAccessException("Failed to get template versions", details=str(e))
-        record_data = response.json()
+            while pending is not None:
+                data = pending.result()
+                hits = data.get("hits", {}).get("hits", [])
+                next_url = data.get("links", {}).get("next")
+                pending = (
+                    executor.submit(self._get_search_page, next_url, None, bypass_cache)
+                    if next_url and hits
+                    else None
+                )
+                for hit in hits:
+                    yield RecordSummary(hit) if lean else Record(**hit)
+        finally:
+            if pending is not None:
+                pending.cancel()
+            executor.shutdown(wait=False)
+
+    def _get_all_template_versions(self) -> List[Template]:
+        record_url = f"{self.base_url}/records/{self.CONCEPT_ID_TEMPLATE}"
+        versions_url = self._get_parsed(
+            record_url,
+            lambda data: data.get("links", {}).get("versions"),
+            "Failed to get template versions",
+        )
 
         # Get all versions
-        versions_url = record_data.get("links", {}).get("versions")
         if not versions_url:
             raise DataNotFoundException(
                 f"No versions link found for record {self.CONCEPT_ID_TEMPLATE}"
             )
 
-        versions_response = requests.get(versions_url, timeout=30)
-        versions_response.raise_for_status()
-        versions_data = versions_response.json()
+        all_versions = self._get_parsed(
+            versions_url,
+            lambda data: [
+                Template(**version) for version in data.get("hits", {}).get("hits", [])
+            ],
+            "Failed to get template versions",
+        )
+        return list(all_versions)
 
-        all_versions = []
-        for version in versions_data.get("hits", {}).get("hits", []):
-
-            all_versions.append(Template(**version))
-
-        return all_versions
+    def get_template_versions(self) -> List[Template]:
+        """Return every version of the HFLAV data file template."""
+        return self._get_all_template_versions()
 
     def get_correct_template_by_date(self, date: Optional[datetime] = None) -> Template:
-        templates = self._get_all_template_versions()
-        if date is None:
-            # Return the latest version
-            latest_template = max(templates, key=lambda t: t.created)
-            return latest_template
-        else:
-            # Find the latest template before or on the given date
-            valid_templates = [
-                t for t in templates if t.created.timestamp() <= date.timestamp()
-            ]
-            if not valid_templates:
-                raise DataNotFoundException(
-                    f"No template versions found before date {date}"
-                )
-            correct_template = max(valid_templates, key=lambda t: t.created)
-            return correct_template
+        return select_template_by_date(self._get_all_template_versions(), date)
 
     def get_record(self, recid: int) -> Record:
         if not recid:
             raise ValueError("id must be an integer")
-        url = f"{self.DEFAULT_BASE}/records/{recid}"
-        resp = requests.get(url, timeout=30)
+        url = f"{self.base_url}/records/{recid}"
+        record = self._get_parsed(
+            url, lambda data: Record(**data), "Failed to get record"
+        )
+        # The stored record is shared, so callers get their own list of children
+        return record.model_copy(update={"children": list(record.children or [])})
+
+    def get_record_if_modified(
+        self, recid: int, etag: Optional[str] = None
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Get the JSON of a record unless it still matches `etag`.
+
+        The request bypasses the HTTP cache and carries ``If-None-Match`` when an
+        ETag is given, so an unchanged record costs a body-less 304 response.
+
+        Returns:
+            Tuple[Optional[Dict[str, Any]], Optional[str]]: The record JSON, or None
+            if it is unchanged, and its current ETag.
+        """
+        if not recid:
+            raise ValueError("id must be an integer")
+        headers = dict(self.BYPASS_CACHE_HEADERS)
+        if etag:
+            headers["If-None-Match"] = etag
+        url = f"{self.base_url}/records/{recid}"
+        resp = requests.get(url, headers=headers, timeout=30)
+        if resp.status_code == 304:
+            return None, etag
         try:
             resp.raise_for_status()
         except requests.HTTPError as e:
             raise DataAccessException("Failed to get record", details=str(e))
-        data = resp.json()
-        return Record(**data)
+        return resp.json(), resp.headers.get("ETag")
+
+    def download_file(
+        self,
+        url: str,
+        out_path: str,
+        checksum: Optional[str] = None,
+        bypass_cache: bool = False,
+    ) -> str:
+        """
+        Stream the file at `url` to `out_path` and return the path.
+
+        The file is written to a temporary file that only replaces `out_path` once
+        complete. With a Zenodo `checksum` (``"<algorithm>:<hex digest>"``, e.g.
+        ``"md5:..."``) a download that does not match it is discarded. With
+        `bypass_cache` the request skips the HTTP cache.
+        """
+        if bypass_cache:
+            r = requests.get(
+                url, stream=True, headers=self.BYPASS_CACHE_HEADERS, timeout=60
+            )
+        else:
+            r = requests.get(url, stream=True, timeout=60)
+        try:
+            r.raise_for_status()
+        except requests.HTTPError as e:
+            raise DataAccessException("Failed to download file", details=str(e))
+
+        algorithm, _, expected = (checksum or "").partition(":")
+        hasher = (
+            hashlib.new(algorithm)
+            if expected and algorithm in hashlib.algorithms_available
+            else None
+        )
+        temp_path = f"{out_path}.tmp"
+        try:
+            with open(temp_path, "wb") as fh:
+                for chunk in r.iter_content(chunk_size=8192):
+                    if chunk:
+                        fh.write(chunk)
+                        if hasher:
+                            hasher.update(chunk)
+            if hasher and hasher.hexdigest() != expected.lower():
+                raise DataAccessException(
+                    "Downloaded file does not match its checksum",
+                    details=f"{url}: expected {checksum}, got "
+                    f"{algorithm}:{hasher.hexdigest()}",
+                )
+            os.replace(temp_path, out_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        return out_path
 
     def download_file_by_id_and_filename(
         self,
@@ -107,12 +336,6 @@ class SourceZenodoRequest(SourceInterface):
         if not url:
             raise DataNotFoundException("No download link found for file")
 
-        r = requests.get(url, stream=True, timeout=60)
-        try:
-            r.raise_for_status()
-        except requests.HTTPError as e:
-            raise DataAccessException("Failed to download file", details=str(e))
-
         dest_is_dir = dest_path and os.path.isdir(dest_path)
         if dest_path is None or dest_is_dir:
             filename_on_disk = chosen.name or f"record_{record.id}_file"
@@ -120,9 +343,4 @@ class SourceZenodoRequest(SourceInterface):
         else:
             out_path = dest_path
 
-        with open(out_path, "wb") as fh:
-            for chunk in r.iter_content(chunk_size=8192):
-                if chunk:
-                    fh.write(chunk)
-
-        return out_path
+        return self.download_file(url, out_path)
@@ -0,0 +1,138 @@
+import json
+import multiprocessing
+from unittest.mock import Mock
+
+import pytest
+
+from hflav_fair_client.conversors import bulk_loader
+from hflav_fair_client.conversors.bulk_loader import BulkLoader, BulkLoadResult
+from hflav_fair_client.conversors.dynamic_conversor import DynamicConversor
+from hflav_fair_client.conversors.schema_cache import SchemaCache
+from hflav_fair_client.conversors.validation_cache import ValidationCache
+from hflav_fair_client.processing.data_visualizer import DataVisualizer
+
+
+@pytest.fixture
+def conversor():
+    return DynamicConversor(
+        visualizer=Mock(),
+        verbose=False,
+        schema_cache=SchemaCache(cache_dir=None),
+        validation_cache=ValidationCache(cache_dir=None),
+    )
+
+
+@pytest.fixture
+def data_paths(tmp_path):
+    paths = []
+    for i in range(4):
+        path = tmp_path / f"data_{i}.json"
+        path.write_text(
+            json.dumps({"name": f"file {i}", "groups": [{"value": i}, {"value": 1.5}]})
+        )
+        paths.append(str(path))
+    return paths
+
+
+@pytest.fixture
+def schema_path(tmp_path):
+    path = tmp_path / "schema.json"
+    path.write_text(
+        json.dumps(
+            {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "groups": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {"value": {"type": "number"}},
+                        },
+                    },
+                },
+            }
+        )
+    )
+    return str(path)
+
+
+class TestBulkLoader:
+    """Test suite for BulkLoader."""
+
+    def test_invalid_max_workers(self, conversor):
+        with pytest.raises(ValueError):
+            BulkLoader(conversor, max_workers=0)
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_load(self, conversor, data_paths, schema_path, max_workers):
+        result = BulkLoader(conversor, max_workers=max_workers).load(
+            data_paths, schema_path=schema_path
+        )
+
+        assert list(result.data) == data_paths
+        assert [data.name for data in result.data.values()] == [
+            f"file {i}" for i in range(4)
+        ]
+        assert result.data[data_paths[3]].groups[0].value == 3
+        assert result.errors == {}
+        assert result.serial_seconds > 0
+        assert result.speedup > 0
+
+    def test_serial_load_does_not_keep_the_conversor(self, conversor, data_paths):
+        BulkLoader(conversor, max_workers=1).load(data_paths, validate=False)
+
+        assert bulk_loader._worker_conversor is None
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_failed_files_are_reported(
+        self, conversor, data_paths, schema_path, tmp_path, max_workers
+    ):
+        invalid_path = tmp_path / "invalid.json"
+        invalid_path.write_text(json.dumps({"name": 1}))
+        paths = [data_paths[0], str(invalid_path), str(tmp_path / "missing.json")]
+
+        result = BulkLoader(conversor, max_workers=max_workers).load(
+            paths, schema_path=schema_path
+        )
+
+        assert list(result.data) == [data_paths[0]]
+        assert list(result.errors) == paths[1:]
+        assert result.errors[paths[1]].startswith("StructureException")
+        assert result.errors[paths[2]].startswith("FileNotFoundError")
+
+    def test_load_with_spawned_workers(self, data_paths, schema_path, capfd):
+        conversor = DynamicConversor(
+            visualizer=DataVisualizer(),
+            verbose=True,
+            schema_cache=SchemaCache(cache_dir=None),
+            validation_cache=ValidationCache(cache_dir=None),
+        )
+        with open(data_paths[0], "w") as file:
+            json.dump({"name": "points", "groups": [{"value": 0.5}] * 100}, file)
+        loader = BulkLoader(
+            conversor, max_workers=2, mp_context=multiprocessing.get_context("spawn")
+        )
+
+        result = loader.load(data_paths, schema_path=schema_path)
+
+        assert result.errors == {}
+        assert len(result.data[data_paths[0]].groups) == 100
+        assert result.data[data_paths[3]].groups[1].value == 1.5
+        # Workers never print what they load
+        assert "file 3" not in capfd.readouterr().out
+
+    def test_load_without_validation(self, data_paths):
+        conversor = Mock()
+        conversor.generate_instance_from_local_path.return_value = "data"
+
+        result = BulkLoader(conversor, max_workers=1).load(data_paths, validate=False)
+
+        assert list(result.data.values()) == ["data"] * 4
+        conversor.generate_instance_from_local_path.assert_called_with(
+            data_path=data_paths[-1], schema_path=None, validate=False
+        )
+
+    def test_speedup(self):
+        assert BulkLoadResult({}, {}, 2.0, 6.0).speedup == 3.0
+        assert BulkLoadResult({}, {}, 0.0, 0.0).speedup == 1.0
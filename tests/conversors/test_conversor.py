@@ -1,10 +1,15 @@
 import json
+import os
 import pytest
 from unittest.mock import Mock, patch, mock_open, call
 from types import SimpleNamespace
 import jsonschema
+from genson import SchemaBuilder
 
 from hflav_fair_client.conversors.dynamic_conversor import DynamicConversor
+from hflav_fair_client.conversors.schema_cache import SchemaCache
+from hflav_fair_client.conversors.schema_sampling import sample_arrays
+from hflav_fair_client.conversors.validation_cache import ValidationCache
 from hflav_fair_client.exceptions.conversor_exceptions import StructureException
 
 
@@ -23,7 +28,11 @@ class TestConversor:
     @pytest.fixture
     def conversor(self, mock_visualizer):
         """Create DynamicConversor instance with mocked dependencies."""
-        return DynamicConversor(visualizer=mock_visualizer)
+        return DynamicConversor(
+            visualizer=mock_visualizer,
+            schema_cache=SchemaCache(cache_dir=None),
+            validation_cache=ValidationCache(cache_dir=None),
+        )
 
     @pytest.fixture
     def sample_data(self):
@@ -53,6 +62,120 @@ class TestConversor:
         conversor = DynamicConversor(visualizer=mock_visualizer)
         assert conversor._visualizer == mock_visualizer
 
+    def test_init_verbose_defaults_to_true(self, mock_visualizer):
+        """Test that the conversor prints its output by default."""
+        conversor = DynamicConversor(visualizer=mock_visualizer)
+        assert conversor._verbose is True
+
+    def test_quiet_copy(self, mock_visualizer):
+        """Test that quiet returns a non verbose copy of the conversor."""
+        conversor = DynamicConversor(visualizer=mock_visualizer, verbose=True)
+
+        quiet = conversor.quiet()
+
+        assert quiet._verbose is False
+        assert quiet._visualizer is mock_visualizer
+        assert conversor._verbose is True
+
+    def test_non_verbose_conversor_skips_visualization(
+        self, mock_visualizer, sample_schema
+    ):
+        """Test that no schema or data is printed when verbose is disabled."""
+        conversor = DynamicConversor(
+            visualizer=mock_visualizer, verbose=False, validation_cache=None
+        )
+        test_json = json.dumps({"name": "test", "value": 123})
+
+        with patch("builtins.open", mock_open(read_data=test_json)):
+            result = conversor.generate_instance_from_schema_and_data(
+                sample_schema, "/test/data.json"
+            )
+            conversor.generate_instance_from_local_path(
+                "/test/data.json", validate=False
+            )
+
+        assert result.name == "test"
+        mock_visualizer.print_schema.assert_not_called()
+        mock_visualizer.print_json_data.assert_not_called()
+
+    def test_parallel_validation_reports_every_error(self, mock_visualizer):
+        """Test that groups validated in parallel report all their errors."""
+        schema = {
+            "type": "object",
+            "properties": {
+                "groups": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {"value": {"type": "number"}},
+                    },
+                }
+            },
+        }
+        conversor = DynamicConversor(
+            visualizer=mock_visualizer,
+            verbose=False,
+            validation_workers=2,
+            validation_cache=None,
+        )
+        groups = [{"value": i} for i in range(10)]
+        groups[3]["value"] = groups[8]["value"] = "invalid"
+
+        with patch(
+            "builtins.open", mock_open(read_data=json.dumps({"groups": groups}))
+        ):
+            with pytest.raises(StructureException) as exc_info:
+                conversor.generate_instance_from_schema_and_data(
+                    schema, "/test/data.json"
+                )
+
+        assert [pointer for pointer, _ in exc_info.value.errors] == [
+            "/groups/3/value",
+            "/groups/8/value",
+        ]
+        assert "2 validation errors" in exc_info.value.details
+
+    def test_reload_only_validates_changed_groups(self, mock_visualizer):
+        """Test that groups that already passed validation are not validated again."""
+        schema = {
+            "type": "object",
+            "properties": {
+                "groups": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {"value": {"type": "number"}},
+                    },
+                }
+            },
+        }
+        conversor = DynamicConversor(
+            visualizer=mock_visualizer,
+            verbose=False,
+            validation_cache=ValidationCache(cache_dir=None),
+        )
+        groups = [{"value": i} for i in range(10)]
+        with patch(
+            "builtins.open", mock_open(read_data=json.dumps({"groups": groups}))
+        ):
+            conversor.generate_instance_from_schema_and_data(schema, "/test/data.json")
+
+        groups[5]["value"] = "invalid"
+        with patch(
+            "builtins.open", mock_open(read_data=json.dumps({"groups": groups}))
+        ), patch(
+            "hflav_fair_client.conversors.validation_cache.ParallelGroupsValidator"
+            ".validate",
+            return_value=[("/groups/5/value", "'invalid' is not of type 'number'")],
+        ) as mock_validate:
+            with pytest.raises(StructureException) as exc_info:
+                conversor.generate_instance_from_schema_and_data(
+                    schema, "/test/data.json"
+                )
+
+        assert mock_validate.call_args.kwargs["indexes"] == [5]
+        assert exc_info.value.errors[0][0] == "/groups/5/value"
+
     # Test generate_json_schema method - PUBLIC METHOD
     def test_generate_json_schema_success(self, conversor):
         """Test successful schema generation from JSON file."""
@@ -73,6 +196,50 @@ class TestConversor:
             assert "type" in schema
             assert "properties" in schema
 
+    def test_generate_json_schema_is_memoized(self, conversor):
+        """Test that the schema of the same content is only inferred once."""
+        test_json = json.dumps({"name": "test", "value": 123})
+
+        with patch("builtins.open", mock_open(read_data=test_json)), patch(
+            "hflav_fair_client.conversors.dynamic_conversor.SchemaBuilder",
+            wraps=SchemaBuilder,
+        ) as mock_builder:
+            first = conversor.generate_json_schema("/test/template_v1.json")
+            first["properties"]["name"]["type"] = "modified"
+            second = conversor.generate_json_schema("/test/another_copy.json")
+
+        mock_builder.assert_called_once()
+        assert second["properties"]["name"]["type"] == "string"
+
+    def test_generate_json_schema_cache_is_keyed_by_content(self, conversor):
+        """Test that different contents get different schemas."""
+        with patch("builtins.open", mock_open(read_data='{"name": "test"}')):
+            first = conversor.generate_json_schema("/test/data.json")
+        with patch("builtins.open", mock_open(read_data='{"value": 1}')):
+            second = conversor.generate_json_schema("/test/data.json")
+
+        assert list(first["properties"]) == ["name"]
+        assert list(second["properties"]) == ["value"]
+
+    def test_generate_json_schema_reuses_disk_cache(self, mock_visualizer, tmp_path):
+        """Test that schemas cached on disk are reused by new conversors."""
+        template_path = tmp_path / "template.json"
+        template_path.write_text(json.dumps({"name": "test"}))
+        cache_dir = str(tmp_path / "schemas")
+
+        expected = DynamicConversor(
+            visualizer=mock_visualizer, schema_cache=SchemaCache(cache_dir)
+        ).generate_json_schema(str(template_path))
+        with patch(
+            "hflav_fair_client.conversors.dynamic_conversor.SchemaBuilder"
+        ) as mock_builder:
+            schema = DynamicConversor(
+                visualizer=mock_visualizer, schema_cache=SchemaCache(cache_dir)
+            ).generate_json_schema(str(template_path))
+
+        mock_builder.assert_not_called()
+        assert schema == expected
+
     def test_generate_json_schema_file_not_found(self, conversor):
         """Test schema generation with non-existent file."""
         with patch("builtins.open", side_effect=FileNotFoundError("File not found")):
@@ -199,6 +366,81 @@ class TestConversor:
             # with the generated schema
             mock_visualizer.print_json_data.assert_called_once()
 
+    def test_local_path_skips_validation_against_inferred_schema(
+        self, conversor, mock_visualizer
+    ):
+        """Test that data is not validated against the schema inferred from itself."""
+        test_json = json.dumps({"name": "test", "value": 123})
+
+        with patch(
+            "builtins.open", mock_open(read_data=test_json)
+        ) as mock_file, patch.object(
+            conversor, "_validate_json_with_schema"
+        ) as mock_validate:
+            result = conversor.generate_instance_from_local_path(
+                data_path="/test/data.json", validate=True
+            )
+
+        assert result.name == "test"
+        mock_validate.assert_not_called()
+        mock_file.assert_called_once_with("/test/data.json", "r", encoding="utf-8")
+        mock_visualizer.print_schema.assert_called_once()
+
+    def test_local_path_infers_schema_from_a_sample(self, mock_visualizer):
+        """Test that the schema of a local file is inferred from sampled arrays."""
+        conversor = DynamicConversor(
+            visualizer=mock_visualizer,
+            verbose=True,
+            schema_cache=SchemaCache(cache_dir=None),
+            schema_sample_size=10,
+        )
+        test_json = json.dumps({"items": [{"value": i} for i in range(100)]})
+
+        with patch("builtins.open", mock_open(read_data=test_json)), patch(
+            "hflav_fair_client.conversors.dynamic_conversor.sample_arrays",
+            wraps=sample_arrays,
+        ) as mock_sample:
+            result = conversor.generate_instance_from_local_path(
+                data_path="/test/data.json", validate=True
+            )
+
+        assert len(result.items) == 100
+        mock_sample.assert_called_once()
+        assert mock_sample.call_args.args[1] == 10
+
+    def test_local_path_without_verbose_does_not_infer_schema(
+        self, mock_visualizer, tmp_path
+    ):
+        """Test that the schema, only used for printing, is not inferred when quiet."""
+        schema_cache = SchemaCache(cache_dir=str(tmp_path))
+        conversor = DynamicConversor(
+            visualizer=mock_visualizer, verbose=False, schema_cache=schema_cache
+        )
+        test_json = json.dumps({"items": [{"value": i} for i in range(100)]})
+
+        with patch("builtins.open", mock_open(read_data=test_json)), patch(
+            "hflav_fair_client.conversors.dynamic_conversor.SchemaBuilder"
+        ) as mock_builder:
+            result = conversor.generate_instance_from_local_path(
+                data_path="/test/data.json", validate=True
+            )
+
+        assert len(result.items) == 100
+        mock_builder.assert_not_called()
+        mock_visualizer.print_schema.assert_not_called()
+        assert os.listdir(tmp_path) == []
+
+    def test_generate_json_schema_with_sample_size(self, conversor):
+        """Test that sampled and full schemas are cached separately."""
+        test_json = json.dumps([{"a": 1}] * 100 + [{"a": 1, "rare": True}])
+
+        with patch("builtins.open", mock_open(read_data=test_json)):
+            full = conversor.generate_json_schema("/test/data.json")
+            sampled = conversor.generate_json_schema("/test/data.json", sample_size=2)
+
+        assert "rare" in full["items"]["properties"]
+        assert "rare" not in sampled["items"]["properties"]
+
     def test_generate_instance_from_local_path_without_validation(
         self, conversor, mock_visualizer
     ):
@@ -0,0 +1,127 @@
+import jsonschema
+import pytest
+
+from hflav_fair_client.conversors import parallel_validator
+from hflav_fair_client.conversors.parallel_validator import (
+    ParallelGroupsValidator,
+    json_pointer,
+)
+
+
+@pytest.fixture
+def schema():
+    return {
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "type": "object",
+        "properties": {
+            "version": {"type": "string"},
+            "groups": {
+                "type": "array",
+                "minItems": 1,
+                "items": {"$ref": "#/definitions/Group"},
+            },
+        },
+        "required": ["version", "groups"],
+        "additionalProperties": False,
+        "definitions": {
+            "Group": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "averages": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {"value": {"type": "number"}},
+                            "required": ["value"],
+                        },
+                    },
+                },
+                "required": ["name"],
+            }
+        },
+    }
+
+
+def _groups(num_groups, invalid=()):
+    groups = [
+        {"name": f"group_{i}", "averages": [{"value": 1.0}, {"value": 2}]}
+        for i in range(num_groups)
+    ]
+    for index in invalid:
+        groups[index]["averages"][1]["value"] = "not a number"
+    return groups
+
+
+def _expected_errors(schema, data):
+    validator = jsonschema.Draft7Validator(schema)
+    return sorted(
+        (json_pointer(error.absolute_path), error.message)
+        for error in validator.iter_errors(data)
+    )
+
+
+class TestParallelGroupsValidator:
+    """Test suite for ParallelGroupsValidator."""
+
+    def test_json_pointer_escaping(self):
+        assert json_pointer(["groups", 3, "a/b~c"]) == "/groups/3/a~1b~0c"
+        assert json_pointer([]) == ""
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_valid_document(self, schema, max_workers):
+        data = {"version": "1", "groups": _groups(50)}
+
+        assert ParallelGroupsValidator(schema, max_workers).validate(data) == []
+
+    @pytest.mark.parametrize("max_workers", [1, 3])
+    def test_errors_are_merged_with_pointers(self, schema, max_workers):
+        data = {"version": "1", "groups": _groups(40, invalid=(2, 17, 39))}
+
+        errors = ParallelGroupsValidator(schema, max_workers).validate(data)
+
+        assert [pointer for pointer, _ in errors] == [
+            "/groups/2/averages/1/value",
+            "/groups/17/averages/1/value",
+            "/groups/39/averages/1/value",
+        ]
+        assert sorted(errors) == _expected_errors(schema, data)
+
+    def test_serial_validation_does_not_keep_the_items(self, schema):
+        data = {"version": "1", "groups": _groups(5)}
+
+        ParallelGroupsValidator(schema, 1).validate(data)
+
+        assert parallel_validator._worker_items is None
+
+    def test_root_and_array_level_errors(self, schema):
+        data = {"version": 1, "groups": [], "extra": True}
+
+        errors = ParallelGroupsValidator(schema, 2).validate(data)
+
+        assert sorted(errors) == _expected_errors(schema, data)
+        assert {pointer for pointer, _ in errors} == {"", "/version", "/groups"}
+
+    def test_can_split(self, schema):
+        validator = ParallelGroupsValidator(schema, 2)
+
+        assert validator.can_split({"groups": []})
+        assert not validator.can_split({"groups": {}})
+        assert not validator.can_split([])
+        assert not ParallelGroupsValidator({"type": "object"}, 2).can_split(
+            {"groups": []}
+        )
+
+    def test_validate_without_groups(self, schema):
+        with pytest.raises(ValueError):
+            ParallelGroupsValidator(schema, 2).validate({"version": "1"})
+
+    def test_invalid_schema(self, schema):
+        schema["properties"]["version"]["type"] = "not a type"
+
+        with pytest.raises(jsonschema.SchemaError):
+            ParallelGroupsValidator(schema, 2).validate({"groups": []})
+
+    def test_invalid_max_workers(self, schema):
+        with pytest.raises(ValueError):
+            ParallelGroupsValidator(schema, 0)
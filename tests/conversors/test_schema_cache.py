@@ -0,0 +1,69 @@
+import os
+import pickle
+
+from hflav_fair_client.conversors.schema_cache import SchemaCache
+
+
+class TestSchemaCache:
+    """Test suite for SchemaCache."""
+
+    def test_key_depends_on_content_and_settings(self):
+        keys = {
+            SchemaCache.key_for('{"a": 1}'),
+            SchemaCache.key_for('{"a": 2}'),
+            SchemaCache.key_for('{"a": 1}', "v2"),
+        }
+
+        assert len(keys) == 3
+        assert SchemaCache.key_for('{"a": 1}') == SchemaCache.key_for('{"a": 1}')
+
+    def test_get_missing_schema(self, tmp_path):
+        assert SchemaCache(str(tmp_path)).get("missing") is None
+
+    def test_schemas_are_copied(self):
+        cache = SchemaCache(cache_dir=None)
+        schema = {"type": "object", "properties": {}}
+        cache.put("key", schema)
+
+        schema["type"] = "array"
+        cached = cache.get("key")
+        cached["properties"]["new"] = {}
+
+        assert cache.get("key") == {"type": "object", "properties": {}}
+
+    def test_schemas_are_stored_on_disk(self, tmp_path):
+        SchemaCache(str(tmp_path)).put("key", {"type": "object"})
+
+        assert os.listdir(tmp_path) == ["key.schema.json"]
+        assert SchemaCache(str(tmp_path)).get("key") == {"type": "object"}
+
+    def test_memory_entries_are_bounded(self):
+        cache = SchemaCache(cache_dir=None, max_memory_entries=2)
+        for key in ("a", "b", "c"):
+            cache.put(key, {"key": key})
+
+        assert cache.get("a") is None
+        assert cache.get("c") == {"key": "c"}
+
+    def test_unreadable_schema_is_ignored(self, tmp_path):
+        (tmp_path / "key.schema.json").write_text("not json")
+
+        assert SchemaCache(str(tmp_path)).get("key") is None
+
+    def test_clear(self, tmp_path):
+        cache = SchemaCache(str(tmp_path))
+        cache.put("key", {"type": "object"})
+
+        cache.clear()
+
+        assert cache.get("key") is None
+        assert os.listdir(tmp_path) == []
+
+    def test_pickled_cache_keeps_its_schemas(self):
+        cache = SchemaCache(cache_dir=None)
+        cache.put("key", {"type": "object"})
+
+        copy = pickle.loads(pickle.dumps(cache))
+        copy.put("other", {"type": "array"})
+
+        assert copy.get("key") == {"type": "object"}
@@ -0,0 +1,61 @@
+import random
+
+import pytest
+
+from hflav_fair_client.conversors.schema_sampling import (
+    reservoir_sample,
+    sample_arrays,
+)
+
+
+class TestReservoirSample:
+    """Test suite for reservoir_sample."""
+
+    def test_short_iterables_are_kept(self):
+        assert reservoir_sample(iter(range(3)), 5, random.Random(0)) == [0, 1, 2]
+
+    def test_sample_size_and_membership(self):
+        sample = reservoir_sample(iter(range(1000)), 10, random.Random(0))
+
+        assert len(sample) == 10
+        assert len(set(sample)) == 10
+        assert all(0 <= item < 1000 for item in sample)
+
+    def test_sample_covers_the_whole_iterable(self):
+        rng = random.Random(1)
+        seen = set()
+        for _ in range(200):
+            seen.update(reservoir_sample(iter(range(100)), 5, rng))
+
+        assert max(seen) >= 90
+
+
+class TestSampleArrays:
+    """Test suite for sample_arrays."""
+
+    def test_long_arrays_keep_head_and_sample(self):
+        data = {"groups": [{"averages": list(range(100))}]}
+
+        sampled = sample_arrays(data, 10)
+
+        averages = sampled["groups"][0]["averages"]
+        assert len(averages) == 10
+        assert averages[:5] == [0, 1, 2, 3, 4]
+        assert all(item >= 5 for item in averages[5:])
+        # The original data is not modified
+        assert len(data["groups"][0]["averages"]) == 100
+
+    def test_short_arrays_and_scalars_are_kept(self):
+        data = {"name": "x", "values": [1, 2, 3], "nested": {"items": [[1], [2]]}}
+
+        assert sample_arrays(data, 10) == data
+
+    def test_sample_is_deterministic(self):
+        data = [{"value": i} for i in range(1000)]
+
+        assert sample_arrays(data, 20) == sample_arrays(data, 20)
+        assert sample_arrays(data, 20, seed=1) != sample_arrays(data, 20)
+
+    def test_invalid_sample_size(self):
+        with pytest.raises(ValueError):
+            sample_arrays([], 0)
@@ -0,0 +1,172 @@
+import io
+import json
+import math
+import os
+import pickle
+import struct
+
+import pytest
+
+from hflav_fair_client.conversors.snapshot import (
+    FORMAT_VERSION,
+    MAGIC,
+    file_checksum,
+    read_snapshot,
+    read_snapshot_header,
+    write_snapshot,
+)
+from hflav_fair_client.exceptions.conversor_exceptions import SnapshotException
+from hflav_fair_client.utils.namespace_utils import dict_to_namespace, namespace_to_dict
+
+
+def _data():
+    return {
+        "name": "HFLAV",
+        "version": 3,
+        "empty": [],
+        "groups": [
+            {
+                "name": "group 0",
+                "points": [[i * 0.5, -i * 0.25] for i in range(100)],
+                "correlation": [
+                    [1.0 if i == j else 0.1 for j in range(10)] for i in range(10)
+                ],
+                "indexes": list(range(100)),
+                "mixed": [1, 2.5] * 50,
+                "special": [math.inf, -0.0] * 40,
+                "flags": [True, False] * 40,
+                "small": [1.0, 2.0],
+                "averages": [{"value": {"central": 1.0, "uncertainty": [0.1, 0.2]}}],
+            }
+        ],
+    }
+
+
+def _write_raw(path, header, tree=b""):
+    encoded = json.dumps(header).encode("utf-8")
+    content = MAGIC + struct.pack("<I", len(encoded)) + encoded + tree
+    # Blocks start aligned, as written by write_snapshot
+    path.write_bytes(content + b"\0" * (-len(content) % 8))
+
+
+def _header(tree=b"", **values):
+    return {
+        "format_version": FORMAT_VERSION,
+        "tree_bytes": len(tree),
+        "blocks_bytes": 0,
+        **values,
+    }
+
+
+class _BadReferencePickler(pickle.Pickler):
+    def __init__(self, file, pid):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.pid = pid
+
+    def persistent_id(self, obj):
+        return self.pid if type(obj) is list else None
+
+
+class TestSnapshot:
+    """Test suite for binary snapshots."""
+
+    def test_round_trip(self, tmp_path):
+        path = str(tmp_path / "data.snapshot")
+        write_snapshot(path, dict_to_namespace(_data()), "source", "schema")
+
+        loaded = read_snapshot(path, source_checksum="source", schema_hash="schema")
+
+        assert namespace_to_dict(loaded) == _data()
+        group = loaded.groups[0]
+        assert type(group.indexes[0]) is int
+        assert [type(value) for value in group.mixed[:2]] == [int, float]
+        assert group.flags[0] is True
+        assert math.copysign(1.0, group.special[1]) == -1.0
+
+    def test_numeric_arrays_are_stored_as_blocks(self, tmp_path):
+        path = str(tmp_path / "data.snapshot")
+
+        header = write_snapshot(path, dict_to_namespace(_data()), "source", "schema")
+
+        # points, correlation, indexes and special; mixed, flags and small are pickled
+        assert header["blocks_bytes"] == 8 * (200 + 100 + 100 + 80)
+        assert read_snapshot_header(path)["source_checksum"] == "source"
+
+    def test_outdated_snapshot(self, tmp_path):
+        path = str(tmp_path / "data.snapshot")
+        write_snapshot(path, dict_to_namespace(_data()), "source", "schema")
+
+        with pytest.raises(SnapshotException):
+            read_snapshot(path, source_checksum="other")
+        with pytest.raises(SnapshotException):
+            read_snapshot(path, schema_hash="other")
+
+    @pytest.mark.parametrize("content", [b"", b"{}", b"HFLAVSNP\x05\x00\x00\x00{}{}x"])
+    def test_invalid_snapshot(self, tmp_path, content):
+        path = tmp_path / "data.snapshot"
+        path.write_bytes(content)
+
+        with pytest.raises(SnapshotException):
+            read_snapshot(str(path))
+
+    @pytest.mark.parametrize(
+        "header",
+        [
+            [],
+            {"format_version": FORMAT_VERSION},
+            _header(tree_bytes="10"),
+            _header(blocks_bytes=-8),
+        ],
+    )
+    def test_invalid_header(self, tmp_path, header):
+        path = tmp_path / "data.snapshot"
+        _write_raw(path, header)
+
+        with pytest.raises(SnapshotException):
+            read_snapshot(str(path))
+
+    @pytest.mark.parametrize(
+        "tree", [b"\x80\x05", b"\x80\x05h\x00.", b"\x80\x05}]K\x01s."]
+    )
+    def test_corrupt_tree(self, tmp_path, tree):
+        path = tmp_path / "data.snapshot"
+        _write_raw(path, _header(tree), tree)
+
+        with pytest.raises(SnapshotException):
+            read_snapshot(str(path))
+
+    @pytest.mark.parametrize(
+        "pid", ["bad", ("<f8",), ("<f8", None, 0), ("<f8", (4,), 10**6), ("?", (1,), 0)]
+    )
+    def test_bad_block_reference(self, tmp_path, pid):
+        body = io.BytesIO()
+        _BadReferencePickler(body, pid).dump({"values": [1.0]})
+        path = tmp_path / "data.snapshot"
+        _write_raw(path, _header(body.getvalue()), body.getvalue())
+
+        with pytest.raises(SnapshotException):
+            read_snapshot(str(path))
+
+    def test_truncated_snapshot(self, tmp_path):
+        path = tmp_path / "data.snapshot"
+        write_snapshot(str(path), dict_to_namespace(_data()), "source", "schema")
+        path.write_bytes(path.read_bytes()[:-8])
+
+        with pytest.raises(SnapshotException):
+            read_snapshot(str(path))
+
+    def test_only_namespaces_are_unpickled(self, tmp_path):
+        path = str(tmp_path / "data.snapshot")
+        write_snapshot(path, {"not": os.getcwd}, "source", "schema")
+
+        with pytest.raises(SnapshotException):
+            read_snapshot(path)
+
+    def test_file_checksum(self, tmp_path):
+        path = tmp_path / "data.json"
+        path.write_text("{}")
+        other = tmp_path / "other.json"
+        other.write_text("[]")
+
+        assert file_checksum(str(path)) == file_checksum(str(path))
+        assert file_checksum(str(path)) != file_checksum(str(other))
@@ -0,0 +1,175 @@
+import os
+import pickle
+from unittest.mock import patch
+
+from hflav_fair_client.conversors.parallel_validator import ParallelGroupsValidator
+from hflav_fair_client.container import Container
+from hflav_fair_client.conversors.validation_cache import (
+    ValidationCache,
+    optional_validation_cache,
+    schema_fingerprint,
+)
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string"},
+        "groups": {
+            "type": "array",
+            "minItems": 1,
+            "items": {
+                "type": "object",
+                "properties": {"value": {"type": "number"}},
+            },
+        },
+    },
+}
+
+
+def make_data(size=10):
+    return {"title": "averages", "groups": [{"value": i} for i in range(size)]}
+
+
+class TestValidationCache:
+    """Test suite for ValidationCache."""
+
+    def validated_indexes(self, cache, data, schema=SCHEMA):
+        with patch.object(
+            ParallelGroupsValidator,
+            "validate",
+            autospec=True,
+            side_effect=ParallelGroupsValidator.validate,
+        ) as mock_validate:
+            errors = cache.validate(schema, data)
+        if not mock_validate.called:
+            return errors, None
+        return errors, list(mock_validate.call_args.kwargs["indexes"])
+
+    def test_fingerprint_ignores_key_order(self):
+        reordered = {"properties": SCHEMA["properties"], "type": "object"}
+
+        assert schema_fingerprint(reordered) == schema_fingerprint(SCHEMA)
+        assert schema_fingerprint({"type": "array"}) != schema_fingerprint(SCHEMA)
+
+    def test_first_validation_checks_every_group(self):
+        errors, indexes = self.validated_indexes(ValidationCache(None), make_data())
+
+        assert errors == []
+        assert indexes == list(range(10))
+
+    def test_unchanged_document_is_not_validated_again(self):
+        cache = ValidationCache(None)
+        cache.validate(SCHEMA, make_data())
+
+        errors, indexes = self.validated_indexes(cache, make_data())
+
+        assert errors == []
+        assert indexes is None
+
+    def test_only_changed_groups_are_validated_again(self):
+        cache = ValidationCache(None)
+        cache.validate(SCHEMA, make_data())
+        data = make_data()
+        data["groups"][4]["value"] = 40.5
+        data["groups"].append({"value": 100})
+
+        errors, indexes = self.validated_indexes(cache, data)
+
+        assert errors == []
+        assert indexes == [4, 10]
+
+    def test_errors_are_reported_and_failed_groups_not_remembered(self):
+        cache = ValidationCache(None)
+        data = make_data()
+        data["groups"][2]["value"] = "invalid"
+
+        for _ in range(2):
+            errors, indexes = self.validated_indexes(cache, data)
+            assert [pointer for pointer, _ in errors] == ["/groups/2/value"]
+        assert indexes == [2]
+
+    def test_rest_of_document_is_always_validated(self):
+        cache = ValidationCache(None)
+        cache.validate(SCHEMA, make_data())
+        data = make_data()
+        data["title"] = 3
+
+        errors, indexes = self.validated_indexes(cache, data)
+
+        assert [pointer for pointer, _ in errors] == ["/title"]
+        assert indexes == []
+        assert cache.validate(SCHEMA, {"title": "x", "groups": []}) != []
+
+    def test_other_schema_validates_again(self):
+        cache = ValidationCache(None)
+        cache.validate(SCHEMA, make_data())
+        strict = {
+            **SCHEMA,
+            "properties": {
+                **SCHEMA["properties"],
+                "groups": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {"value": {"type": "number", "maximum": 5}},
+                    },
+                },
+            },
+        }
+
+        errors, indexes = self.validated_indexes(cache, make_data(), strict)
+
+        assert len(errors) == 4
+        assert indexes == list(range(10))
+
+    def test_documents_without_groups_are_memoized_whole(self):
+        cache = ValidationCache(None)
+        schema = {"type": "object", "properties": {"value": {"type": "number"}}}
+
+        assert cache.validate(schema, {"value": 1}) == []
+        assert cache.validate(schema, {"value": "1"})[0][0] == "/value"
+        with patch(
+            "hflav_fair_client.conversors.validation_cache.validators.validator_for"
+        ) as mock_validator_for:
+            assert cache.validate(schema, {"value": 1}) == []
+        mock_validator_for.assert_not_called()
+
+    def test_passed_hashes_are_shared_on_disk(self, tmp_path):
+        ValidationCache(str(tmp_path)).validate(SCHEMA, make_data())
+
+        errors, indexes = self.validated_indexes(
+            ValidationCache(str(tmp_path)), make_data()
+        )
+
+        assert os.listdir(tmp_path) == [f"{schema_fingerprint(SCHEMA)}.hashes"]
+        assert errors == []
+        assert indexes is None
+
+    def test_clear(self, tmp_path):
+        cache = ValidationCache(str(tmp_path))
+        cache.validate(SCHEMA, make_data())
+
+        cache.clear()
+
+        assert os.listdir(tmp_path) == []
+        assert self.validated_indexes(cache, make_data())[1] == list(range(10))
+
+    def test_pickled_cache_keeps_the_passed_hashes(self):
+        cache = ValidationCache(None)
+        cache.validate(SCHEMA, make_data())
+
+        copy = pickle.loads(pickle.dumps(cache))
+
+        assert self.validated_indexes(copy, make_data()) == ([], None)
+
+    def test_optional_validation_cache(self, tmp_path):
+        assert optional_validation_cache(None) is None
+        assert optional_validation_cache("") is None
+        assert optional_validation_cache(str(tmp_path)).cache_dir == str(tmp_path)
+
+    def test_container_cache_is_opt_in(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("HFLAV_VALIDATION_CACHE_DIR", raising=False)
+        assert Container().validation_cache() is None
+
+        monkeypatch.setenv("HFLAV_VALIDATION_CACHE_DIR", str(tmp_path))
+        assert Container().validation_cache().cache_dir == str(tmp_path)
@@ -96,6 +96,14 @@ class TestFilterClasses:
         expected_end = "2023-12-31T00:00:00"
         assert query == f"created:[{expected_start} TO {expected_end}]"
 
+    def test_open_date_range_filter_build_query(self):
+        """Test DateRangeFilter without end date builds an open-ended range."""
+        filter = DateRangeFilter(
+            field="updated", start_date=datetime.datetime(2024, 5, 1, 12, 30)
+        )
+
+        assert filter.build_query() == "updated:[2024-05-01T12:30:00 TO *]"
+
     def test_numeric_filter_build_query(self):
         """Test NumericFilter builds correct query string."""
         filter = NumericFilter(field="version", value=2)
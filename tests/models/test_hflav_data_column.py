@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+
+from hflav_fair_client.models.hflav_data_column import HflavDataColumn
+from hflav_fair_client.models.hflav_query_engine import SearchOperators
+from hflav_fair_client.utils.namespace_utils import dict_to_namespace
+
+
+class TestHflavDataColumn:
+    """Test suite for HflavDataColumn class."""
+
+    @pytest.fixture
+    def sample_data(self):
+        """Create sample HFLAV-like data with averages."""
+        return dict_to_namespace(
+            {
+                "groups": [
+                    {
+                        "averages": [
+                            {
+                                "name": "avg1",
+                                "average": {
+                                    "value": {"central": 1.5, "uncertainty": [0.1, 0.2]}
+                                },
+                            },
+                            {
+                                "name": "avg2",
+                                "average": {
+                                    "value": {"central": 3, "uncertainty": 0.3}
+                                },
+                            },
+                        ]
+                    },
+                    {
+                        "averages": [
+                            {
+                                "name": "avg3",
+                                "average": {"value": {"central": [0.5, 0.6]}},
+                            },
+                            {"name": "avg4"},
+                            {
+                                "name": "avg5",
+                                "average": {"value": {"central": 2.5}},
+                            },
+                        ]
+                    },
+                ]
+            }
+        )
+
+    @pytest.fixture
+    def central_column(self, sample_data):
+        return HflavDataColumn(sample_data, "averages", "average.value.central")
+
+    def test_extracts_one_value_per_object(self, central_column):
+        """Test that missing or non numeric fields become NaN."""
+        assert len(central_column) == 5
+        np.testing.assert_array_equal(
+            central_column.values, [1.5, 3.0, np.nan, np.nan, 2.5]
+        )
+
+    def test_list_index_segments(self, sample_data):
+        """Test that integer path segments index lists."""
+        column = HflavDataColumn(sample_data, "averages", "average.value.uncertainty.1")
+        np.testing.assert_array_equal(
+            column.values, [0.2, np.nan, np.nan, np.nan, np.nan]
+        )
+
+    @pytest.mark.parametrize(
+        "operator, value, expected",
+        [
+            (SearchOperators.GREATER_THAN, 2.5, ["avg2"]),
+            (SearchOperators.GREATER_THAN_OR_EQUALS, 2.5, ["avg2", "avg5"]),
+            (SearchOperators.LESS_THAN, 3, ["avg1", "avg5"]),
+            (SearchOperators.LESS_THAN_OR_EQUALS, 3, ["avg1", "avg2", "avg5"]),
+        ],
+    )
+    def test_filter(self, central_column, operator, value, expected):
+        """Test vectorized filtering keeps the document order."""
+        results = central_column.filter(operator, value)
+        assert [r.name for r in results] == expected
+
+    def test_filter_returns_the_data_objects(self, central_column, sample_data):
+        """Test that the objects of the data are returned."""
+        results = central_column.filter(SearchOperators.GREATER_THAN, 2.9)
+        assert results == [sample_data.groups[0].averages[1]]
+        assert results[0] is sample_data.groups[0].averages[1]
+
+    def test_mask(self, central_column):
+        """Test the boolean mask over the column."""
+        mask = central_column.mask(SearchOperators.LESS_THAN, 2)
+        np.testing.assert_array_equal(mask, [True, False, False, False, False])
+
+    def test_non_numeric_operator_raises(self, central_column):
+        """Test that only numeric comparison operators are accepted."""
+        with pytest.raises(ValueError):
+            central_column.filter(SearchOperators.EQUALS, 1.5)
+
+    def test_non_numeric_value_raises(self, central_column):
+        """Test that only numeric values are accepted."""
+        with pytest.raises(ValueError):
+            central_column.filter(SearchOperators.GREATER_THAN, "1.5")
@@ -0,0 +1,127 @@
+import pytest
+
+from hflav_fair_client.models.hflav_data_index import HflavDataIndex
+from hflav_fair_client.models.hflav_query_engine import SearchOperators
+from hflav_fair_client.utils.namespace_utils import dict_to_namespace
+
+
+class TestHflavDataIndex:
+    """Test suite for HflavDataIndex class."""
+
+    @pytest.fixture
+    def sample_data(self):
+        """Create sample HFLAV-like data for testing."""
+        return {
+            "groups": [
+                {
+                    "name": "group1",
+                    "averages": [
+                        {"name": "avg1", "PDGcode": "511", "value": 1.5},
+                        {"name": "avg2", "PDGcode": "521", "value": 3.0},
+                    ],
+                },
+                {
+                    "name": "group2",
+                    "averages": [
+                        {"name": "avg3", "PDGcode": "511", "value": 0.5},
+                        {"name": "avg4", "PDGcode": "abc", "value": 2},
+                    ],
+                },
+            ]
+        }
+
+    @pytest.fixture
+    def pdg_index(self, sample_data):
+        return HflavDataIndex(sample_data, "averages", "PDGcode")
+
+    @pytest.fixture
+    def value_index(self, sample_data):
+        return HflavDataIndex(sample_data, "averages", "value")
+
+    def test_collects_candidates_in_document_order(self, pdg_index):
+        """Test that every object under object_name is indexed."""
+        assert len(pdg_index) == 4
+        assert pdg_index.object_name == "averages"
+        assert pdg_index.key_name == "PDGcode"
+
+    def test_lookup_equals_string(self, pdg_index):
+        """Test equality lookup with a string value."""
+        results = pdg_index.lookup_equals("511")
+        assert [r["name"] for r in results] == ["avg1", "avg3"]
+
+    def test_lookup_equals_int_coerces_strings(self, pdg_index):
+        """Test that integer values match strings holding that integer."""
+        results = pdg_index.lookup_equals(511)
+        assert [r["name"] for r in results] == ["avg1", "avg3"]
+
+    def test_lookup_equals_float_does_not_coerce_strings(self, pdg_index):
+        """Test that float values do not match numeric strings."""
+        assert pdg_index.lookup_equals(511.0) == []
+
+    def test_lookup_equals_no_match(self, pdg_index):
+        """Test equality lookup without matches."""
+        assert pdg_index.lookup_equals("999") == []
+
+    def test_lookup_equals_unsupported_value(self, pdg_index):
+        """Test that non scalar values are not answered by the index."""
+        assert pdg_index.lookup_equals(None) is None
+
+    @pytest.mark.parametrize(
+        "operator, value, expected",
+        [
+            (SearchOperators.GREATER_THAN, 1.5, ["avg2", "avg4"]),
+            (SearchOperators.GREATER_THAN_OR_EQUALS, 1.5, ["avg1", "avg2", "avg4"]),
+            (SearchOperators.LESS_THAN, 2, ["avg1", "avg3"]),
+            (SearchOperators.LESS_THAN_OR_EQUALS, 2, ["avg1", "avg3", "avg4"]),
+        ],
+    )
+    def test_lookup_range(self, value_index, operator, value, expected):
+        """Test numeric range lookups keep the document order."""
+        results = value_index.lookup_range(operator, value)
+        assert [r["name"] for r in results] == expected
+
+    def test_lookup_range_with_int_coerces_strings(self, pdg_index):
+        """Test that integer range queries compare numeric strings as integers."""
+        results = pdg_index.lookup_range(SearchOperators.GREATER_THAN, 515)
+        assert [r["name"] for r in results] == ["avg2"]
+
+    def test_lookup_range_with_float_skips_strings(self, pdg_index):
+        """Test that float range queries never match strings."""
+        assert pdg_index.lookup_range(SearchOperators.GREATER_THAN, 515.0) == []
+
+    def test_lookup_range_skips_unorderable_values(self):
+        """Test that lists or nulls under the key never match."""
+        index = HflavDataIndex(
+            {"items": [{"value": [1, 2]}, {"value": None}, {"value": 3}]},
+            "items",
+            "value",
+        )
+        assert index.lookup_range(SearchOperators.GREATER_THAN, 1) == [{"value": 3}]
+        assert index.lookup_equals(3) == [{"value": 3}]
+
+    def test_lookup_range_with_string_value_is_unsupported(self, pdg_index):
+        """Test that non numeric range queries are left to the query engine."""
+        assert pdg_index.lookup_range(SearchOperators.GREATER_THAN, "5") is None
+
+    def test_lookup_range_invalid_operator(self, value_index):
+        """Test that non range operators are not answered by lookup_range."""
+        assert value_index.lookup_range(SearchOperators.EQUALS, 1) is None
+
+    def test_nested_key_values_match_once(self):
+        """Test that an object with several matching values is returned once."""
+        data = {"items": [{"a": {"value": 1}, "b": [{"value": 1}]}]}
+        index = HflavDataIndex(data, "items", "value")
+        assert len(index.lookup_equals(1)) == 1
+        assert len(index.lookup_range(SearchOperators.GREATER_THAN_OR_EQUALS, 1)) == 1
+
+    def test_indexes_namespaces(self, sample_data):
+        """Test that namespaces are indexed like dicts, returning the same objects."""
+        data = dict_to_namespace(sample_data)
+        index = HflavDataIndex(data, "averages", "PDGcode")
+        assert index.lookup_equals(521) == [data.groups[0].averages[1]]
+
+    def test_object_stored_as_dict_indexes_its_values(self):
+        """Test that objects stored as a mapping index their values, like JSONPath."""
+        data = {"average": {"value": {"central": 1}, "other": {"central": 2}}}
+        index = HflavDataIndex(data, "average", "central")
+        assert index.lookup_equals(2) == [{"central": 2}]
@@ -6,6 +6,11 @@ from hflav_fair_client.models.hflav_data_searching import (
     HflavDataSearching,
     SearchOperators,
 )
+from hflav_fair_client.models.hflav_query_engine import (
+    AndPredicate,
+    KeyPredicate,
+    OrPredicate,
+)
 
 
 class TestHflavDataSearching:
@@ -146,3 +151,235 @@ class TestHflavDataSearching:
         assert len(results) >= 1
         found = any(r.name == "exp1_m1" for r in results)
         assert found
+
+    @pytest.mark.parametrize(
+        "key_name, operator, value",
+        [
+            ("type", SearchOperators.EQUALS, "typeA"),
+            ("value", SearchOperators.EQUALS, 10.5),
+            ("value", SearchOperators.GREATER_THAN, 15.0),
+            ("value", SearchOperators.GREATER_THAN_OR_EQUALS, 15.7),
+            ("value", SearchOperators.LESS_THAN, 20),
+            ("value", SearchOperators.LESS_THAN_OR_EQUALS, 20.3),
+            ("type", SearchOperators.NOT_EQUALS, "typeA"),
+            ("name", SearchOperators.REGEX, "^exp1"),
+        ],
+    )
+    def test_indexed_search_matches_query_engine_search(
+        self, sample_hflav_data, mock_visualizer, key_name, operator, value
+    ):
+        """Test that indexed searches return the same results as full scans."""
+        indexed = HflavDataSearching(sample_hflav_data, visualizer=mock_visualizer)
+        scanned = HflavDataSearching(
+            sample_hflav_data, visualizer=mock_visualizer, use_indexes=False
+        )
+
+        expected = scanned.get_data_object_from_key_and_value(
+            "measurements", key_name, operator, value
+        )
+        results = indexed.get_data_object_from_key_and_value(
+            "measurements", key_name, operator, value
+        )
+
+        assert results == expected
+
+    def test_index_is_built_lazily_and_reused(self, hflav_searching):
+        """Test that an index is built on the first query and then reused."""
+        assert hflav_searching._indexes == {}
+
+        hflav_searching.get_data_object_from_key_and_value(
+            "measurements", "type", SearchOperators.EQUALS, "typeA"
+        )
+        index = hflav_searching._indexes[("measurements", "type")]
+        hflav_searching.get_data_object_from_key_and_value(
+            "measurements", "type", SearchOperators.EQUALS, "typeB"
+        )
+
+        assert hflav_searching.build_index("measurements", "type") is index
+
+    def test_non_indexed_operator_does_not_build_index(self, hflav_searching):
+        """Test that operators without index support use the query engine."""
+        hflav_searching.get_data_object_from_key_and_value(
+            "measurements", "type", SearchOperators.NOT_EQUALS, "typeA"
+        )
+        assert hflav_searching._indexes == {}
+
+    def test_clear_indexes(self, hflav_searching, sample_hflav_data):
+        """Test that clearing the indexes picks up changes in the data."""
+        hflav_searching.get_data_object_from_key_and_value(
+            "measurements", "type", SearchOperators.EQUALS, "typeB"
+        )
+        sample_hflav_data.measurements[0].type = "typeB"
+        hflav_searching.clear_indexes()
+
+        results = hflav_searching.get_data_object_from_key_and_value(
+            "measurements", "type", SearchOperators.EQUALS, "typeB"
+        )
+
+        assert [r.name for r in results] == ["measurement1", "measurement2"]
+
+    def test_results_are_the_searched_objects(self, hflav_searching, sample_hflav_data):
+        """Test that results are the objects stored in the data, not copies."""
+        results = hflav_searching.get_data_object_from_key_and_value(
+            "measurements", "name", SearchOperators.NOT_EQUALS, "measurement2"
+        )
+        assert results[0] is sample_hflav_data.measurements[0]
+
+    def test_get_data_objects_matching_combined_predicates(
+        self, hflav_searching, mock_visualizer
+    ):
+        """Test searching with AND/OR combinations of predicates."""
+        results = hflav_searching.get_data_objects_matching(
+            "measurements",
+            AndPredicate(
+                KeyPredicate("type", SearchOperators.EQUALS, "typeA"),
+                OrPredicate(
+                    KeyPredicate("value", SearchOperators.GREATER_THAN, 15.0),
+                    KeyPredicate("name", SearchOperators.REGEX, "^exp1"),
+                ),
+            ),
+        )
+
+        assert [r.name for r in results] == ["measurement3", "exp1_m1"]
+        assert mock_visualizer.print_json_data.call_count == 2
+
+    def test_get_data_objects_from_numeric_field(
+        self, hflav_searching, mock_visualizer
+    ):
+        """Test vectorized filtering over a numeric field."""
+        results = hflav_searching.get_data_objects_from_numeric_field(
+            "measurements", "value", SearchOperators.GREATER_THAN_OR_EQUALS, 15.7
+        )
+
+        assert [r.name for r in results] == ["measurement2", "measurement3", "exp1_m2"]
+        assert mock_visualizer.print_json_data.call_count == 3
+
+    def test_numeric_field_column_is_reused(self, hflav_searching):
+        """Test that a column is extracted once and dropped by clear_indexes."""
+        column = hflav_searching.get_column("measurements", "value")
+        assert hflav_searching.get_column("measurements", "value") is column
+
+        hflav_searching.clear_indexes()
+
+        assert hflav_searching.get_column("measurements", "value") is not column
+
+    def test_iter_data_object_from_key_and_value(
+        self, hflav_searching, mock_visualizer
+    ):
+        """Test that the streaming variant yields the same results lazily."""
+        iterator = hflav_searching.iter_data_object_from_key_and_value(
+            "measurements", "type", SearchOperators.EQUALS, "typeA"
+        )
+
+        mock_visualizer.print_json_data.assert_not_called()
+        first = next(iterator)
+        assert first.name == "measurement1"
+        assert mock_visualizer.print_json_data.call_count == 1
+        assert [r.name for r in iterator] == ["measurement3", "exp1_m1"]
+
+    @pytest.mark.parametrize(
+        "limit, offset, expected",
+        [
+            (None, 0, ["measurement1", "measurement3", "exp1_m1"]),
+            (1, 0, ["measurement1"]),
+            (2, 1, ["measurement3", "exp1_m1"]),
+            (5, 2, ["exp1_m1"]),
+            (0, 0, []),
+            (None, 3, []),
+        ],
+    )
+    def test_iter_data_object_limit_and_offset(
+        self, hflav_searching, limit, offset, expected
+    ):
+        """Test limit and offset of the streaming variant."""
+        results = hflav_searching.iter_data_object_from_key_and_value(
+            "measurements",
+            "type",
+            SearchOperators.EQUALS,
+            "typeA",
+            limit=limit,
+            offset=offset,
+        )
+        assert [r.name for r in results] == expected
+
+    def test_iter_data_object_stops_walking_early(self, hflav_searching):
+        """Test that the data is only walked as far as needed."""
+        with patch(
+            "hflav_fair_client.models.hflav_data_searching.find_matching_objects"
+        ) as mock_find:
+            candidates = iter(
+                [SimpleNamespace(name="first"), SimpleNamespace(name="second")]
+            )
+            mock_find.return_value = candidates
+
+            results = list(
+                hflav_searching.iter_data_object_from_key_and_value(
+                    "measurements", "name", SearchOperators.NOT_EQUALS, "x", limit=1
+                )
+            )
+
+        assert [r.name for r in results] == ["first"]
+        assert next(candidates).name == "second"
+
+    def test_iter_data_object_does_not_build_index(self, hflav_searching):
+        """Test that the streaming variant only uses already built indexes."""
+        list(
+            hflav_searching.iter_data_object_from_key_and_value(
+                "measurements", "type", SearchOperators.EQUALS, "typeA"
+            )
+        )
+        assert hflav_searching._indexes == {}
+
+        hflav_searching.build_index("measurements", "type")
+        results = hflav_searching.iter_data_object_from_key_and_value(
+            "measurements", "type", SearchOperators.EQUALS, "typeA", offset=1
+        )
+        assert [r.name for r in results] == ["measurement3", "exp1_m1"]
+
+    @pytest.mark.parametrize("limit, offset", [(-1, 0), (None, -1)])
+    def test_iter_data_object_invalid_limit_or_offset(
+        self, hflav_searching, limit, offset
+    ):
+        """Test that negative limit or offset are rejected."""
+        with pytest.raises(ValueError):
+            hflav_searching.iter_data_object_from_key_and_value(
+                "measurements",
+                "type",
+                SearchOperators.EQUALS,
+                "typeA",
+                limit=limit,
+                offset=offset,
+            )
+
+    def test_iter_data_objects_matching(self, hflav_searching):
+        """Test the streaming variant of combined predicate searches."""
+        results = hflav_searching.iter_data_objects_matching(
+            "measurements",
+            OrPredicate(
+                KeyPredicate("type", SearchOperators.EQUALS, "typeB"),
+                KeyPredicate("type", SearchOperators.EQUALS, "typeC"),
+            ),
+            limit=1,
+        )
+        assert [r.name for r in results] == ["measurement2"]
+
+    def test_non_verbose_search_skips_visualization(
+        self, sample_hflav_data, mock_visualizer
+    ):
+        """Test that results are not printed when verbose is disabled."""
+        searching = HflavDataSearching(
+            sample_hflav_data, visualizer=mock_visualizer, verbose=False
+        )
+
+        results = searching.get_data_object_from_key_and_value(
+            "measurements", "type", SearchOperators.EQUALS, "typeA"
+        )
+        streamed = list(
+            searching.iter_data_object_from_key_and_value(
+                "measurements", "type", SearchOperators.EQUALS, "typeA"
+            )
+        )
+
+        assert len(results) == 3
+        assert streamed == results
+        mock_visualizer.print_json_data.assert_not_called()
@@ -0,0 +1,152 @@
+import random
+
+import pytest
+from jsonpath_ng.ext import parse
+
+from hflav_fair_client.models.hflav_query_engine import (
+    AndPredicate,
+    KeyPredicate,
+    OrPredicate,
+    SearchOperators,
+    collect_key_values,
+    find_matching_objects,
+    iter_search_candidates,
+)
+from hflav_fair_client.utils.namespace_utils import dict_to_namespace
+
+
+class TestHflavQueryEngine:
+    """Test suite for the native query engine."""
+
+    @pytest.fixture
+    def sample_data(self):
+        """Create sample HFLAV-like data for testing."""
+        return {
+            "groups": [
+                {
+                    "name": "B0",
+                    "averages": [
+                        {"name": "B0 lifetime", "PDGcode": "511", "value": 1.5},
+                        {"name": "B+ lifetime", "PDGcode": "521", "value": 1.6},
+                    ],
+                },
+                {
+                    "name": "Bs",
+                    "averages": [
+                        {"name": "Bs lifetime", "PDGcode": "531", "value": [1.4]},
+                    ],
+                    "nested": {"averages": [{"name": "inner", "PDGcode": "511"}]},
+                },
+            ]
+        }
+
+    def _names(self, objects):
+        return [obj["name"] for obj in objects]
+
+    def test_iter_search_candidates_in_document_order(self, sample_data):
+        """Test that candidates are visited in document pre-order."""
+        candidates = iter_search_candidates(sample_data, "averages")
+        assert self._names(candidates) == [
+            "B0 lifetime",
+            "B+ lifetime",
+            "Bs lifetime",
+            "inner",
+        ]
+
+    def test_iter_search_candidates_over_namespace(self, sample_data):
+        """Test that namespaces are walked like dicts."""
+        data = dict_to_namespace(sample_data)
+        candidates = list(iter_search_candidates(data, "averages"))
+        assert candidates[0] is data.groups[0].averages[0]
+        assert len(candidates) == 4
+
+    def test_collect_key_values_single_walk(self, sample_data):
+        """Test that values of several keys are collected at any depth."""
+        values = collect_key_values(sample_data["groups"][1], {"PDGcode", "value"})
+        assert sorted(values["PDGcode"]) == ["511", "531"]
+        assert values["value"] == [[1.4]]
+
+    def test_key_predicate_int_coerces_strings(self, sample_data):
+        """Test that integer values match strings holding that integer."""
+        predicate = KeyPredicate("PDGcode", SearchOperators.EQUALS, 511)
+        results = find_matching_objects(sample_data, "averages", predicate)
+        assert self._names(results) == ["B0 lifetime", "inner"]
+
+    def test_key_predicate_regex_is_precompiled(self):
+        """Test that the regex is compiled once when building the predicate."""
+        predicate = KeyPredicate("name", SearchOperators.REGEX, "^B[0+]")
+        assert predicate.matches({"name": "B0 lifetime"})
+        assert not predicate.matches({"name": "Bs lifetime"})
+        assert not predicate.matches({"name": 5})
+
+    def test_key_predicate_uncomparable_values_do_not_match(self):
+        """Test that values which cannot be compared never match."""
+        predicate = KeyPredicate("value", SearchOperators.GREATER_THAN, 1.0)
+        assert not predicate.matches({"value": [1.4]})
+        assert not predicate.matches({"value": None})
+        assert not predicate.matches({"value": "abc"})
+        assert predicate.matches({"value": 1.4})
+
+    def test_key_predicate_without_key_does_not_match(self):
+        """Test that objects without the key never match."""
+        predicate = KeyPredicate("value", SearchOperators.NOT_EQUALS, 1.0)
+        assert not predicate.matches({"other": 2.0})
+
+    def test_and_or_predicates(self, sample_data):
+        """Test AND/OR combinations of predicates."""
+        predicate = OrPredicate(
+            AndPredicate(
+                KeyPredicate("PDGcode", SearchOperators.EQUALS, "511"),
+                KeyPredicate("value", SearchOperators.LESS_THAN, 2),
+            ),
+            KeyPredicate("name", SearchOperators.REGEX, "^Bs"),
+        )
+        assert predicate.key_names() == {"PDGcode", "value", "name"}
+        results = find_matching_objects(sample_data, "averages", predicate)
+        assert self._names(results) == ["B0 lifetime", "Bs lifetime"]
+
+    def test_empty_and_predicate_matches_everything(self, sample_data):
+        """Test that an AND without predicates matches every candidate."""
+        results = list(find_matching_objects(sample_data, "averages", AndPredicate()))
+        assert len(results) == 4
+
+    def test_same_results_as_jsonpath(self):
+        """Test that the engine returns the same objects as the JSONPath filter."""
+        rng = random.Random(0)
+
+        def random_value():
+            return rng.choice(
+                [rng.randint(0, 5), rng.random() * 5, str(rng.randint(0, 5)), "a"]
+            )
+
+        def random_node(depth):
+            if depth > 3:
+                return random_value()
+            if rng.random() < 0.5:
+                return {
+                    rng.choice(["m", "k", "x"]): random_node(depth + 1)
+                    for _ in range(rng.randint(1, 3))
+                }
+            if rng.random() < 0.7:
+                return [random_node(depth + 1) for _ in range(rng.randint(0, 3))]
+            return random_value()
+
+        operators = [
+            SearchOperators.EQUALS,
+            SearchOperators.NOT_EQUALS,
+            SearchOperators.GREATER_THAN,
+            SearchOperators.LESS_THAN_OR_EQUALS,
+        ]
+        for _ in range(300):
+            data = {"root": random_node(0)}
+            operator = rng.choice(operators)
+            value = rng.choice([rng.randint(0, 5), rng.random() * 5])
+            expression = parse(f"$..m[?(@..k {operator.value} {value})]")
+            try:
+                expected = [match.value for match in expression.find(data)]
+            except TypeError:
+                # JSONPath raises on uncomparable values, the engine skips them
+                continue
+
+            predicate = KeyPredicate("k", operator, value)
+            assert list(find_matching_objects(data, "m", predicate)) == expected
@@ -3,7 +3,13 @@ from datetime import datetime
 from typing import Dict, Any, ClassVar, List
 from unittest.mock import Mock, patch
 
-from hflav_fair_client.models.models import ZenodoElement, File, Record, Template
+from hflav_fair_client.models.models import (
+    ZenodoElement,
+    File,
+    Record,
+    RecordSummary,
+    Template,
+)
 
 
 class TestZenodoElementInterface:
@@ -338,6 +344,136 @@ class TestRecordClass:
         assert record.children[1].name == "file2.csv"
 
 
+class TestRecordChildIndex:
+    """Test suite for the name index used by Record.get_child."""
+
+    def _record(self, names):
+        return Record.model_validate(
+            {
+                "id": 700,
+                "doi": "10.1234/zenodo.700",
+                "created": "2023-01-01T12:00:00",
+                "updated": "2023-01-02T12:00:00",
+                "links": {},
+                "metadata": {"title": "Record"},
+                "files": [
+                    {"key": name, "links": {"self": f"http://example.com/{i}"}}
+                    for i, name in enumerate(names)
+                ],
+            }
+        )
+
+    def _file(self, name):
+        return File.model_validate({"key": name, "links": {"self": "http://new"}})
+
+    def test_index_follows_add_and_remove(self):
+        """Test that the index is invalidated when children are added or removed."""
+        record = self._record(["a.json", "b.json"])
+        assert record.get_child("a.json").name == "a.json"
+
+        record.add_child(self._file("c.json"))
+        record.remove_child("a.json")
+
+        assert record.get_child("c.json").download_url == "http://new"
+        with pytest.raises(ValueError, match="not found"):
+            record.get_child("a.json")
+        assert [c.name for c in record.children] == ["b.json", "c.json"]
+
+    def test_index_follows_replaced_children(self):
+        """Test that the index is rebuilt when the children list is replaced."""
+        record = self._record(["a.json"])
+        assert record.get_child("a.json")
+
+        record.children = [self._file("z.json")]
+
+        assert record.get_child("z.json").name == "z.json"
+
+    def test_index_follows_children_replaced_in_place(self):
+        """Test that a child replaced in place is found like a linear scan would."""
+        record = self._record(["a.json", "b.json"])
+        assert record.get_child("a.json").name == "a.json"
+
+        record.children[0] = self._file("z.json")
+
+        assert record.get_child("z.json").download_url == "http://new"
+        with pytest.raises(ValueError, match="not found"):
+            record.get_child("a.json")
+        assert record.get_child("b.json").name == "b.json"
+
+    def test_first_duplicate_wins(self):
+        """Test that duplicated names resolve to the first child, like a scan."""
+        record = self._record(["a.json", "a.json"])
+
+        assert record.get_child("a.json").download_url == "http://example.com/0"
+
+    def test_index_is_ignored_by_equality(self):
+        """Test that looking up a child does not change model equality."""
+        record = self._record(["a.json"])
+        other = self._record(["a.json"])
+
+        record.get_child("a.json")
+
+        assert record == other
+
+
+class TestRecordSummaryClass:
+    """Test suite for the lightweight RecordSummary view of a search hit."""
+
+    json_data = {
+        "id": 12345,
+        "doi": "10.5281/zenodo.12345",
+        "created": "2023-01-01T12:00:00",
+        "updated": "2023-01-02T12:00:00+00:00",
+        "links": {"self": "https://zenodo.org/api/records/12345"},
+        "metadata": {"title": "Test Record Title"},
+        "files": [
+            {
+                "key": "file1.pdf",
+                "links": {"self": "https://zenodo.org/api/files/file1.pdf"},
+            },
+            {
+                "key": "file2.csv",
+                "links": {"self": "https://zenodo.org/api/files/file2.csv"},
+            },
+        ],
+    }
+
+    def test_summary_matches_record(self):
+        """Test that the summary exposes the same data as the validated Record."""
+        summary = RecordSummary(self.json_data)
+        record = Record.model_validate(self.json_data)
+
+        assert summary.id == record.id
+        assert summary.name == record.name
+        assert summary.created == record.created
+        assert summary.updated == record.updated
+        assert summary.is_leaf == record.is_leaf
+        assert summary.get_data() == record.get_data()
+        assert str(summary) == str(record)
+        assert summary.to_record() == record
+
+    def test_summary_is_lazy(self):
+        """Test that timestamps and files are only parsed on first access."""
+        summary = RecordSummary(self.json_data)
+
+        assert summary._created is None
+        assert summary._children is None
+        children = summary.children
+        assert [child.name for child in children] == ["file1.pdf", "file2.csv"]
+        assert summary.children is children
+
+    def test_summary_get_child(self):
+        """Test get_child on a summary."""
+        summary = RecordSummary(self.json_data)
+
+        child = summary.get_child("file2.csv")
+
+        assert isinstance(child, File)
+        assert child.download_url == "https://zenodo.org/api/files/file2.csv"
+        with pytest.raises(ValueError):
+            summary.get_child("missing.txt")
+
+
 class TestTemplateClass:
     """Test suite for Template class public interface."""
 
@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+from hflav_fair_client.processing.batch_plotter import MANIFEST_FILENAME, BatchPlotter
+from hflav_fair_client.processing.data_plotter import DataPlotter
+from hflav_fair_client.utils.namespace_utils import dict_to_namespace
+
+
+def _data(num_groups=4):
+    groups = [
+        {
+            "name": f"group {i}/b",
+            "averages": [
+                {"name": f"average_{j}", "value": {"central": j, "uncertainty": 0.1}}
+                for j in range(5)
+            ],
+        }
+        for i in range(num_groups)
+    ]
+    groups.append({"name": "empty"})
+    return dict_to_namespace({"groups": groups})
+
+
+class TestBatchPlotter:
+    """Test suite for BatchPlotter."""
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_plot_groups(self, tmp_path, max_workers):
+        plotter = BatchPlotter(DataPlotter(), max_workers=max_workers)
+
+        manifest = plotter.plot_groups(_data(), str(tmp_path), formats=["png", "svg"])
+
+        assert manifest["figures"] == 4
+        assert manifest["figures_per_second"] > 0
+        assert [entry["index"] for entry in manifest["groups"]] == [0, 1, 2, 3, 4]
+        assert manifest["groups"][0]["files"] == [
+            "0000_group_0_b.png",
+            "0000_group_0_b.svg",
+        ]
+        for entry in manifest["groups"][:4]:
+            for filename in entry["files"]:
+                assert (tmp_path / filename).stat().st_size > 0
+
+    def test_groups_without_plottable_data_are_skipped(self, tmp_path):
+        manifest = BatchPlotter(DataPlotter(), max_workers=1).plot_groups(
+            _data(num_groups=0), str(tmp_path)
+        )
+
+        assert manifest["figures"] == 0
+        assert manifest["groups"][0]["name"] == "empty"
+        assert manifest["groups"][0]["files"] == []
+        assert "skipped" in manifest["groups"][0]
+
+    def test_manifest_is_written(self, tmp_path):
+        manifest = BatchPlotter(DataPlotter(), max_workers=1).plot_groups(
+            _data(num_groups=2), str(tmp_path / "figures"), formats=[".PDF"]
+        )
+
+        with open(tmp_path / "figures" / MANIFEST_FILENAME) as f:
+            assert json.load(f) == manifest
+        assert manifest["formats"] == ["pdf"]
+
+    def test_unsupported_format(self, tmp_path):
+        with pytest.raises(ValueError):
+            BatchPlotter(DataPlotter()).plot_groups(
+                _data(), str(tmp_path), formats=["bmp"]
+            )
+
+    def test_invalid_max_workers(self):
+        with pytest.raises(ValueError):
+            BatchPlotter(DataPlotter(), max_workers=0)
@@ -0,0 +1,122 @@
+import numpy as np
+import pytest
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+
+from hflav_fair_client.processing.data_plotter import DataPlotter
+from hflav_fair_client.processing.plotter_interface import PlotterInterface
+from hflav_fair_client.utils.namespace_utils import dict_to_namespace
+
+
+def _data(num_averages=3, num_contour_points=0, num_scan_points=0):
+    angles = np.linspace(0, 2 * np.pi, num_contour_points, endpoint=False)
+    scan_x = np.linspace(-1, 1, num_scan_points)
+    group = {
+        "name": "group",
+        "averages": [
+            {
+                "name": f"average_{i}",
+                "value": {"central": float(i), "uncertainty": [0.1, 0.2]},
+            }
+            for i in range(num_averages)
+        ],
+    }
+    if num_contour_points:
+        group["contours"] = [
+            {"points": np.column_stack((np.cos(angles), np.sin(angles))).tolist()}
+        ]
+    if num_scan_points:
+        group["scans"] = [{"points": {"x": scan_x.tolist(), "y": (scan_x**2).tolist()}}]
+    return dict_to_namespace({"groups": [group]})
+
+
+class TestDataPlotter:
+    """Test suite for DataPlotter focusing on the public interface."""
+
+    def test_implements_plotter_interface(self):
+        assert isinstance(DataPlotter(), PlotterInterface)
+
+    def test_plot_averages(self):
+        figure = DataPlotter().plot(_data(num_averages=3))
+
+        assert isinstance(figure, Figure)
+        assert len(figure.axes) == 1
+        labels = [label.get_text() for label in figure.axes[0].get_yticklabels()]
+        assert labels == ["average_0", "average_1", "average_2"]
+
+    def test_averages_are_drawn_with_a_single_errorbar(self):
+        figure = DataPlotter().plot(_data(num_averages=500))
+        ax = figure.axes[0]
+
+        assert len(ax.containers) == 1
+        assert len(ax.collections) == 1
+        assert ax.get_yticklabels() == []
+
+    def test_asymmetric_uncertainties(self):
+        figure = DataPlotter().plot(_data(num_averages=1))
+        segments = figure.axes[0].collections[0].get_segments()
+
+        np.testing.assert_allclose(segments[0][:, 0], [-0.1, 0.2])
+
+    def test_one_axes_per_kind_of_content(self):
+        figure = DataPlotter().plot(
+            _data(num_averages=2, num_contour_points=10, num_scan_points=10)
+        )
+
+        assert [ax.get_title() for ax in figure.axes] == [
+            "Averages (2)",
+            "Contours (1)",
+            "Scans (1)",
+        ]
+        contour_collection = figure.axes[1].collections[0]
+        assert isinstance(contour_collection, LineCollection)
+        # Contours are closed
+        segment = contour_collection.get_segments()[0]
+        np.testing.assert_array_equal(segment[0], segment[-1])
+
+    def test_long_curves_are_decimated(self):
+        figure = DataPlotter(decimation_threshold=500).plot(
+            _data(num_averages=0, num_contour_points=20000, num_scan_points=20000)
+        )
+
+        contour = figure.axes[0].collections[0].get_segments()[0]
+        scan = figure.axes[1].collections[0].get_segments()[0]
+        assert len(contour) < 2000
+        assert len(scan) <= 4 * 1000
+        # The scan keeps its end points and minimum
+        np.testing.assert_array_equal(scan[[0, -1], 0], [-1, 1])
+        assert scan[:, 1].min() == pytest.approx(0, abs=1e-7)
+
+    def test_short_curves_are_not_decimated(self):
+        figure = DataPlotter(decimation_threshold=500).plot(
+            _data(num_averages=0, num_contour_points=400, num_scan_points=400)
+        )
+
+        assert len(figure.axes[0].collections[0].get_segments()[0]) == 401
+        assert len(figure.axes[1].collections[0].get_segments()[0]) == 400
+
+    def test_decimation_disabled(self):
+        figure = DataPlotter(decimation_threshold=None).plot(
+            _data(num_averages=0, num_scan_points=20000)
+        )
+
+        assert len(figure.axes[0].collections[0].get_segments()[0]) == 20000
+
+    @pytest.mark.parametrize(
+        "arguments", [{"decimation_threshold": 1}, {"decimation_tolerance": -1}]
+    )
+    def test_invalid_decimation_settings(self, arguments):
+        with pytest.raises(ValueError):
+            DataPlotter(**arguments)
+
+    def test_plot_without_plottable_data(self):
+        with pytest.raises(ValueError):
+            DataPlotter().plot(dict_to_namespace({"groups": []}))
+
+    @pytest.mark.parametrize("extension", ["png", "svg", "pdf"])
+    def test_plot_saves_figure(self, tmp_path, extension):
+        save_path = tmp_path / f"plot.{extension}"
+
+        DataPlotter().plot(_data(), save_path=str(save_path))
+
+        assert save_path.stat().st_size > 0
@@ -0,0 +1,118 @@
+from datetime import datetime
+
+import pytest
+
+from hflav_fair_client.models.models import Record
+from hflav_fair_client.processing.dataset_store import DatasetStore
+from hflav_fair_client.utils.namespace_utils import dict_to_namespace
+
+
+def _record(record_id=1, updated="2024-01-01T00:00:00"):
+    return Record(
+        id=record_id,
+        doi=f"10.5281/zenodo.{record_id}",
+        metadata={"title": f"HFLAV release {record_id}"},
+        created="2023-01-01T00:00:00",
+        updated=updated,
+        links={},
+        files=[{"key": "data.json", "links": {"self": "https://zenodo.org/data"}}],
+    )
+
+
+def _data(central=1.0):
+    return dict_to_namespace(
+        {
+            "groups": [
+                {
+                    "name": "B decays",
+                    "averages": [
+                        {"name": "BR(B->K pi)", "PDGcode": "511", "value": central},
+                        {"name": "BR(B->pi pi)", "PDGcode": "521", "value": 2.0},
+                    ],
+                    "scans": [{"name": "scan", "points": [[0.0, 1.0], [1.0, 0.0]]}],
+                }
+            ]
+        }
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = DatasetStore(str(tmp_path / "store" / "hflav.sqlite"))
+    yield store
+    store.close()
+
+
+class TestDatasetStore:
+    """Test suite for DatasetStore."""
+
+    def test_database_is_opened_on_first_use(self, tmp_path):
+        store = DatasetStore(str(tmp_path / "hflav.sqlite"))
+
+        assert not (tmp_path / "hflav.sqlite").exists()
+        assert store.records() == []
+        assert (tmp_path / "hflav.sqlite").exists()
+        store.close()
+
+    def test_ingest_and_query(self, store):
+        counts = store.ingest(_record(), {"data.json": _data()})
+
+        assert counts["groups"] == 1
+        assert counts["averages"] == 2
+        assert counts["scan_points"] == 2
+        rows = store.query_averages(pdg_code="511")
+        assert len(rows) == 1
+        assert rows[0]["name"] == "BR(B->K pi)"
+        assert rows[0]["central"] == 1.0
+        assert rows[0]["record_id"] == 1
+        assert rows[0]["filename"] == "data.json"
+        assert rows[0]["record_title"] == "HFLAV release 1"
+
+    def test_query_across_records(self, store):
+        store.ingest(_record(1, "2024-01-01T00:00:00"), {"data.json": _data(1.0)})
+        store.ingest(_record(2, "2025-01-01T00:00:00"), {"data.json": _data(1.5)})
+
+        rows = store.query_averages(name="BR(B->K pi)")
+
+        assert [row["record_id"] for row in rows] == [2, 1]
+        assert [row["central"] for row in rows] == [1.5, 1.0]
+        assert len(store.query_averages(name_like="BR(B->%")) == 4
+        assert len(store.query_averages(record_id=1, limit=1)) == 1
+
+    def test_needs_update(self, store):
+        record = _record(updated="2024-01-01T00:00:00")
+        assert store.needs_update(record)
+
+        store.ingest(record, {"data.json": _data()})
+
+        assert not store.needs_update(record)
+        assert store.needs_update(_record(updated="2024-02-01T00:00:00"))
+        assert store.stored_updated(1) == datetime(2024, 1, 1).isoformat()
+
+    def test_reingest_replaces_rows(self, store):
+        store.ingest(_record(), {"data.json": _data(1.0)})
+
+        store.ingest(_record(updated="2024-02-01T00:00:00"), {"data.json": _data(3.0)})
+
+        rows = store.query_averages(pdg_code="511")
+        assert [row["central"] for row in rows] == [3.0]
+        assert len(store.records()) == 1
+
+    def test_data_survives_reopening(self, store):
+        store.ingest(_record(), {"data.json": _data()})
+        store.close()
+
+        reopened = DatasetStore(store.db_path)
+
+        assert not reopened.needs_update(_record())
+        assert len(reopened.query_averages()) == 2
+        reopened.close()
+
+    def test_indexes_are_used(self, store):
+        store.ingest(_record(), {"data.json": _data()})
+
+        plan = store.query(
+            "EXPLAIN QUERY PLAN SELECT * FROM averages WHERE pdg_code = ?", ["511"]
+        )
+
+        assert any("averages_pdg_code" in row["detail"] for row in plan)
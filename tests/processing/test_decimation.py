@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+
+from hflav_fair_client.processing.decimation import min_max_indexes, rdp_indexes
+
+
+def _max_deviation(points, indexes):
+    """Largest distance from any point to the polyline through the kept points."""
+    deviation = 0.0
+    for first, last in zip(indexes[:-1], indexes[1:]):
+        start, end = points[first], points[last]
+        direction = end - start
+        section = points[first : last + 1]
+        length_squared = direction @ direction
+        if length_squared == 0:
+            distances = np.hypot(*(section - start).T)
+        else:
+            t = np.clip((section - start) @ direction / length_squared, 0, 1)
+            distances = np.hypot(*(section - (start + t[:, None] * direction)).T)
+        deviation = max(deviation, distances.max())
+    return deviation
+
+
+class TestRdpIndexes:
+    """Test suite for the Ramer-Douglas-Peucker decimation."""
+
+    def test_straight_line_keeps_end_points(self):
+        points = np.column_stack((np.arange(100.0), 2 * np.arange(100.0)))
+
+        np.testing.assert_array_equal(rdp_indexes(points, 0.01), [0, 99])
+
+    def test_corner_is_kept(self):
+        points = np.array([[0, 0], [1, 0], [2, 0], [2, 1], [2, 2]], dtype=float)
+
+        np.testing.assert_array_equal(rdp_indexes(points, 0.1), [0, 2, 4])
+
+    @pytest.mark.parametrize("epsilon", [0.001, 0.01, 0.1])
+    def test_error_is_bounded_by_epsilon(self, epsilon):
+        rng = np.random.default_rng(0)
+        angles = np.linspace(0, 2 * np.pi, 5000)
+        radius = 1 + 0.1 * np.sin(7 * angles) + 0.01 * rng.standard_normal(5000)
+        points = np.column_stack((radius * np.cos(angles), radius * np.sin(angles)))
+
+        indexes = rdp_indexes(points, epsilon)
+
+        assert np.all(np.diff(indexes) > 0)
+        assert indexes[0] == 0 and indexes[-1] == len(points) - 1
+        assert len(indexes) < len(points)
+        assert _max_deviation(points, indexes) <= epsilon
+
+    def test_closed_polyline(self):
+        points = np.array([[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]], dtype=float)
+
+        np.testing.assert_array_equal(rdp_indexes(points, 0.1), [0, 1, 2, 3, 4])
+
+    def test_short_and_invalid_inputs(self):
+        assert len(rdp_indexes(np.zeros((2, 2)), 1.0)) == 2
+        with pytest.raises(ValueError):
+            rdp_indexes(np.zeros((3, 2)), -1.0)
+
+
+class TestMinMaxIndexes:
+    """Test suite for the min/max per bucket decimation."""
+
+    def test_extremes_of_each_bucket_are_kept(self):
+        rng = np.random.default_rng(1)
+        x = np.linspace(0, 1, 100000)
+        points = np.column_stack((x, rng.standard_normal(len(x))))
+        num_buckets = 100
+
+        indexes = min_max_indexes(points, num_buckets)
+
+        assert len(indexes) <= 4 * num_buckets
+        assert np.all(np.diff(indexes) > 0)
+        assert indexes[0] == 0 and indexes[-1] == len(points) - 1
+        # The vertical extent of every bucket is preserved
+        buckets = np.minimum((x * num_buckets).astype(int), num_buckets - 1)
+        kept_buckets = buckets[indexes]
+        for bucket in range(num_buckets):
+            original = points[buckets == bucket, 1]
+            kept = points[indexes[kept_buckets == bucket], 1]
+            assert kept.min() == original.min()
+            assert kept.max() == original.max()
+
+    def test_unsorted_x(self):
+        rng = np.random.default_rng(2)
+        points = rng.random((10000, 2))
+
+        indexes = min_max_indexes(points, 10)
+
+        assert points[indexes, 1].max() == points[:, 1].max()
+        assert points[indexes, 1].min() == points[:, 1].min()
+
+    def test_constant_x(self):
+        points = np.column_stack((np.zeros(100), np.arange(100.0)))
+
+        np.testing.assert_array_equal(min_max_indexes(points, 10), [0, 99])
+
+    def test_short_and_invalid_inputs(self):
+        assert len(min_max_indexes(np.zeros((8, 2)), 2)) == 8
+        with pytest.raises(ValueError):
+            min_max_indexes(np.zeros((8, 2)), 0)
@@ -0,0 +1,142 @@
+import os
+
+import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from hflav_fair_client.processing.data_plotter import DataPlotter
+from hflav_fair_client.processing.figure_cache import FigureCache, plot_data_hash
+from hflav_fair_client.processing.plot_data_extractor import extract_plot_data
+from hflav_fair_client.processing.plotter_interface import PlotterInterface
+from hflav_fair_client.utils.namespace_utils import dict_to_namespace
+
+
+def _group(central=1.0, description="group"):
+    return dict_to_namespace(
+        {
+            "name": "group",
+            "description": description,
+            "averages": [
+                {"name": "average", "value": {"central": central, "uncertainty": 0.1}}
+            ],
+        }
+    )
+
+
+class MinimalPlotter(PlotterInterface):
+    """A plotter other than DataPlotter, drawing the averages as points."""
+
+    def plot(self, data, save_path=None, figure=None):
+        return self.draw(extract_plot_data(data), save_path, figure)
+
+    def draw(self, plot_data, save_path=None, figure=None):
+        figure = Figure()
+        FigureCanvasAgg(figure)
+        figure.add_subplot().plot(plot_data.averages.central, "o")
+        return figure
+
+    def style_parameters(self):
+        return {"plotter": "minimal"}
+
+
+class TestPlotDataHash:
+    """Test suite for the plotted data hash."""
+
+    def test_hash_ignores_unplotted_fields(self):
+        style = {"dpi": 100}
+
+        assert plot_data_hash(
+            extract_plot_data(_group(description="a")), style
+        ) == plot_data_hash(extract_plot_data(_group(description="b")), style)
+
+    def test_hash_depends_on_values_and_style(self):
+        plot_data = extract_plot_data(_group())
+
+        hashes = {
+            plot_data_hash(plot_data, {"dpi": 100}),
+            plot_data_hash(plot_data, {"dpi": 200}),
+            plot_data_hash(extract_plot_data(_group(central=2.0)), {"dpi": 100}),
+        }
+
+        assert len(hashes) == 3
+
+
+class TestFigureCache:
+    """Test suite for FigureCache."""
+
+    def test_render_is_cached(self, tmp_path, mocker):
+        cache = FigureCache(str(tmp_path))
+        plotter = DataPlotter()
+        draw = mocker.spy(plotter, "draw")
+
+        first = cache.render(plotter, _group())
+        second = cache.render(plotter, _group(description="changed"))
+
+        assert first == second
+        assert first.startswith(b"\x89PNG")
+        assert draw.call_count == 1
+        assert len(os.listdir(tmp_path)) == 1
+
+    def test_render_depends_on_format_and_style(self, tmp_path):
+        cache = FigureCache(str(tmp_path))
+
+        png = cache.render(DataPlotter(), _group(), format="png")
+        svg = cache.render(DataPlotter(), _group(), format="SVG")
+        cache.render(DataPlotter(dpi=50), _group(), format="png")
+
+        assert png != svg
+        assert b"<svg" in svg
+        assert len(os.listdir(tmp_path)) == 3
+
+    def test_cache_persists_on_disk(self, tmp_path, mocker):
+        FigureCache(str(tmp_path)).render(DataPlotter(), _group())
+        plotter = DataPlotter()
+        draw = mocker.spy(plotter, "draw")
+
+        FigureCache(str(tmp_path)).render(plotter, _group())
+
+        draw.assert_not_called()
+
+    def test_least_recently_used_figures_are_evicted(self, tmp_path):
+        cache = FigureCache(str(tmp_path), max_bytes=25)
+        cache.put("a", "png", b"0" * 10)
+        cache.put("b", "png", b"1" * 10)
+        assert cache.get("a", "png") == b"0" * 10
+
+        cache.put("c", "png", b"2" * 10)
+
+        assert cache.get("b", "png") is None
+        assert cache.get("a", "png") is not None
+        assert cache.get("c", "png") is not None
+        assert cache.size_bytes == 20
+        assert sorted(os.listdir(tmp_path)) == ["a.png", "c.png"]
+
+    def test_replacing_an_entry_updates_the_size(self, tmp_path):
+        cache = FigureCache(str(tmp_path))
+        cache.put("a", "png", b"0" * 10)
+        cache.put("a", "png", b"0" * 4)
+
+        assert cache.size_bytes == 4
+        assert cache.get("a", "png") == b"0" * 4
+
+    def test_clear(self, tmp_path):
+        cache = FigureCache(str(tmp_path))
+        cache.put("a", "png", b"0")
+
+        cache.clear()
+
+        assert cache.get("a", "png") is None
+        assert cache.size_bytes == 0
+        assert os.listdir(tmp_path) == []
+
+    def test_invalid_max_bytes(self, tmp_path):
+        with pytest.raises(ValueError):
+            FigureCache(str(tmp_path), max_bytes=-1)
+
+    def test_render_with_any_plotter(self, tmp_path):
+        cache = FigureCache(str(tmp_path))
+
+        content = cache.render(MinimalPlotter(), _group())
+
+        assert content.startswith(b"\x89PNG")
+        assert content != cache.render(DataPlotter(), _group())
@@ -0,0 +1,84 @@
+import io
+import json
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from hflav_fair_client.processing.json_stream_renderer import JsonStreamRenderer
+from hflav_fair_client.utils.namespace_utils import dict_to_namespace
+
+
+class TestJsonStreamRenderer:
+    """Test suite for JsonStreamRenderer."""
+
+    @pytest.fixture
+    def sample_data(self):
+        """Create sample nested data for testing."""
+        return {
+            "name": "group",
+            "fit": {"chi2": 1.5, "ndf": 3},
+            "averages": [
+                {"name": f"avg{i}", "value": {"central": i, "unit": "ps"}}
+                for i in range(4)
+            ],
+            "empty_list": [],
+            "empty_object": {},
+            "text": 'quoted "text"\n',
+            "missing": None,
+        }
+
+    def test_render_matches_json_dumps(self, sample_data):
+        """Test that unbounded rendering matches json.dumps with indent=4."""
+        rendered = JsonStreamRenderer().render_to_string(dict_to_namespace(sample_data))
+        assert rendered == json.dumps(sample_data, indent=4)
+
+    def test_render_writes_to_stream(self, sample_data):
+        """Test that render writes the JSON followed by a new line."""
+        output = io.StringIO()
+        JsonStreamRenderer(indent=2).render(sample_data, output)
+        assert output.getvalue() == json.dumps(sample_data, indent=2) + "\n"
+
+    def test_max_items_elides_arrays_and_objects(self, sample_data):
+        """Test that only the first items are written, followed by a marker."""
+        rendered = JsonStreamRenderer(max_items=2).render_to_string(sample_data)
+        result = json.loads(rendered)
+
+        assert result == {
+            "name": "group",
+            "fit": {"chi2": 1.5, "ndf": 3},
+            "...": "5 more keys",
+        }
+
+    def test_max_items_on_arrays(self):
+        """Test the marker of arrays longer than the budget."""
+        rendered = JsonStreamRenderer(max_items=2).render_to_string([1, 2, 3, 4])
+        assert json.loads(rendered) == [1, 2, "... 2 more items"]
+
+    def test_max_items_zero(self):
+        """Test that a zero budget only writes the markers."""
+        renderer = JsonStreamRenderer(max_items=0)
+        assert json.loads(renderer.render_to_string([1, 2])) == ["... 2 more items"]
+        assert json.loads(renderer.render_to_string({"a": 1})) == {"...": "1 more keys"}
+
+    def test_max_depth_collapses_nested_containers(self, sample_data):
+        """Test that containers deeper than the budget are summarized."""
+        rendered = JsonStreamRenderer(max_depth=1).render_to_string(sample_data)
+        result = json.loads(rendered)
+
+        assert result["fit"] == "{...} (2 keys)"
+        assert result["averages"] == "[...] (4 items)"
+        assert result["empty_list"] == []
+        assert result["name"] == "group"
+
+    def test_non_json_values_are_written_as_strings(self):
+        """Test that values such as datetimes are written with str()."""
+        data = SimpleNamespace(created=datetime(2024, 1, 1))
+        rendered = JsonStreamRenderer().render_to_string(data)
+        assert json.loads(rendered) == {"created": "2024-01-01 00:00:00"}
+
+    @pytest.mark.parametrize("kwargs", [{"max_depth": -1}, {"max_items": -1}])
+    def test_negative_budgets_raise(self, kwargs):
+        """Test that negative budgets are rejected."""
+        with pytest.raises(ValueError):
+            JsonStreamRenderer(**kwargs)
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from hflav_fair_client.processing.plot_data_extractor import (
+    extract_averages,
+    extract_curves,
+    extract_plot_data,
+)
+from hflav_fair_client.utils.namespace_utils import dict_to_namespace
+
+
+@pytest.fixture
+def sample_data():
+    return dict_to_namespace(
+        {
+            "groups": [
+                {
+                    "name": "b_to_charm",
+                    "averages": [
+                        {
+                            "name": "symmetric",
+                            "value": {"central": 1.5, "uncertainty": 0.1},
+                        },
+                        {
+                            "name": "pair",
+                            "value": {"central": 2.0, "uncertainty": [-0.2, 0.3]},
+                        },
+                        {
+                            "name": "object",
+                            "value": {
+                                "central": 3,
+                                "uncertainty": {"minus": 0.4, "plus": 0.5},
+                            },
+                        },
+                        {"name": "plain", "value": 4.0},
+                        {"name": "not_numeric", "value": "n/a"},
+                    ],
+                    "contours": [
+                        {"name": "pairs", "points": [[0, 0], [1, 0], [1, 1]]},
+                        {"name": "columns", "points": {"x": [0, 1], "y": [2, 3]}},
+                        {"name": "broken", "points": [[0, 0, 0]]},
+                    ],
+                    "scans": [{"points": [[0.0, 4.0], [0.5, 0.0], [1.0, 4.0]]}],
+                }
+            ]
+        }
+    )
+
+
+class TestPlotDataExtractor:
+    """Test suite for the extraction of plottable HFLAV objects."""
+
+    def test_extract_averages(self, sample_data):
+        averages = extract_averages(sample_data)
+
+        assert averages.names == ["symmetric", "pair", "object", "plain"]
+        np.testing.assert_array_equal(averages.central, [1.5, 2.0, 3.0, 4.0])
+        np.testing.assert_array_equal(averages.minus, [0.1, 0.2, 0.4, 0.0])
+        np.testing.assert_array_equal(averages.plus, [0.1, 0.3, 0.5, 0.0])
+
+    def test_extract_contours(self, sample_data):
+        contours = extract_curves(sample_data, "contours")
+
+        assert contours.names == ["pairs", "columns"]
+        np.testing.assert_array_equal(contours.curves[1], [[0, 2], [1, 3]])
+        assert contours.num_points == 5
+
+    def test_extract_scans_with_default_names(self, sample_data):
+        scans = extract_curves(sample_data, "scans")
+
+        assert scans.names == ["scans_0"]
+        assert scans.curves[0].shape == (3, 2)
+
+    def test_extract_plot_data_from_a_single_group(self, sample_data):
+        plot_data = extract_plot_data(sample_data.groups[0])
+
+        assert not plot_data.is_empty()
+        assert len(plot_data.averages) == 4
+        assert len(plot_data.contours) == 2
+        assert len(plot_data.scans) == 1
+
+    def test_extract_plot_data_without_plottable_objects(self):
+        plot_data = extract_plot_data(dict_to_namespace({"groups": [{"name": "x"}]}))
+
+        assert plot_data.is_empty()
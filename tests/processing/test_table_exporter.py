@@ -0,0 +1,156 @@
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from hflav_fair_client.processing.table_exporter import (
+    TABLE_COLUMNS,
+    TableExporter,
+    flatten_group,
+    iter_group_tables,
+)
+from hflav_fair_client.utils.namespace_utils import dict_to_namespace
+
+
+def _group(index=0):
+    return {
+        "name": f"group {index}",
+        "fit": {"chi2": 1.5, "ndf": 3, "p": 0.7},
+        "averages": [
+            {
+                "name": "BR",
+                "comment": "average",
+                "PDGcode": "511",
+                "average": {
+                    "value": {
+                        "central": 1.0,
+                        "uncertainty": [0.1, 0.2],
+                        "statistical": 0.05,
+                        "systematic": [0.01],
+                        "upperlimit": 2.0,
+                        "unit": "1e-6",
+                    }
+                },
+            },
+            {"name": "simple", "value": 4.0},
+        ],
+        "inputs": [
+            {
+                "name": "input",
+                "sources": [
+                    {
+                        "name": "Belle",
+                        "value": {"central": [2.0], "uncertainty": 0.3, "unit": "1"},
+                        "references": {"doi": "10.1/x", "arxiv": "2101.00001"},
+                    },
+                    {"name": "BaBar", "value": {"central": 2.5}},
+                ],
+            }
+        ],
+        "scans": [
+            {"name": "scan", "x": {"values": [0.0, 1.0]}, "points": [5.0, 6.0]},
+            {"name": "pairs", "points": [[1.0, 2.0]]},
+        ],
+        "contours": [
+            {
+                "name": "contour",
+                "CL": 0.68,
+                "points": {"x": [1.0, 2.0], "y": [3.0, 4.0]},
+            }
+        ],
+    }
+
+
+class TestFlattenGroup:
+    """Test suite for the flattening of groups into table columns."""
+
+    def test_every_table_has_its_columns(self):
+        tables = flatten_group(dict_to_namespace(_group()), 0)
+
+        assert set(tables) == set(TABLE_COLUMNS)
+        for table, columns in TABLE_COLUMNS.items():
+            assert list(tables[table]) == [name for name, _ in columns]
+
+    def test_groups(self):
+        groups = flatten_group(dict_to_namespace(_group()), 7)["groups"]
+
+        assert groups == {
+            "group_id": [7],
+            "name": ["group 0"],
+            "chi2": [1.5],
+            "ndf": [3],
+            "p": [0.7],
+        }
+
+    def test_averages(self):
+        averages = flatten_group(dict_to_namespace(_group()), 0)["averages"]
+
+        assert averages["average_id"] == [0, 1]
+        assert averages["pdg_code"] == ["511", None]
+        assert averages["central"] == [1.0, 4.0]
+        assert averages["uncertainty_minus"] == [0.1, None]
+        assert averages["uncertainty_plus"] == [0.2, None]
+        assert averages["statistical_plus"] == [0.05, None]
+        assert averages["systematic_minus"] == [0.01, None]
+        assert averages["upper_limit"] == [2.0, None]
+
+    def test_sources(self):
+        sources = flatten_group(_group(), 0)["sources"]
+
+        assert sources["input_id"] == [0, 0]
+        assert sources["source_id"] == [0, 1]
+        assert sources["input_name"] == ["input", "input"]
+        assert sources["central"] == [2.0, 2.5]
+        assert sources["uncertainty_plus"] == [0.3, None]
+        assert sources["doi"] == ["10.1/x", None]
+
+    def test_curve_points(self):
+        tables = flatten_group(dict_to_namespace(_group()), 0)
+
+        assert tables["scan_points"]["scan_id"] == [0, 0, 1]
+        assert tables["scan_points"]["point_id"] == [0, 1, 0]
+        assert tables["scan_points"]["x"] == [0.0, 1.0, 1.0]
+        assert tables["scan_points"]["y"] == [5.0, 6.0, 2.0]
+        assert tables["contour_points"]["x"] == [1.0, 2.0]
+        assert tables["contour_points"]["y"] == [3.0, 4.0]
+        assert tables["contour_points"]["cl"] == [0.68, 0.68]
+
+    def test_iter_group_tables(self):
+        data = dict_to_namespace({"groups": [_group(0), _group(1)]})
+
+        group_ids = [tables["groups"]["group_id"] for tables in iter_group_tables(data)]
+
+        assert group_ids == [[0], [1]]
+
+
+class TestTableExporter:
+    """Test suite for TableExporter."""
+
+    def test_missing_pyarrow(self, tmp_path):
+        with patch.dict(sys.modules, {"pyarrow": None, "pyarrow.parquet": None}):
+            with pytest.raises(ImportError, match="parquet"):
+                TableExporter().write_parquet({"groups": []}, str(tmp_path))
+
+    def test_to_arrow(self):
+        pyarrow = pytest.importorskip("pyarrow")
+        data = dict_to_namespace({"groups": [_group(0), _group(1)]})
+
+        tables = TableExporter().to_arrow(data)
+
+        assert tables["groups"].column("name").to_pylist() == ["group 0", "group 1"]
+        assert tables["averages"].num_rows == 4
+        assert tables["scan_points"].schema.field("x").type == pyarrow.float64()
+
+    def test_write_parquet(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        parquet = pytest.importorskip("pyarrow.parquet")
+        data = dict_to_namespace({"groups": [_group(0), _group(1), {"name": "empty"}]})
+
+        paths = TableExporter().write_parquet(data, str(tmp_path))
+
+        groups = parquet.read_table(paths["groups"])
+        assert groups.column("group_id").to_pylist() == [0, 1, 2]
+        averages = parquet.ParquetFile(paths["averages"])
+        assert averages.metadata.num_row_groups == 2
+        assert averages.read().column("central").to_pylist() == [1.0, 4.0] * 2
+        assert parquet.read_table(paths["contour_points"]).num_rows == 4
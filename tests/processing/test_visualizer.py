@@ -1,3 +1,4 @@
+import io
 import pytest
 import json
 from types import SimpleNamespace
@@ -5,6 +6,7 @@ from unittest.mock import patch, MagicMock, call
 
 from hflav_fair_client.processing.visualizer_interface import VisualizerInterface
 from hflav_fair_client.processing.data_visualizer import DataVisualizer
+from hflav_fair_client.utils.namespace_utils import namespace_to_dict
 
 
 class TestVisualizer:
@@ -42,37 +44,6 @@ class TestVisualizer:
             # Verify print_json was called with the JSON string
             mock_print_json.assert_called_once_with(mock_dumps.return_value)
 
-    def test_print_json_data_method_signature(self):
-        """Test that print_json_data accepts a SimpleNamespace parameter."""
-        visualizer = DataVisualizer()
-
-        # Create test data with SimpleNamespace
-        test_data = SimpleNamespace(name="test", value=123)
-
-        with patch(
-            "hflav_fair_client.processing.data_visualizer.namespace_to_dict"
-        ) as mock_namespace_to_dict, patch(
-            "hflav_fair_client.processing.data_visualizer.json.dumps"
-        ) as mock_dumps, patch(
-            "hflav_fair_client.processing.data_visualizer.print_json"
-        ) as mock_print_json:
-
-            # Mock the conversions
-            mock_dict = {"name": "test", "value": 123}
-            mock_namespace_to_dict.return_value = mock_dict
-            mock_dumps.return_value = '{"name": "test", "value": 123}'
-
-            visualizer.print_json_data(test_data)
-
-            # Verify namespace_to_dict was called with the SimpleNamespace
-            mock_namespace_to_dict.assert_called_once_with(test_data)
-
-            # Verify json.dumps was called with proper arguments
-            mock_dumps.assert_called_once_with(mock_dict, indent=4)
-
-            # Verify print_json was called
-            mock_print_json.assert_called_once_with(mock_dumps.return_value)
-
     def test_print_schema_with_various_schema_types(self):
         """Test print_schema handles different schema structures correctly."""
         visualizer = DataVisualizer()
@@ -102,10 +73,24 @@ class TestVisualizer:
                 # Verify print_json was called with the JSON string
                 mock_print_json.assert_called_once_with(mock_json_string)
 
+    def test_print_json_data_streams_plain_json_when_not_a_terminal(self):
+        """Test that data is written without rich when the output is not a TTY."""
+        output = io.StringIO()
+        visualizer = DataVisualizer(output=output)
+        test_data = SimpleNamespace(
+            id=1, name="Test User", active=True, tags=["python", "testing"]
+        )
+
+        with patch(
+            "hflav_fair_client.processing.data_visualizer.Console"
+        ) as mock_console:
+            visualizer.print_json_data(test_data)
+
+        mock_console.assert_not_called()
+        assert output.getvalue() == json.dumps(vars(test_data), indent=4) + "\n"
+
     def test_print_json_data_with_various_data_structures(self):
         """Test print_json_data handles different data structures correctly."""
-        visualizer = DataVisualizer()
-
         test_cases = [
             # Simple namespace
             SimpleNamespace(name="John", age=30),
@@ -123,29 +108,69 @@ class TestVisualizer:
         ]
 
         for test_data in test_cases:
-            with patch(
-                "hflav_fair_client.processing.data_visualizer.namespace_to_dict"
-            ) as mock_namespace_to_dict, patch(
-                "hflav_fair_client.processing.data_visualizer.json.dumps"
-            ) as mock_dumps, patch(
-                "hflav_fair_client.processing.data_visualizer.print_json"
-            ) as mock_print_json:
+            output = io.StringIO()
+            DataVisualizer(output=output).print_json_data(test_data)
 
-                # Create a simple mock dictionary
-                mock_dict = {"test": "data"}
-                mock_namespace_to_dict.return_value = mock_dict
-                mock_dumps.return_value = '{"test": "data"}'
+            assert json.loads(output.getvalue()) == namespace_to_dict(test_data)
 
-                visualizer.print_json_data(test_data)
+    def test_print_json_data_highlights_small_data_on_terminal(self):
+        """Test that rich highlighting is used for small data printed to a TTY."""
+        output = io.StringIO()
+        output.isatty = lambda: True
+        visualizer = DataVisualizer(output=output)
+        test_data = SimpleNamespace(name="test", value=123)
 
-                # Verify namespace_to_dict was called
-                mock_namespace_to_dict.assert_called_once_with(test_data)
+        with patch(
+            "hflav_fair_client.processing.data_visualizer.Console"
+        ) as mock_console:
+            visualizer.print_json_data(test_data)
 
-                # Verify json.dumps was called with correct arguments
-                mock_dumps.assert_called_once_with(mock_dict, indent=4)
+        mock_console.assert_called_once_with(file=output)
+        mock_console.return_value.print_json.assert_called_once_with(
+            json.dumps({"name": "test", "value": 123}, indent=4)
+        )
 
-                # Verify print_json was called
-                mock_print_json.assert_called_once_with(mock_dumps.return_value)
+    def test_print_json_data_skips_highlighting_for_large_data(self):
+        """Test that data above the highlighting threshold is written in plain text."""
+        output = io.StringIO()
+        output.isatty = lambda: True
+        visualizer = DataVisualizer(output=output, highlight_max_nodes=3)
+        test_data = SimpleNamespace(items=[1, 2, 3, 4])
+
+        with patch(
+            "hflav_fair_client.processing.data_visualizer.Console"
+        ) as mock_console:
+            visualizer.print_json_data(test_data)
+
+        mock_console.assert_not_called()
+        assert json.loads(output.getvalue()) == {"items": [1, 2, 3, 4]}
+
+    def test_print_json_data_applies_budgets(self):
+        """Test that the depth and item budgets elide the rest of the data."""
+        output = io.StringIO()
+        visualizer = DataVisualizer(output=output, max_depth=2, max_items=2)
+        test_data = SimpleNamespace(
+            averages=[SimpleNamespace(name=f"avg{i}", value=[i]) for i in range(5)]
+        )
+
+        visualizer.print_json_data(test_data)
+
+        assert json.loads(output.getvalue()) == {
+            "averages": [
+                "{...} (2 keys)",
+                "{...} (2 keys)",
+                "... 3 more items",
+            ]
+        }
+
+    def test_print_json_data_defaults_to_stdout(self):
+        """Test that data is written to the current stdout by default."""
+        visualizer = DataVisualizer()
+
+        with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
+            visualizer.print_json_data(SimpleNamespace(name="test"))
+
+        assert json.loads(mock_stdout.getvalue()) == {"name": "test"}
 
     def test_print_schema_json_serialization_error(self):
         """Test print_schema handles non-serializable schema gracefully."""
@@ -161,21 +186,6 @@ class TestVisualizer:
             with pytest.raises(TypeError):
                 visualizer.print_schema(non_serializable_schema)
 
-    def test_print_json_data_conversion_error(self):
-        """Test print_json_data handles namespace conversion errors."""
-        visualizer = DataVisualizer()
-
-        test_data = SimpleNamespace(name="test")
-
-        with patch(
-            "hflav_fair_client.processing.data_visualizer.namespace_to_dict"
-        ) as mock_namespace_to_dict:
-            mock_namespace_to_dict.side_effect = Exception("Conversion failed")
-
-            # Should propagate the exception
-            with pytest.raises(Exception, match="Conversion failed"):
-                visualizer.print_json_data(test_data)
-
     def test_print_schema_output_format(self):
         """Test that print_schema outputs JSON format."""
         visualizer = DataVisualizer()
@@ -206,43 +216,6 @@ class TestVisualizer:
             # Verify print_json was called with the expected JSON
             mock_print_json.assert_called_once_with(mock_json_string)
 
-    def test_print_json_data_output_format(self):
-        """Test that print_json_data outputs formatted JSON."""
-        visualizer = DataVisualizer()
-
-        # Create test data
-        test_data = SimpleNamespace(
-            id=1, name="Test User", active=True, tags=["python", "testing"]
-        )
-
-        with patch(
-            "hflav_fair_client.processing.data_visualizer.namespace_to_dict"
-        ) as mock_namespace_to_dict, patch(
-            "hflav_fair_client.processing.data_visualizer.json.dumps"
-        ) as mock_dumps, patch(
-            "hflav_fair_client.processing.data_visualizer.print_json"
-        ) as mock_print_json:
-
-            # Setup mock returns
-            mock_dict = {
-                "id": 1,
-                "name": "Test User",
-                "active": True,
-                "tags": ["python", "testing"],
-            }
-            mock_namespace_to_dict.return_value = mock_dict
-
-            formatted_json = '{\n    "id": 1,\n    "name": "Test User"\n}'
-            mock_dumps.return_value = formatted_json
-
-            visualizer.print_json_data(test_data)
-
-            # Verify json.dumps was called with correct arguments
-            mock_dumps.assert_called_once_with(mock_dict, indent=4)
-
-            # Verify print_json received the formatted JSON
-            mock_print_json.assert_called_once_with(formatted_json)
-
     def test_methods_return_none(self):
         """Test that both interface methods return None as specified."""
         visualizer = DataVisualizer()
@@ -253,12 +226,10 @@ class TestVisualizer:
                 result = visualizer.print_schema({})
                 assert result is None
 
-        with patch("hflav_fair_client.processing.data_visualizer.namespace_to_dict"):
-            with patch("hflav_fair_client.processing.data_visualizer.json.dumps"):
-                with patch("hflav_fair_client.processing.data_visualizer.print_json"):
-                    # Test print_json_data returns None
-                    result = visualizer.print_json_data(SimpleNamespace())
-                    assert result is None
+        with patch("sys.stdout", new_callable=io.StringIO):
+            # Test print_json_data returns None
+            result = visualizer.print_json_data(SimpleNamespace())
+            assert result is None
 
     def test_interface_abstract_methods(self):
         """Test that VisualizerInterface properly defines abstract methods."""
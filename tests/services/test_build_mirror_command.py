@@ -0,0 +1,117 @@
+import json
+from unittest.mock import Mock
+
+from gitlab.exceptions import GitlabGetError
+
+from hflav_fair_client.exceptions.source_exceptions import (
+    DataAccessException,
+    NoVersionTagFound,
+)
+from hflav_fair_client.filters.search_filters import TextFilter
+from hflav_fair_client.filters.zenodo_query import ZenodoQuery
+from hflav_fair_client.models.models import RecordSummary, Template
+from hflav_fair_client.services.build_mirror_command import BuildMirror
+from hflav_fair_client.source.source_mirror import SourceGitlabMirror, SourceMirror
+from hflav_fair_client.source.source_zenodo_requests import SourceZenodoRequest
+
+
+def _record(record_id, title, files=("data.json",)):
+    return {
+        "id": record_id,
+        "doi": f"10.5281/zenodo.{record_id}",
+        "created": "2023-01-01T00:00:00",
+        "updated": "2024-01-01T00:00:00",
+        "metadata": {"title": title, "version": "1.0"},
+        "files": [
+            {
+                "key": name,
+                "checksum": "md5:a",
+                "links": {"self": f"https://zenodo.org/{record_id}/{name}"},
+            }
+            for name in files
+        ],
+    }
+
+
+def _source(records, templates):
+    source = Mock(spec=SourceZenodoRequest)
+    source.iter_records.return_value = iter([RecordSummary(r) for r in records])
+    by_id = {r["id"]: r for r in [*records, *templates]}
+    source.get_record_if_modified.side_effect = lambda recid, etag=None: (
+        json.loads(json.dumps(by_id[recid])),
+        '"etag"',
+    )
+    source.get_template_versions.return_value = [Template(**t) for t in templates]
+
+    def download_file(url, path, checksum=None, bypass_cache=False):
+        with open(path, "w") as file:
+            file.write(url)
+        return path
+
+    source.download_file.side_effect = download_file
+    return source
+
+
+def _command(source, gitlab_client, mirror_dir, **kwargs):
+    return BuildMirror(
+        mirror_dir=str(mirror_dir),
+        source=source,
+        gitlab_client_provider=lambda: gitlab_client,
+        **kwargs,
+    )
+
+
+class TestBuildMirrorCommand:
+    """Test suite for BuildMirror command."""
+
+    def test_build_mirror(self, tmp_path):
+        template = _record(10, "HFLAV template", ("template.json", "schema.schema"))
+        source = _source([_record(1, "HFLAV release")], [template])
+        gitlab_client = Mock()
+        gitlab_client.get_schema_inside_repository.return_value = {"type": "object"}
+
+        summary = _command(
+            source, gitlab_client, tmp_path, schema_versions=["main", "v1.0"]
+        ).execute()
+
+        assert summary["synced"] == [1]
+        assert summary["templates"] == [10]
+        assert summary["schemas"] == ["main", "v1.0"]
+        assert (tmp_path / "files" / "10" / "schema.schema").exists()
+        mirror = SourceMirror(str(tmp_path))
+        assert mirror.get_correct_template_by_date().rec_id == 10
+        query = ZenodoQuery(TextFilter("title", "release"), "mostrecent", 10, 1)
+        assert [record.id for record in mirror.get_records_by_name(query)] == [1]
+        schema = SourceGitlabMirror(str(tmp_path)).get_schema_inside_repository("v1.0")
+        assert schema == {"type": "object"}
+
+    def test_failures_keep_the_mirrored_copies(self, tmp_path):
+        template = _record(10, "HFLAV template", ("template.json",))
+        gitlab_client = Mock()
+        gitlab_client.get_schema_inside_repository.return_value = {"type": "object"}
+        _command(_source([], [template]), gitlab_client, tmp_path).execute()
+
+        source = _source([], [])
+        source.get_template_versions.side_effect = DataAccessException("down")
+        gitlab_client.get_schema_inside_repository.side_effect = NoVersionTagFound()
+        summary = _command(source, gitlab_client, tmp_path).execute()
+
+        assert summary["templates"] == [10]
+        assert summary["schemas"] == ["main"]
+
+    def test_unreachable_gitlab(self, tmp_path):
+        def gitlab_client_provider():
+            raise GitlabGetError("unreachable")
+
+        command = BuildMirror(
+            mirror_dir=str(tmp_path),
+            source=_source([], []),
+            gitlab_client_provider=gitlab_client_provider,
+        )
+
+        assert command.execute()["schemas"] == []
+
+    def test_undo_is_not_supported(self, tmp_path):
+        command = _command(_source([], []), Mock(), tmp_path)
+
+        assert command.undo() is None
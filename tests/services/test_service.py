@@ -8,6 +8,9 @@ from hflav_fair_client.models.models import Record
 from hflav_fair_client.exceptions.source_exceptions import DataAccessException
 from hflav_fair_client.services.service import Service
 from hflav_fair_client.services.service_interface import ServiceInterface
+from hflav_fair_client.services.build_mirror_command import BuildMirror
+from hflav_fair_client.services.sync_records_command import SyncRecords
+from hflav_fair_client.source.source_zenodo_requests import SourceZenodoRequest
 
 
 class TestService:
@@ -33,6 +36,21 @@ class TestService:
         """Mock for handler_schema_chain dependency."""
         return Mock()
 
+    @pytest.fixture
+    def mock_plotter(self):
+        """Mock for PlotterInterface dependency."""
+        return Mock()
+
+    @pytest.fixture
+    def mock_figure_cache(self):
+        """Mock for FigureCache dependency."""
+        return Mock()
+
+    @pytest.fixture
+    def mock_store(self):
+        """Mock for DatasetStore dependency."""
+        return Mock()
+
     @pytest.fixture
     def service(
         self,
@@ -40,6 +58,9 @@ class TestService:
         mock_conversor,
         mock_command_invoker,
         mock_handler_schema_chain,
+        mock_plotter,
+        mock_figure_cache,
+        mock_store,
     ):
         """Create Service instance with mocked dependencies."""
         return Service(
@@ -47,6 +68,9 @@ class TestService:
             conversor=mock_conversor,
             command_invoker=mock_command_invoker,
             handler_schema_chain=mock_handler_schema_chain,
+            plotter=mock_plotter,
+            figure_cache=mock_figure_cache,
+            store=mock_store,
         )
 
     @pytest.fixture
@@ -95,7 +119,9 @@ class TestService:
         result = service.search_records_by_name(mock_query)
 
         # Verify
-        mock_source.get_records_by_name.assert_called_once_with(query=mock_query)
+        mock_source.get_records_by_name.assert_called_once_with(
+            query=mock_query, lean=False
+        )
         assert result == expected_records
         assert len(result) == 2
 
@@ -110,7 +136,9 @@ class TestService:
         result = service.search_records_by_name(mock_query)
 
         # Verify
-        mock_source.get_records_by_name.assert_called_once_with(query=mock_query)
+        mock_source.get_records_by_name.assert_called_once_with(
+            query=mock_query, lean=False
+        )
         assert result == []
         assert len(result) == 0
 
@@ -127,7 +155,9 @@ class TestService:
         result = service.search_records_by_name(mock_query)
 
         # Verify
-        mock_source.get_records_by_name.assert_called_once_with(query=mock_query)
+        mock_source.get_records_by_name.assert_called_once_with(
+            query=mock_query, lean=False
+        )
         assert result == []
         assert len(result) == 0
 
@@ -142,7 +172,67 @@ class TestService:
             service.search_records_by_name(mock_query)
 
         assert "Unexpected error" in str(exc_info.value)
-        mock_source.get_records_by_name.assert_called_once_with(query=mock_query)
+        mock_source.get_records_by_name.assert_called_once_with(
+            query=mock_query, lean=False
+        )
+
+    def test_search_records_by_name_lean(self, service, mock_source, mock_query):
+        """Test lean search passes the mode to the source."""
+        mock_source.get_records_by_name.return_value = []
+
+        service.search_records_by_name(mock_query, lean=True)
+
+        mock_source.get_records_by_name.assert_called_once_with(
+            query=mock_query, lean=True
+        )
+
+    def test_iter_records(self, service, mock_source, mock_query, mock_record):
+        """Test iter_records yields the records of the source lazily."""
+        mock_source.iter_records.return_value = iter([mock_record, mock_record])
+
+        records = service.iter_records(mock_query)
+
+        mock_source.iter_records.assert_not_called()
+        assert list(records) == [mock_record, mock_record]
+        mock_source.iter_records.assert_called_once_with(query=mock_query, lean=False)
+
+    def test_iter_records_data_access_exception(
+        self, service, mock_source, mock_query, mock_record
+    ):
+        """Test iter_records stops when a page cannot be fetched."""
+
+        def pages(query, lean):
+            yield mock_record
+            raise DataAccessException("Connection failed")
+
+        mock_source.iter_records.side_effect = pages
+
+        assert list(service.iter_records(mock_query)) == [mock_record]
+
+    def test_search_records_by_name_non_verbose(
+        self,
+        mock_source,
+        mock_conversor,
+        mock_command_invoker,
+        mock_handler_schema_chain,
+        mock_query,
+        mock_record,
+    ):
+        """Test that found records are not listed when verbose is disabled."""
+        mock_source.get_records_by_name.return_value = [mock_record, mock_record]
+        service = Service(
+            source=mock_source,
+            conversor=mock_conversor,
+            command_invoker=mock_command_invoker,
+            handler_schema_chain=mock_handler_schema_chain,
+            verbose=False,
+        )
+
+        with patch("hflav_fair_client.services.service.logger") as mock_logger:
+            result = service.search_records_by_name(mock_query)
+
+        assert len(result) == 2
+        mock_logger.info.assert_called_once()
 
     # Test search_and_load_data_file method
     def test_search_and_load_data_file_success(
@@ -428,6 +518,8 @@ class TestService:
         assert hasattr(service, "load_data_file")
         assert hasattr(service, "load_local_data_file_from_path")
         assert hasattr(service, "plot_data")
+        assert hasattr(service, "plot_groups")
+        assert hasattr(service, "render_plot")
 
     # Test dependency injection
     def test_service_dependency_injection(
@@ -464,7 +556,7 @@ class TestService:
         result = service.search_records_by_name(query)
 
         # Verify
-        mock_source.get_records_by_name.assert_called_once_with(query=query)
+        mock_source.get_records_by_name.assert_called_once_with(query=query, lean=False)
         assert result == expected_records
 
     def test_load_data_file_with_empty_filename(
@@ -530,18 +622,235 @@ class TestService:
         mock_command_invoker.set_command.assert_called_once()
         mock_command_invoker.execute_command.assert_called_once()
 
-    def test_plot_data(self, service):
-        """Test plot_data method."""
+    def test_plot_data(self, service, mock_plotter):
+        """Test plot_data delegates to the plotter and returns its figure."""
         from types import SimpleNamespace
 
         data_object = SimpleNamespace(test="data")
+        mock_figure = Mock()
+        mock_plotter.plot.return_value = mock_figure
 
-        # Execute - should return None
         result = service.plot_data(data_object)
 
-        assert result is None
+        assert result == mock_figure
+        mock_plotter.plot.assert_called_once_with(data_object, save_path=None)
 
-        # Execute with save_path - should also return None
+        # Execute with save_path - the plotter saves the figure
         result_with_path = service.plot_data(data_object, save_path="/tmp/plot.png")
 
-        assert result_with_path is None
+        assert result_with_path == mock_figure
+        mock_plotter.plot.assert_called_with(data_object, save_path="/tmp/plot.png")
+
+    def test_render_plot(self, service, mock_plotter, mock_figure_cache):
+        """Test render_plot renders through the figure cache."""
+        data_object = SimpleNamespace(test="data")
+        mock_figure_cache.render.return_value = b"png"
+
+        result = service.render_plot(data_object, format="png")
+
+        assert result == b"png"
+        mock_figure_cache.render.assert_called_once_with(
+            mock_plotter, data_object, format="png"
+        )
+
+    def test_plot_groups(self, service, mock_plotter):
+        """Test plot_groups renders the groups with the injected plotter."""
+        data_object = SimpleNamespace(groups=[])
+
+        with patch("hflav_fair_client.services.service.BatchPlotter") as mock_batch:
+            mock_batch.return_value.plot_groups.return_value = {"figures": 0}
+
+            result = service.plot_groups(
+                data_object, "/tmp/figures", formats=["svg"], max_workers=2
+            )
+
+        assert result == {"figures": 0}
+        mock_batch.assert_called_once_with(mock_plotter, max_workers=2)
+        mock_batch.return_value.plot_groups.assert_called_once_with(
+            data_object, "/tmp/figures", formats=["svg"]
+        )
+
+    def test_load_local_data_file_with_snapshot(
+        self, service, mock_conversor, tmp_path
+    ):
+        """Test the snapshot is written on the first load and used afterwards."""
+        data_path = tmp_path / "data.json"
+        data_path.write_text('{"name": "test"}')
+        schema_path = tmp_path / "schema.json"
+        schema_path.write_text('{"type": "object"}')
+        mock_conversor.generate_instance_from_local_path.return_value = SimpleNamespace(
+            name="test", values=[float(i) for i in range(100)]
+        )
+
+        first = service.load_local_data_file_with_snapshot(
+            str(data_path), schema_path=str(schema_path)
+        )
+        second = service.load_local_data_file_with_snapshot(
+            str(data_path), schema_path=str(schema_path)
+        )
+
+        assert second == first
+        assert (tmp_path / "data.json.snapshot").is_file()
+        mock_conversor.generate_instance_from_local_path.assert_called_once_with(
+            data_path=str(data_path), schema_path=str(schema_path), validate=True
+        )
+
+    def test_load_local_data_file_with_outdated_snapshot(
+        self, service, mock_conversor, tmp_path
+    ):
+        """Test the snapshot is rewritten when the data or the schema change."""
+        data_path = tmp_path / "data.json"
+        data_path.write_text('{"name": "test"}')
+        snapshot_path = str(tmp_path / "cache.snapshot")
+        mock_conversor.generate_instance_from_local_path.side_effect = [
+            SimpleNamespace(name="test"),
+            SimpleNamespace(name="unvalidated"),
+            SimpleNamespace(name="changed"),
+        ]
+
+        service.load_local_data_file_with_snapshot(
+            str(data_path), snapshot_path=snapshot_path
+        )
+        service.load_local_data_file_with_snapshot(
+            str(data_path), validate=False, snapshot_path=snapshot_path
+        )
+        data_path.write_text('{"name": "changed"}')
+        changed = service.load_local_data_file_with_snapshot(
+            str(data_path), validate=False, snapshot_path=snapshot_path
+        )
+
+        assert changed.name == "changed"
+        assert mock_conversor.generate_instance_from_local_path.call_count == 3
+        assert service.load_local_data_file_with_snapshot(
+            str(data_path), validate=False, snapshot_path=snapshot_path
+        ) == SimpleNamespace(name="changed")
+
+    def test_load_local_data_files_from_paths(self, service, mock_conversor):
+        """Test the bulk load uses the injected conversor."""
+        with patch("hflav_fair_client.services.service.BulkLoader") as mock_loader:
+            result = service.load_local_data_files_from_paths(
+                ["/a.json", "/b.json"], schema_path="/schema.json", max_workers=3
+            )
+
+        assert result is mock_loader.return_value.load.return_value
+        mock_loader.assert_called_once_with(mock_conversor, max_workers=3)
+        mock_loader.return_value.load.assert_called_once_with(
+            ["/a.json", "/b.json"], schema_path="/schema.json", validate=True
+        )
+
+    def test_export_tables(self, service):
+        """Test export_tables writes the Parquet tables of the data object."""
+        data_object = SimpleNamespace(groups=[])
+
+        with patch("hflav_fair_client.services.service.TableExporter") as mock_exporter:
+            mock_exporter.return_value.write_parquet.return_value = {"groups": "/g"}
+
+            result = service.export_tables(data_object, "/tmp/tables")
+
+        assert result == {"groups": "/g"}
+        mock_exporter.return_value.write_parquet.assert_called_once_with(
+            data_object, "/tmp/tables"
+        )
+
+    def test_ingest_records(self, service, mock_source, mock_store, mock_query):
+        """Test only the new or updated records are loaded into the store."""
+        records = []
+        for record_id in (1, 2, 3):
+            record = Mock(spec=Record)
+            record.id = record_id
+            record.children = [
+                SimpleNamespace(name="data.json"),
+                SimpleNamespace(name="readme.txt"),
+            ]
+            records.append(record)
+        mock_source.iter_records.return_value = iter(records)
+        mock_store.needs_update.side_effect = lambda record: record.id != 2
+
+        with patch.object(
+            service,
+            "load_data_file",
+            side_effect=[SimpleNamespace(groups=[]), DataAccessException("down")],
+        ) as mock_load:
+            summary = service.ingest_records(mock_query, dest_path="/tmp/downloads")
+
+        assert summary == {"ingested": [1], "skipped": [2], "failed": [3]}
+        mock_source.iter_records.assert_called_once_with(query=mock_query)
+        mock_load.assert_any_call(1, "data.json", dest_path="/tmp/downloads")
+        assert mock_load.call_count == 2
+        mock_store.ingest.assert_called_once_with(
+            records[0], {"data.json": SimpleNamespace(groups=[])}
+        )
+
+    def test_sync_records(self, service, mock_source, mock_command_invoker):
+        """Test sync_records runs the sync command through the invoker."""
+        mock_command_invoker.execute_command.return_value = {"synced": [1]}
+
+        result = service.sync_records("mirror")
+
+        assert result == {"synced": [1]}
+        command = mock_command_invoker.set_command.call_args[0][0]
+        assert isinstance(command, SyncRecords)
+        assert command._mirror_dir == "mirror"
+        assert isinstance(command._source, SourceZenodoRequest)
+
+    def test_build_mirror(self, service, mock_command_invoker):
+        """Test build_mirror runs the build command through the invoker."""
+        mock_command_invoker.execute_command.return_value = {"templates": [1]}
+
+        result = service.build_mirror("mirror", schema_versions=["v1"])
+
+        assert result == {"templates": [1]}
+        command = mock_command_invoker.set_command.call_args[0][0]
+        assert isinstance(command, BuildMirror)
+        assert command._mirror_dir == "mirror"
+        assert command._schema_versions == ["v1"]
+
+    def test_ingest_records_search_error(
+        self, service, mock_source, mock_store, mock_query
+    ):
+        """Test a failed search ingests nothing."""
+        mock_source.iter_records.side_effect = DataAccessException("down")
+
+        summary = service.ingest_records(mock_query)
+
+        assert summary == {"ingested": [], "skipped": [], "failed": []}
+        mock_store.ingest.assert_not_called()
+
+    def test_ingest_records_keeps_pages_before_a_search_error(
+        self, service, mock_source, mock_store, mock_query
+    ):
+        """Test the records of the pages before a failed one are ingested."""
+        record = Mock(spec=Record)
+        record.id = 1
+        record.children = [SimpleNamespace(name="data.json")]
+
+        def records(query):
+            yield record
+            raise DataAccessException("down")
+
+        mock_source.iter_records.side_effect = records
+        mock_store.needs_update.return_value = True
+
+        with patch.object(service, "load_data_file", return_value=SimpleNamespace()):
+            summary = service.ingest_records(mock_query)
+
+        assert summary == {"ingested": [1], "skipped": [], "failed": []}
+        mock_store.ingest.assert_called_once()
+
+    def test_query_averages(self, service, mock_store):
+        """Test query_averages delegates to the store."""
+        mock_store.query_averages.return_value = [{"name": "BR"}]
+
+        result = service.query_averages(pdg_code="511", limit=5)
+
+        assert result == [{"name": "BR"}]
+        mock_store.query_averages.assert_called_once_with(
+            name=None, pdg_code="511", name_like=None, record_id=None, limit=5
+        )
+
+    def test_plot_data_propagates_errors(self, service, mock_plotter):
+        """Test plot_data raises when there is nothing to plot."""
+        mock_plotter.plot.side_effect = ValueError("Nothing to plot")
+
+        with pytest.raises(ValueError):
+            service.plot_data(SimpleNamespace(test="data"))
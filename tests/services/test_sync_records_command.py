@@ -0,0 +1,182 @@
+import json
+import os
+from unittest.mock import ANY, Mock
+
+from hflav_fair_client.exceptions.source_exceptions import DataAccessException
+from hflav_fair_client.filters.search_filters import TextFilter
+from hflav_fair_client.filters.zenodo_query import ZenodoQuery
+from hflav_fair_client.models.models import RecordSummary
+from hflav_fair_client.services.sync_records_command import SyncRecords, SyncState
+from hflav_fair_client.source.source_zenodo_requests import SourceZenodoRequest
+
+
+def _record(record_id, updated="2024-01-01T00:00:00", checksums=("md5:a",)):
+    return {
+        "id": record_id,
+        "doi": f"10.5281/zenodo.{record_id}",
+        "created": "2023-01-01T00:00:00",
+        "updated": updated,
+        "metadata": {"title": f"Record {record_id}"},
+        "files": [
+            {
+                "key": f"data_{i}.json",
+                "checksum": checksum,
+                "links": {"self": f"https://zenodo.org/{record_id}/data_{i}.json"},
+            }
+            for i, checksum in enumerate(checksums)
+        ],
+    }
+
+
+class FakeZenodo:
+    """Records served to a mocked SourceZenodoRequest, with ETags."""
+
+    def __init__(self, records):
+        self.records = {record["id"]: record for record in records}
+        self.source = Mock(spec=SourceZenodoRequest)
+        self.source.iter_records.side_effect = self.iter_records
+        self.source.get_record_if_modified.side_effect = self.get_record_if_modified
+        self.source.download_file.side_effect = self.download_file
+        self.queries = []
+
+    def etag(self, record):
+        return f'"{record["updated"]}-{len(record["files"])}"'
+
+    def iter_records(self, query, lean=False, bypass_cache=False):
+        self.queries.append(query)
+        return iter([RecordSummary(record) for record in self.records.values()])
+
+    def get_record_if_modified(self, record_id, etag=None):
+        record = self.records[record_id]
+        if etag == self.etag(record):
+            return None, etag
+        return json.loads(json.dumps(record)), self.etag(record)
+
+    def download_file(self, url, path, checksum=None, bypass_cache=False):
+        with open(path, "w") as file:
+            file.write(url)
+        return path
+
+
+def _command(fake, mirror_dir, **kwargs):
+    return SyncRecords(
+        mirror_dir=str(mirror_dir),
+        source=fake.source,
+        query_class=ZenodoQuery,
+        **kwargs,
+    )
+
+
+class TestSyncRecordsCommand:
+    """Test suite for SyncRecords command."""
+
+    def test_first_sync_mirrors_everything(self, tmp_path):
+        fake = FakeZenodo([_record(1), _record(2, checksums=("md5:a", "md5:b"))])
+
+        summary = _command(fake, tmp_path).execute()
+
+        assert summary == {"synced": [1, 2], "unchanged": [], "failed": []}
+        assert fake.source.download_file.call_count == 3
+        assert (tmp_path / "files" / "2" / "data_1.json").exists()
+        assert json.loads((tmp_path / "records" / "1.json").read_text())["id"] == 1
+        assert "q" not in fake.queries[0].build_params()
+        fake.source.iter_records.assert_called_once_with(
+            ANY, lean=True, bypass_cache=True
+        )
+        state = SyncState(str(tmp_path))
+        assert state.watermark is not None
+        assert state.records["1"]["files"] == {"data_0.json": "md5:a"}
+        index = json.loads((tmp_path / "index.json").read_text())
+        assert index["records"]["2"]["title"] == "Record 2"
+
+    def test_second_sync_uses_the_watermark(self, tmp_path):
+        fake = FakeZenodo([_record(1)])
+        _command(fake, tmp_path).execute()
+        watermark = SyncState(str(tmp_path)).watermark
+
+        summary = _command(fake, tmp_path).execute()
+
+        assert summary == {"synced": [], "unchanged": [1], "failed": []}
+        assert f"updated:[{watermark} TO *]" in fake.queries[1].build_params()["q"]
+        fake.source.get_record_if_modified.assert_called_once()
+        assert fake.source.download_file.call_count == 1
+
+    def test_only_changed_files_are_downloaded(self, tmp_path):
+        fake = FakeZenodo([_record(1, checksums=("md5:a", "md5:b", "md5:c"))])
+        _command(fake, tmp_path).execute()
+        fake.source.download_file.reset_mock()
+
+        fake.records[1] = _record(
+            1, "2024-02-01T00:00:00", checksums=("md5:a", "md5:changed")
+        )
+        summary = _command(fake, tmp_path).execute()
+
+        assert summary["synced"] == [1]
+        fake.source.download_file.assert_called_once_with(
+            "https://zenodo.org/1/data_1.json",
+            os.path.join(str(tmp_path), "files", "1", "data_1.json"),
+            checksum="md5:changed",
+            bypass_cache=True,
+        )
+        assert not (tmp_path / "files" / "1" / "data_2.json").exists()
+
+    def test_not_modified_record(self, tmp_path):
+        fake = FakeZenodo([_record(1)])
+        _command(fake, tmp_path).execute()
+        state = SyncState(str(tmp_path))
+        state.records["1"]["updated"] = "outdated"
+        state.save()
+
+        summary = _command(fake, tmp_path).execute()
+
+        assert summary["unchanged"] == [1]
+        assert fake.source.download_file.call_count == 1
+        assert fake.source.get_record_if_modified.call_args[0] == (
+            1,
+            fake.etag(fake.records[1]),
+        )
+
+    def test_failed_record_keeps_the_watermark(self, tmp_path):
+        fake = FakeZenodo([_record(1), _record(2)])
+        fake.source.get_record_if_modified.side_effect = [
+            DataAccessException("down"),
+            fake.get_record_if_modified(2),
+        ]
+
+        summary = _command(fake, tmp_path).execute()
+
+        assert summary == {"synced": [2], "unchanged": [], "failed": [1]}
+        state = SyncState(str(tmp_path))
+        assert state.watermark is None
+        assert set(state.records) == {"2"}
+
+    def test_search_error_keeps_the_watermark(self, tmp_path):
+        fake = FakeZenodo([])
+        fake.source.iter_records.side_effect = DataAccessException("down")
+
+        summary = _command(fake, tmp_path).execute()
+
+        assert summary == {"synced": [], "unchanged": [], "failed": []}
+        assert SyncState(str(tmp_path)).watermark is None
+
+    def test_filter_is_combined_with_the_watermark(self, tmp_path):
+        fake = FakeZenodo([])
+        state = SyncState(str(tmp_path))
+        state.watermark = "2024-01-01T00:00:00"
+        state.save()
+
+        _command(fake, tmp_path, filter=TextFilter("title", "HFLAV")).execute()
+
+        assert fake.queries[0].build_params()["q"] == (
+            '(title:"HFLAV") AND (updated:[2024-01-01T00:00:00 TO *])'
+        )
+
+    def test_unreadable_state_is_ignored(self, tmp_path):
+        (tmp_path / SyncState.FILENAME).write_text("{")
+
+        assert SyncState(str(tmp_path)).records == {}
+
+    def test_undo_is_not_supported(self, tmp_path):
+        command = _command(FakeZenodo([]), tmp_path)
+
+        assert command.undo() is None
@@ -1,3 +1,4 @@
+import hashlib
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timezone
@@ -11,7 +12,7 @@ from hflav_fair_client.exceptions.source_exceptions import (
 )
 from hflav_fair_client.filters.base_query import BaseQuery
 from hflav_fair_client.filters.search_filters import OrFilter, QueryBuilder
-from hflav_fair_client.models.models import Record, Template, File
+from hflav_fair_client.models.models import Record, RecordSummary, Template, File
 from hflav_fair_client.source.source_zenodo_requests import SourceZenodoRequest
 
 
@@ -44,6 +45,19 @@ class TestSource(unittest.TestCase):
         """Test class initialization."""
         self.assertEqual(self.source.DEFAULT_BASE, "https://zenodo.org/api")
         self.assertEqual(self.source.CONCEPT_ID_TEMPLATE, 12087575)
+        self.assertEqual(self.source.base_url, "https://zenodo.org/api")
+
+    @patch("requests.get")
+    def test_custom_base_url(self, mock_get):
+        """Test requests go to the configured base URL."""
+        source = SourceZenodoRequest(base_url="http://localhost:8000/api/")
+        mock_get.return_value = self._response(data=self.mock_record_data)
+
+        source.get_record(123)
+
+        self.assertEqual(
+            mock_get.call_args[0][0], "http://localhost:8000/api/records/123"
+        )
 
     @patch("requests.get")
     def test_get_records_by_name_success(self, mock_get):
@@ -109,6 +123,123 @@ class TestSource(unittest.TestCase):
 
         self.assertIn("Failed to get records by name", str(context.exception))
 
+    def _page(self, ids, next_url=None):
+        response = Mock()
+        response.raise_for_status = Mock()
+        response.json.return_value = {
+            "hits": {
+                "hits": [
+                    {
+                        "id": record_id,
+                        "doi": f"10.1234/zenodo.{record_id}",
+                        "updated": "2023-01-02T12:00:00.000000",
+                        "created": "2023-01-01T12:00:00.000000",
+                        "metadata": {"title": f"Record {record_id}"},
+                        "files": [],
+                    }
+                    for record_id in ids
+                ]
+            },
+            "links": {"next": next_url} if next_url else {},
+        }
+        return response
+
+    @patch("requests.get")
+    def test_iter_records_follows_pagination(self, mock_get):
+        """Test of iter_records over several pages."""
+        mock_get.side_effect = [
+            self._page([1, 2], "https://zenodo.org/api/records?page=2"),
+            self._page([3, 4], "https://zenodo.org/api/records?page=3"),
+            self._page([5]),
+        ]
+        mock_query = Mock(spec=BaseQuery)
+        mock_query.build_params.return_value = {"q": "test", "size": 2}
+
+        records = list(self.source.iter_records(mock_query))
+
+        self.assertEqual([record.id for record in records], [1, 2, 3, 4, 5])
+        self.assertEqual(mock_get.call_count, 3)
+        mock_get.assert_any_call(
+            "https://zenodo.org/api/records",
+            params={"q": "test", "size": 2},
+            timeout=30,
+        )
+        mock_get.assert_any_call(
+            "https://zenodo.org/api/records?page=3", params=None, timeout=30
+        )
+
+    @patch("requests.get")
+    def test_get_records_by_name_lean(self, mock_get):
+        """Test of get_records_by_name returning lightweight summaries."""
+        mock_get.return_value = self._page([1, 2])
+        mock_query = Mock(spec=BaseQuery)
+        mock_query.build_params.return_value = {}
+
+        records = self.source.get_records_by_name(mock_query, lean=True)
+
+        self.assertTrue(all(isinstance(r, RecordSummary) for r in records))
+        self.assertEqual([r.title for r in records], ["Record 1", "Record 2"])
+
+    @patch("requests.get")
+    def test_iter_records_lean(self, mock_get):
+        """Test of iter_records yielding lightweight summaries."""
+        mock_get.return_value = self._page([1])
+        mock_query = Mock(spec=BaseQuery)
+        mock_query.build_params.return_value = {}
+
+        records = list(self.source.iter_records(mock_query, lean=True))
+
+        self.assertEqual(len(records), 1)
+        self.assertIsInstance(records[0], RecordSummary)
+
+    @patch("requests.get")
+    def test_iter_records_stops_on_empty_page(self, mock_get):
+        """Test of iter_records when a next link points to an empty page."""
+        mock_get.side_effect = [
+            self._page([1], "https://zenodo.org/api/records?page=2"),
+            self._page([], "https://zenodo.org/api/records?page=3"),
+        ]
+        mock_query = Mock(spec=BaseQuery)
+        mock_query.build_params.return_value = {}
+
+        records = list(self.source.iter_records(mock_query))
+
+        self.assertEqual([record.id for record in records], [1])
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("requests.get")
+    def test_iter_records_is_lazy(self, mock_get):
+        """Test that iter_records only prefetches the page after the current one."""
+        mock_get.side_effect = [
+            self._page([1, 2], f"https://zenodo.org/api/records?page={page + 1}")
+            for page in range(1, 10)
+        ]
+        mock_query = Mock(spec=BaseQuery)
+        mock_query.build_params.return_value = {}
+
+        records = self.source.iter_records(mock_query)
+        self.assertEqual(next(records).id, 1)
+        records.close()
+
+        self.assertLessEqual(mock_get.call_count, 2)
+
+    @patch("requests.get")
+    def test_iter_records_http_error(self, mock_get):
+        """Test of iter_records when a page fails."""
+        failing = Mock()
+        failing.raise_for_status.side_effect = requests.HTTPError("HTTP Error")
+        mock_get.side_effect = [
+            self._page([1], "https://zenodo.org/api/records?page=2"),
+            failing,
+        ]
+        mock_query = Mock(spec=BaseQuery)
+        mock_query.build_params.return_value = {}
+
+        records = self.source.iter_records(mock_query)
+        self.assertEqual(next(records).id, 1)
+        with self.assertRaises(DataAccessException):
+            next(records)
+
     @patch("requests.get")
     def test_get_all_template_versions_success(self, mock_get):
         """Test successful retrieval of all template versions."""
@@ -199,6 +330,135 @@ class TestSource(unittest.TestCase):
         self.assertIsInstance(result, Record)
         self.assertEqual(result.id, 123456)
 
+    def _response(self, status_code=200, headers=None, data=None):
+        response = Mock(status_code=status_code, headers=headers or {})
+        response.raise_for_status = Mock()
+        if data is None:
+            response.json.side_effect = AssertionError("body parsed again")
+        else:
+            response.json.return_value = data
+        return response
+
+    @patch("requests.get")
+    def test_get_record_revalidates_with_etag(self, mock_get):
+        """Test that a stored record is revalidated and reused on a 304."""
+        mock_get.side_effect = [
+            self._response(headers={"ETag": '"v1"'}, data=self.mock_record_data),
+            self._response(status_code=304, headers={"ETag": '"v1"'}),
+        ]
+
+        first = self.source.get_record(123456)
+        second = self.source.get_record(123456)
+
+        self.assertEqual(first, second)
+        mock_get.assert_called_with(
+            "https://zenodo.org/api/records/123456",
+            headers={"If-None-Match": '"v1"'},
+            timeout=30,
+        )
+
+    @patch("requests.get")
+    def test_get_record_reuses_revalidated_cache_entry(self, mock_get):
+        """Test that a response with unchanged validators is not parsed again."""
+        headers = {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+        mock_get.side_effect = [
+            self._response(headers=headers, data=self.mock_record_data),
+            self._response(headers=headers),
+        ]
+
+        self.source.get_record(123456)
+        record = self.source.get_record(123456)
+
+        self.assertEqual(record.id, 123456)
+        self.assertEqual(
+            mock_get.call_args.kwargs["headers"],
+            {
+                "If-None-Match": '"v1"',
+                "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+            },
+        )
+
+    @patch("requests.get")
+    def test_get_record_changed_etag(self, mock_get):
+        """Test that a record with a new ETag is parsed again."""
+        changed = dict(self.mock_record_data, metadata={"title": "Changed"})
+        mock_get.side_effect = [
+            self._response(headers={"ETag": '"v1"'}, data=self.mock_record_data),
+            self._response(headers={"ETag": '"v2"'}, data=changed),
+        ]
+
+        self.source.get_record(123456)
+        record = self.source.get_record(123456)
+
+        self.assertEqual(record.title, "Changed")
+
+    @patch("requests.get")
+    def test_get_record_copies_are_independent(self, mock_get):
+        """Test that changing a returned record does not change the stored one."""
+        mock_get.side_effect = [
+            self._response(headers={"ETag": '"v1"'}, data=self.mock_record_data),
+            self._response(status_code=304),
+        ]
+
+        first = self.source.get_record(123456)
+        first.remove_child("test_file.txt")
+        second = self.source.get_record(123456)
+
+        self.assertEqual(len(second.children), 1)
+
+    @patch("requests.get")
+    def test_get_record_not_modified_after_eviction(self, mock_get):
+        """Test that a 304 without stored body falls back to a full request."""
+        source = SourceZenodoRequest()
+
+        def evict_and_answer(url, headers=None, timeout=None):
+            if headers:
+                source._parsed_responses.clear()
+                return self._response(status_code=304)
+            return self._response(headers={"ETag": '"v1"'}, data=self.mock_record_data)
+
+        mock_get.side_effect = evict_and_answer
+        source.get_record(123456)
+
+        record = source.get_record(123456)
+
+        self.assertEqual(record.id, 123456)
+        self.assertEqual(mock_get.call_count, 3)
+
+    @patch("requests.get")
+    def test_template_versions_are_revalidated(self, mock_get):
+        """Test that the template version list is reused on 304 responses."""
+        versions = {
+            "hits": {
+                "hits": [
+                    {
+                        "id": 1,
+                        "created": "2023-01-01T12:00:00.000000",
+                        "updated": "2023-01-01T12:00:00.000000",
+                        "metadata": {"title": "Template v1", "version": "1.0.0"},
+                        "files": [],
+                    }
+                ]
+            }
+        }
+        record = {"links": {"versions": "https://zenodo.org/api/versions"}}
+        mock_get.side_effect = [
+            self._response(headers={"ETag": '"r1"'}, data=record),
+            self._response(headers={"ETag": '"t1"'}, data=versions),
+            self._response(status_code=304),
+            self._response(status_code=304),
+        ]
+
+        first = self.source._get_all_template_versions()
+        second = self.source._get_all_template_versions()
+
+        self.assertEqual(first, second)
+        mock_get.assert_called_with(
+            "https://zenodo.org/api/versions",
+            headers={"If-None-Match": '"t1"'},
+            timeout=30,
+        )
+
     @patch("requests.get")
     def test_get_record_invalid_id(self, mock_get):
         """Test of get_record with invalid ID."""
@@ -220,6 +480,93 @@ class TestSource(unittest.TestCase):
 
         self.assertIn("Failed to get record", str(context.exception))
 
+    @patch("requests.get")
+    def test_get_record_if_modified_changed(self, mock_get):
+        """Test of get_record_if_modified when the record changed."""
+        mock_response = Mock(status_code=200, headers={"ETag": '"v2"'})
+        mock_response.json.return_value = self.mock_record_data
+        mock_get.return_value = mock_response
+
+        data, etag = self.source.get_record_if_modified(123456, '"v1"')
+
+        self.assertEqual(data, self.mock_record_data)
+        self.assertEqual(etag, '"v2"')
+        mock_get.assert_called_once_with(
+            "https://zenodo.org/api/records/123456",
+            headers={"Cache-Control": "no-store", "If-None-Match": '"v1"'},
+            timeout=30,
+        )
+
+    @patch("requests.get")
+    def test_download_file_checks_the_checksum(self, mock_get):
+        """Test download_file with a matching checksum, bypassing the HTTP cache."""
+        mock_response = Mock()
+        mock_response.iter_content.return_value = [b"test ", b"data"]
+        mock_get.return_value = mock_response
+        checksum = f"md5:{hashlib.md5(b'test data').hexdigest()}"
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "data.json")
+            self.source.download_file(
+                "http://example.com/data.json", path, checksum, bypass_cache=True
+            )
+
+            with open(path, "rb") as file:
+                self.assertEqual(file.read(), b"test data")
+            self.assertEqual(os.listdir(temp_dir), ["data.json"])
+        mock_get.assert_called_once_with(
+            "http://example.com/data.json",
+            stream=True,
+            headers={"Cache-Control": "no-store"},
+            timeout=60,
+        )
+
+    @patch("requests.get")
+    def test_download_file_checksum_mismatch(self, mock_get):
+        """Test download_file keeps the previous file when the checksum differs."""
+        mock_response = Mock()
+        mock_response.iter_content.return_value = [b"stale data"]
+        mock_get.return_value = mock_response
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "data.json")
+            with open(path, "w") as file:
+                file.write("previous")
+
+            with self.assertRaises(DataAccessException):
+                self.source.download_file(
+                    "http://example.com/data.json", path, "md5:0123"
+                )
+
+            with open(path) as file:
+                self.assertEqual(file.read(), "previous")
+            self.assertEqual(os.listdir(temp_dir), ["data.json"])
+
+    @patch("requests.get")
+    def test_get_record_if_modified_not_modified(self, mock_get):
+        """Test of get_record_if_modified with a 304 response."""
+        mock_get.return_value = Mock(status_code=304, headers={})
+
+        data, etag = self.source.get_record_if_modified(123456, '"v1"')
+
+        self.assertIsNone(data)
+        self.assertEqual(etag, '"v1"')
+
+    @patch("requests.get")
+    def test_get_record_if_modified_http_error(self, mock_get):
+        """Test of get_record_if_modified with HTTP error."""
+        mock_response = Mock(status_code=500)
+        mock_response.raise_for_status.side_effect = requests.HTTPError("HTTP Error")
+        mock_get.return_value = mock_response
+
+        with self.assertRaises(DataAccessException):
+            self.source.get_record_if_modified(123456)
+        mock_get.assert_called_once_with(
+            "https://zenodo.org/api/records/123456",
+            headers={"Cache-Control": "no-store"},
+            timeout=30,
+        )
+
     @patch.object(SourceZenodoRequest, "_get_all_template_versions")
     def test_get_correct_template_by_date_none(self, mock_get_templates):
         """Test of get_correct_template_by_date without date."""
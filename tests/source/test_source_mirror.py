@@ -0,0 +1,180 @@
+import json
+import os
+from datetime import datetime
+
+import pytest
+
+from hflav_fair_client.container import Container
+from hflav_fair_client.exceptions.source_exceptions import (
+    DataNotFoundException,
+    NoVersionTagFound,
+)
+from hflav_fair_client.filters.search_filters import TextFilter
+from hflav_fair_client.filters.zenodo_query import ZenodoQuery
+from hflav_fair_client.models.models import Record, RecordSummary
+from hflav_fair_client.source.source_mirror import (
+    SourceGitlabMirror,
+    SourceMirror,
+    read_index,
+    record_file_path,
+    record_path,
+    schema_path,
+    write_index,
+)
+from hflav_fair_client.source.source_zenodo_requests import SourceZenodoRequest
+
+
+def _record(record_id, title, created="2023-01-01T00:00:00", updated=None):
+    return {
+        "id": record_id,
+        "doi": f"10.5281/zenodo.{record_id}",
+        "created": created,
+        "updated": updated or created,
+        "metadata": {"title": title, "version": "1.0"},
+        "files": [
+            {
+                "key": "data.json",
+                "links": {"self": f"https://zenodo.org/{record_id}/data.json"},
+            }
+        ],
+    }
+
+
+def _write_record(mirror_dir, data):
+    path = record_path(mirror_dir, data["id"])
+    file_path = record_file_path(mirror_dir, data["id"], "data.json")
+    for directory in (path, file_path):
+        os.makedirs(os.path.dirname(directory), exist_ok=True)
+    with open(path, "w") as file:
+        json.dump(data, file)
+    with open(file_path, "w") as file:
+        file.write(f'{{"record": {data["id"]}}}')
+
+
+@pytest.fixture
+def mirror_dir(tmp_path):
+    mirror_dir = str(tmp_path)
+    _write_record(mirror_dir, _record(1, "HFLAV release A", updated="2024-01-01"))
+    _write_record(mirror_dir, _record(2, "HFLAV release B", updated="2025-01-01"))
+    _write_record(mirror_dir, _record(3, "Charm averages", updated="2024-06-01"))
+    _write_record(mirror_dir, _record(10, "HFLAV template", "2023-01-01T00:00:00"))
+    _write_record(mirror_dir, _record(11, "HFLAV template", "2024-03-01T00:00:00"))
+    schema = schema_path(mirror_dir, "v1.0")
+    os.makedirs(os.path.dirname(schema), exist_ok=True)
+    with open(schema, "w") as file:
+        json.dump({"type": "object"}, file)
+    write_index(mirror_dir, templates=[10, 11], schemas=["v1.0"])
+    return mirror_dir
+
+
+def _query(text=None, size=10, page=1):
+    return ZenodoQuery(TextFilter("title", text) if text else None, "", size, page)
+
+
+class TestWriteIndex:
+    """Test suite for the mirror index."""
+
+    def test_index_content(self, mirror_dir):
+        index = read_index(mirror_dir)
+
+        assert set(index["records"]) == {"1", "2", "3", "10", "11"}
+        assert index["records"]["3"]["title"] == "Charm averages"
+        assert index["templates"] == ["10", "11"]
+        assert index["schemas"] == {"v1.0": "schemas/v1.0.schema"}
+
+    def test_previous_templates_and_schemas_are_kept(self, mirror_dir):
+        _write_record(mirror_dir, _record(4, "New release"))
+
+        index = write_index(mirror_dir)
+
+        assert "4" in index["records"]
+        assert index["templates"] == ["10", "11"]
+        assert list(index["schemas"]) == ["v1.0"]
+
+    def test_missing_index(self, tmp_path):
+        with pytest.raises(DataNotFoundException):
+            read_index(str(tmp_path))
+
+    def test_schema_path_sanitizes_the_tag(self, tmp_path):
+        path = schema_path(str(tmp_path), "../v1")
+
+        assert os.path.dirname(path) == os.path.join(str(tmp_path), "schemas")
+
+
+class TestSourceMirror:
+    """Test suite for SourceMirror."""
+
+    def test_search_matches_titles_newest_first(self, mirror_dir):
+        records = SourceMirror(mirror_dir).get_records_by_name(_query("HFLAV"))
+
+        assert [record.id for record in records] == [2, 1]
+        assert all(isinstance(record, Record) for record in records)
+
+    def test_search_pagination_and_lean(self, mirror_dir):
+        source = SourceMirror(mirror_dir)
+
+        page = source.get_records_by_name(_query(size=2, page=2), lean=True)
+
+        assert [record.id for record in page] == [1]
+        assert isinstance(page[0], RecordSummary)
+        assert [r.id for r in source.iter_records(_query(size=1))] == [2, 3, 1]
+
+    def test_get_record(self, mirror_dir):
+        record = SourceMirror(mirror_dir).get_record(3)
+
+        assert record.title == "Charm averages"
+        with pytest.raises(DataNotFoundException):
+            SourceMirror(mirror_dir).get_record(99)
+
+    def test_get_correct_template_by_date(self, mirror_dir):
+        source = SourceMirror(mirror_dir)
+
+        assert source.get_correct_template_by_date().rec_id == 11
+        assert source.get_correct_template_by_date(datetime(2023, 6, 1)).rec_id == 10
+        with pytest.raises(DataNotFoundException):
+            source.get_correct_template_by_date(datetime(2020, 1, 1))
+
+    def test_download_returns_the_mirrored_file(self, mirror_dir, tmp_path):
+        source = SourceMirror(mirror_dir)
+
+        path = source.download_file_by_id_and_filename(1, "data.json")
+        copy = source.download_file_by_id_and_filename(
+            1, "data.json", dest_path=str(tmp_path / "out.json")
+        )
+
+        assert path == record_file_path(mirror_dir, 1, "data.json")
+        assert json.loads(open(copy).read()) == {"record": 1}
+
+    def test_missing_mirror(self, tmp_path):
+        with pytest.raises(DataNotFoundException):
+            SourceMirror(str(tmp_path)).get_record(1)
+
+
+class TestSourceGitlabMirror:
+    """Test suite for SourceGitlabMirror."""
+
+    def test_get_schema(self, mirror_dir):
+        schema = SourceGitlabMirror(mirror_dir).get_schema_inside_repository("v1.0")
+
+        assert schema == {"type": "object"}
+
+    def test_missing_tag(self, mirror_dir):
+        with pytest.raises(NoVersionTagFound):
+            SourceGitlabMirror(mirror_dir).get_schema_inside_repository("v2.0")
+
+
+class TestContainerSourceSelection:
+    """Test suite for the selection of the source in the Container."""
+
+    def test_zenodo_by_default(self, monkeypatch):
+        monkeypatch.delenv("HFLAV_SOURCE", raising=False)
+
+        assert isinstance(Container().source(), SourceZenodoRequest)
+
+    def test_mirror(self, monkeypatch, mirror_dir):
+        monkeypatch.setenv("HFLAV_SOURCE", "mirror")
+        monkeypatch.setenv("HFLAV_MIRROR_DIR", mirror_dir)
+        container = Container()
+
+        assert container.source().get_record(1).id == 1
+        assert isinstance(container.gitlab_source(), SourceGitlabMirror)
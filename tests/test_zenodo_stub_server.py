@@ -0,0 +1,171 @@
+import json
+import time
+from datetime import datetime
+
+import pytest
+import requests
+import requests_cache
+
+from hflav_fair_client.exceptions.source_exceptions import DataAccessException
+from hflav_fair_client.filters.search_filters import DateRangeFilter, TextFilter
+from hflav_fair_client.filters.zenodo_query import ZenodoQuery
+from hflav_fair_client.services.sync_records_command import SyncRecords, SyncState
+from hflav_fair_client.source.source_zenodo_requests import SourceZenodoRequest
+
+from zenodo_stub_server import ZenodoStubServer
+
+
+def _publish(stub):
+    for i, created in enumerate(["2023-01-01T00:00:00", "2024-01-01T00:00:00"]):
+        stub.add_record(
+            {
+                "id": 100 + i,
+                "doi": f"10.5281/zenodo.{100 + i}",
+                "conceptrecid": str(SourceZenodoRequest.CONCEPT_ID_TEMPLATE),
+                "created": created,
+                "metadata": {"title": "HFLAV template", "version": str(i)},
+            },
+            {"template.json": b"{}", "template.schema": b'{"type": "object"}'},
+        )
+    for i in range(1, 26):
+        stub.add_record(
+            {
+                "id": i,
+                "doi": f"10.5281/zenodo.{i}",
+                "created": "2024-06-01T00:00:00",
+                "updated": f"2024-06-{i:02d}T00:00:00",
+                "metadata": {"title": f"HFLAV release {i}"},
+            },
+            {"data.json": f'{{"record": {i}}}'.encode()},
+        )
+
+
+@pytest.fixture
+def stub():
+    with ZenodoStubServer() as stub, requests_cache.disabled():
+        _publish(stub)
+        yield stub
+
+
+@pytest.fixture
+def source(stub):
+    return SourceZenodoRequest(base_url=stub.base_url)
+
+
+def _query(filter=None, size=10):
+    return ZenodoQuery(filter, "mostrecent", size, 1)
+
+
+class TestZenodoStubServer:
+    """Test suite for ZenodoStubServer, through SourceZenodoRequest."""
+
+    def test_search_and_pagination(self, source):
+        query = _query(TextFilter("title", "release"))
+
+        page = source.get_records_by_name(query)
+        records = list(source.iter_records(query))
+
+        assert [record.id for record in page] == list(range(25, 15, -1))
+        assert [record.id for record in records] == list(range(25, 0, -1))
+
+    def test_search_date_range(self, source):
+        query = _query(DateRangeFilter("updated", datetime(2024, 6, 20)))
+
+        records = source.get_records_by_name(query)
+
+        assert [record.id for record in records] == list(range(25, 19, -1))
+
+    def test_template_versions(self, source):
+        assert source.get_correct_template_by_date().rec_id == 101
+        assert source.get_correct_template_by_date(datetime(2023, 6, 1)).rec_id == 100
+
+    def test_download_file(self, source, tmp_path):
+        path = source.download_file_by_id_and_filename(
+            3, "data.json", dest_path=str(tmp_path)
+        )
+
+        assert open(path).read() == '{"record": 3}'
+        assert source.get_record(3).children[0].checksum.startswith("md5:")
+
+    def test_conditional_requests(self, stub, source):
+        source.get_record(3)
+        source.get_record(3)
+        data, etag = source.get_record_if_modified(3)
+
+        assert [status for _, status in stub.requests] == [200, 304, 200]
+        assert source.get_record_if_modified(3, etag) == (None, etag)
+
+    def test_injected_errors(self, stub, source):
+        stub.inject_error(r"/records/3$", status=500)
+
+        with pytest.raises(DataAccessException):
+            source.get_record(3)
+        assert source.get_record(3).id == 3
+
+    def test_error_rate(self, stub):
+        stub.error_rate = 1.0
+
+        response = requests.get(f"{stub.base_url}/records/3", timeout=5)
+
+        assert response.status_code == 503
+
+    def test_unknown_path(self, stub):
+        response = requests.get(f"{stub.base_url}/records/999", timeout=5)
+
+        assert response.status_code == 404
+
+    def test_latency_and_bandwidth(self, stub, source, tmp_path):
+        stub.add_record(
+            {
+                "id": 50,
+                "doi": "10.5281/zenodo.50",
+                "created": "2024-01-01T00:00:00",
+                "metadata": {"title": "Big"},
+            },
+            {"big.bin": b"0" * 200_000},
+        )
+        source.get_record(50)
+        stub.latency = 0.05
+        stub.bandwidth = 1_000_000
+
+        start_time = time.perf_counter()
+        source.download_file_by_id_and_filename(50, "big.bin", str(tmp_path))
+        elapsed = time.perf_counter() - start_time
+
+        # 304 revalidation and the throttled download, each after the latency
+        assert elapsed >= 0.05 * 2 + 0.2
+
+
+class TestSyncThroughTheHttpCache:
+    """Test suite for SyncRecords against the stub server, with an HTTP cache."""
+
+    def _publish(self, stub, content, updated):
+        stub.add_record(
+            {
+                "id": 1,
+                "doi": "10.5281/zenodo.1",
+                "created": "2024-01-01T00:00:00",
+                "updated": updated,
+                "metadata": {"title": "HFLAV release"},
+            },
+            {"data.json": content},
+        )
+
+    def test_changes_are_not_hidden_by_the_cache(self, tmp_path):
+        mirror_dir = str(tmp_path / "mirror")
+        cache_path = str(tmp_path / "http_cache")
+        with ZenodoStubServer() as stub, requests_cache.enabled(cache_path):
+            source = SourceZenodoRequest(base_url=stub.base_url)
+            self._publish(stub, b'{"x": 1}', "2024-01-01T00:00:00")
+            SyncRecords(mirror_dir=mirror_dir, source=source).execute()
+            # Same search as the first sync
+            state = SyncState(mirror_dir)
+            state.watermark = None
+            state.save()
+
+            self._publish(stub, b'{"x": 2}', "2024-02-01T00:00:00")
+            summary = SyncRecords(mirror_dir=mirror_dir, source=source).execute()
+
+        assert summary["synced"] == [1]
+        with open(tmp_path / "mirror" / "files" / "1" / "data.json") as file:
+            assert json.load(file) == {"x": 2}
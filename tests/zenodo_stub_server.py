@@ -0,0 +1,286 @@
+"""
+In-process stub of the subset of the Zenodo REST API used by
+``SourceZenodoRequest``, to exercise real HTTP (connections, streaming, caching
+and conditional requests) in tests and benchmarks without reaching Zenodo.
+
+Served endpoints, under ``<base_url>`` (``http://127.0.0.1:<port>/api``):
+
+- ``GET /records?q=&size=&page=``: search. Only the quoted phrases of ``q`` are
+  matched against the titles and ``field:[from TO to]`` ranges against the
+  timestamps; hits are sorted newest ``updated`` first, with a ``links.next``
+  while there are more pages.
+- ``GET /records/<id>``: a record, or the latest version of a concept id.
+- ``GET /records/<id>/versions``: every version of the concept of a record.
+- ``GET /records/<id>/files/<name>/content``: the content of a file.
+
+JSON responses and files carry an ``ETag`` and honour ``If-None-Match`` with a
+304 response.
+"""
+
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, quote, unquote, urlencode, urlsplit
+
+from hflav_fair_client.logger import get_logger
+
+logger = get_logger(__name__)
+
+_CHUNK_SIZE = 64 * 1024
+
+
+class ZenodoStubServer:
+    """
+    Stub Zenodo server running in a background thread, usable as a context manager.
+
+    Attributes:
+        latency (float): Seconds waited before answering every request.
+        bandwidth (Optional[int]): Bytes per second at which bodies are sent;
+                                   unlimited if None.
+        error_rate (float): Probability of answering a request with a 503 error.
+        requests (List[Tuple[str, int]]): Path and status of every answered request.
+        connections (int): Number of accepted TCP connections.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        bandwidth: Optional[int] = None,
+        error_rate: float = 0.0,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.error_rate = error_rate
+        self.requests: List[Tuple[str, int]] = []
+        self.connections = 0
+        self._random = random.Random(seed)
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._files: Dict[Tuple[str, str], bytes] = {}
+        self._errors: List[List[Any]] = []
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._server = ThreadingHTTPServer((host, port), _StubRequestHandler)
+        self._server.daemon_threads = True
+        self._server.stub = self
+
+    @property
+    def base_url(self) -> str:
+        """Base URL of the API, to be given to ``SourceZenodoRequest``."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def start(self) -> "ZenodoStubServer":
+        """Start serving requests in a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever,
+                kwargs={"poll_interval": 0.05},
+                daemon=True,
+            )
+            self._thread.start()
+            logger.info(f"Zenodo stub server listening on {self.base_url}")
+        return self
+
+    def stop(self) -> None:
+        """Stop the server and close its socket."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> "ZenodoStubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def add_record(
+        self, record: Dict[str, Any], files: Optional[Dict[str, bytes]] = None
+    ) -> Dict[str, Any]:
+        """
+        Publish a record with its files, replacing any record with the same id.
+
+        Parameters:
+            record (Dict[str, Any]): Zenodo JSON of the record; at least ``id``,
+                                     ``created`` and ``metadata.title``. Records
+                                     sharing a ``conceptrecid`` are versions of it.
+            files (Optional[Dict[str, bytes]]): Content of every file, by name.
+        Returns:
+            Dict[str, Any]: The served JSON, with the links and file entries
+            (size, MD5 checksum and download link) filled in.
+        """
+        files = files or {}
+        recid = str(record["id"])
+        record_url = f"{self.base_url}/records/{recid}"
+        data = {"updated": record.get("created"), **record}
+        data["links"] = {
+            **record.get("links", {}),
+            "self": record_url,
+            "versions": f"{record_url}/versions",
+        }
+        data["files"] = [
+            {
+                "key": name,
+                "size": len(content),
+                "checksum": f"md5:{hashlib.md5(content).hexdigest()}",
+                "links": {"self": f"{record_url}/files/{quote(name)}/content"},
+            }
+            for name, content in files.items()
+        ]
+        with self._lock:
+            self._records[recid] = data
+            for name, content in files.items():
+                self._files[(recid, name)] = content
+        return data
+
+    def inject_error(self, path_pattern: str, status: int = 503, count: int = 1):
+        """
+        Answer the next `count` requests whose path matches `path_pattern` (a
+        regular expression searched in the path) with an HTTP error `status`.
+        """
+        with self._lock:
+            self._errors.append([re.compile(path_pattern), status, count])
+
+    def _injected_status(self, path: str) -> Optional[int]:
+        with self._lock:
+            for error in self._errors:
+                pattern, status, remaining = error
+                if remaining > 0 and pattern.search(path):
+                    error[2] -= 1
+                    return status
+            if self.error_rate and self._random.random() < self.error_rate:
+                return 503
+        return None
+
+    def _record(self, recid: str) -> Optional[Dict[str, Any]]:
+        if recid in self._records:
+            return self._records[recid]
+        versions = self._versions(recid)
+        return versions[0] if versions else None
+
+    def _versions(self, concept_id: str) -> List[Dict[str, Any]]:
+        versions = [
+            record
+            for record in self._records.values()
+            if str(record.get("conceptrecid")) == concept_id
+        ]
+        return sorted(versions, key=lambda r: r.get("created") or "", reverse=True)
+
+    def _search(self, params: Dict[str, str]) -> Dict[str, Any]:
+        q = params.get("q", "")
+        phrases = [phrase.lower() for phrase in re.findall(r'"([^"]*)"', q)]
+        ranges = re.findall(r"(\w+):\[(\S+) TO (\S+)\]", q)
+
+        def matches(record: Dict[str, Any]) -> bool:
+            title = (record.get("metadata", {}).get("title") or "").lower()
+            if not all(phrase in title for phrase in phrases):
+                return False
+            for field, start, end in ranges:
+                value = record.get(field) or ""
+                if (start != "*" and value < start) or (end != "*" and value > end):
+                    return False
+            return True
+
+        with self._lock:
+            hits = [record for record in self._records.values() if matches(record)]
+        hits.sort(key=lambda r: r.get("updated") or "", reverse=True)
+        size = int(params.get("size") or 10)
+        page = int(params.get("page") or 1)
+        body = {
+            "hits": {
+                "hits": hits[(page - 1) * size : page * size],
+                "total": len(hits),
+            },
+            "links": {},
+        }
+        if page * size < len(hits):
+            next_params = {**params, "page": str(page + 1)}
+            body["links"]["next"] = f"{self.base_url}/records?{urlencode(next_params)}"
+        return body
+
+    def _route(self, path: str, query: str) -> Tuple[int, Optional[bytes], str]:
+        """Return the status, body and content type of a GET request."""
+        parts = [unquote(part) for part in path.split("/") if part]
+        if parts[:2] != ["api", "records"]:
+            return 404, None, ""
+        if len(parts) == 2:
+            params = {key: values[-1] for key, values in parse_qs(query).items()}
+            return 200, json.dumps(self._search(params)).encode(), "application/json"
+
+        with self._lock:
+            if len(parts) == 3:
+                record = self._record(parts[2])
+                if record is not None:
+                    return 200, json.dumps(record).encode(), "application/json"
+            elif len(parts) == 4 and parts[3] == "versions":
+                record = self._record(parts[2])
+                if record is not None:
+                    concept_id = str(record.get("conceptrecid", record["id"]))
+                    versions = self._versions(concept_id) or [record]
+                    body = {"hits": {"hits": versions, "total": len(versions)}}
+                    return 200, json.dumps(body).encode(), "application/json"
+            elif len(parts) == 6 and parts[3] == "files" and parts[5] == "content":
+                content = self._files.get((parts[2], parts[4]))
+                if content is not None:
+                    return 200, content, "application/octet-stream"
+        return 404, None, ""
+
+
+class _StubRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.stub._lock:
+            self.server.stub.connections += 1
+
+    def do_GET(self):
+        stub: ZenodoStubServer = self.server.stub
+        if stub.latency:
+            time.sleep(stub.latency)
+        url = urlsplit(self.path)
+        status = stub._injected_status(url.path)
+        if status is not None:
+            body, content_type = None, ""
+        else:
+            status, body, content_type = stub._route(url.path, url.query)
+
+        if body is None:
+            message = "Injected error" if status != 404 else "Not found"
+            body = json.dumps({"status": status, "message": message}).encode()
+            content_type = "application/json"
+            etag = None
+        else:
+            etag = f'"{hashlib.md5(body).hexdigest()}"'
+            if self.headers.get("If-None-Match") == etag:
+                status, body = 304, b""
+
+        with stub._lock:
+            stub.requests.append((self.path, status))
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+        if status != 304:
+            self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self._write_throttled(body, stub.bandwidth)
+
+    def _write_throttled(self, body: bytes, bandwidth: Optional[int]):
+        for start in range(0, len(body), _CHUNK_SIZE):
+            chunk = body[start : start + _CHUNK_SIZE]
+            self.wfile.write(chunk)
+            if bandwidth:
+                time.sleep(len(chunk) / bandwidth)
+
+    def log_message(self, format, *args):
+        pass